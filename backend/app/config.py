@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, List, Optional
 
 class Settings(BaseSettings):
     # App settings
@@ -16,14 +16,77 @@ class Settings(BaseSettings):
 
     # AI API - Gemini
     gemini_api_key: Optional[str] = None
+    gemini_model: str = "gemini-2.5-flash"
+    ai_max_concurrency: int = 4  # Gemini 동시 요청 수
+    ai_max_retries: int = 3  # rate limit(429) / 일시적 오류 재시도 횟수
+    ai_retry_base_seconds: float = 2.0  # 재시도 대기 시간 (시도마다 2배)
+    ai_packed_summaries: bool = True  # 일괄 요약 시 여러 기사를 한 프롬프트로 묶어 요청
+    ai_pack_max_articles: int = 10  # 한 프롬프트에 묶을 최대 기사 수
+    ai_pack_token_budget: int = 4000  # 한 프롬프트에 묶을 기사 본문 토큰 수 (추정치) 한도
+    ai_cache_size: int = 2000  # 요약 / 분석 결과 메모리 캐시 크기 (DB ai_cache 테이블 앞단)
+    # 고영향 뉴스 AI 상세 분석 사전 생성 (워커)
+    ai_precompute_enabled: bool = True
+    ai_precompute_min_impact: int = 4  # 이 영향도 이상인 새 뉴스만 미리 분석
+    ai_precompute_concurrency: int = 2  # 동시에 분석할 뉴스 수
+    ai_precompute_queue_size: int = 1000  # 대기 큐 최대 크기 (넘으면 우선순위 낮은 뉴스부터 버림)
 
     # External APIs
     sec_edgar_user_agent: str = "your-email@example.com"
+    sec_watch_enabled: bool = True  # 워커에서 EDGAR 최신 공시 감시
+    sec_poll_interval_seconds: float = 60  # 최신 공시 피드 조회 주기
 
     # Notifications
     telegram_bot_token: Optional[str] = None
     sendgrid_api_key: Optional[str] = None
 
+    # 스크래핑 워커 (기본은 별도 프로세스: python -m app.worker)
+    embedded_worker: bool = False  # True면 API 프로세스 안에서 스크래핑도 실행 (로컬 개발용)
+    news_relay_interval_seconds: float = 5.0  # 워커 분리 시 API가 새 뉴스를 확인하는 주기
+
+    # 로컬 캐시 디렉토리 (피드 캐시 등)
+    cache_dir: str = ".cache"
+    article_cache_max_mb: int = 500  # 기사 HTML/본문 디스크 캐시 최대 크기
+
+    # News scraping (동시 실행 제한)
+    scrape_max_concurrency: int = 8  # 동시에 처리할 종목 수
+    scrape_yahoo_concurrency: int = 4  # Yahoo Finance 동시 요청 수
+    scrape_google_concurrency: int = 4  # Google News 동시 요청 수
+    # 종목별 수집 주기 (기사 유입 속도 / 관심종목 수 / 장 운영 시간에 따라 조정)
+    scrape_base_interval_minutes: float = 60
+    scrape_min_interval_minutes: float = 5
+    scrape_max_interval_minutes: float = 240
+    scrape_off_hours_multiplier: float = 3.0  # 장외 시간 주기 배수
+    scrape_budget_per_window: int = 100  # 구간당 최대 종목 수집 횟수
+    scrape_budget_window_minutes: float = 10
+    seen_url_cache_size: int = 50000  # 중복 확인용 메모리 URL 캐시 크기
+    near_duplicate_index_size: int = 20000  # 유사 기사 탐지 인덱스 크기
+    near_duplicate_threshold: float = 0.6  # 유사 기사로 판단할 본문 자카드 유사도
+    near_duplicate_title_threshold: float = 0.8  # 다운로드 전 제목(단어 2개 shingle)만으로 판단할 때의 기준
+    near_duplicate_window_hours: float = 48  # 게시 시각이 이 안에 있는 기사끼리만 비교
+    article_parse_workers: Optional[int] = None  # 기사 파싱 프로세스 수 (None이면 CPU 코어 수)
+    html_parser_backend: Optional[str] = None  # selectolax / lxml / bs4 (None이면 설치된 가장 빠른 백엔드)
+    # 뉴스 수집 파이프라인 (discover → dedup → fetch → extract → score → persist → notify)
+    pipeline_queue_size: int = 100  # 단계별 입력 큐 크기 (가득 차면 앞 단계가 대기)
+    pipeline_fetch_concurrency: int = 16  # 기사 HTML 동시 다운로드 수
+    pipeline_persist_batch_size: int = 50  # 한 번에 upsert할 최대 뉴스 수
+    ingest_cursor_lookback_hours: float = 6  # 커서보다 이만큼 이전에 게시된 기사도 다시 확인 (늦게 올라오는 기사)
+
+    # 영향도 키워드 단계 (None이면 impact_scorer.DEFAULT_KEYWORD_TIERS 사용)
+    # 예: [{"score": 5, "fields": "title_lead", "keywords": ["fed", ...]}, ...]
+    impact_keyword_tiers: Optional[List[dict]] = None
+
+    # 호스트별 rate limit (초당 요청 수 / 버스트), 키는 도메인 마지막 두 부분
+    rate_limit_default_rate: float = 2.0
+    rate_limit_default_burst: int = 5
+    rate_limits: Dict[str, Dict[str, float]] = {
+        "yahoo.com": {"rate": 5.0, "burst": 20},
+        "google.com": {"rate": 2.0, "burst": 10},
+        "sec.gov": {"rate": 8.0, "burst": 10},  # SEC 정책: 초당 최대 10건
+    }
+
+    # WebSocket
+    ws_snapshot_max_age_seconds: float = 15  # 이보다 오래된 스냅샷은 새 연결에 보내지 않고 다시 조회
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -1,6 +1,7 @@
 from supabase import create_client, Client
 from app.config import settings
 from typing import Optional, List
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -96,6 +97,22 @@ async def create_news(news_data: dict) -> dict:
     response = db.client.table("news").insert(news_data).execute()
     return response.data[0] if response.data else None
 
+async def upsert_news_batch(news_rows: List[dict]) -> List[dict]:
+    """
+    뉴스 여러 개를 한 번에 저장 (url 기준 upsert, 이미 있는 url은 무시)
+
+    Returns:
+        list: 실제로 새로 추가된 row 목록
+    """
+    if not news_rows:
+        return []
+    response = await asyncio.to_thread(
+        lambda: db.client.table("news")
+        .upsert(news_rows, on_conflict="url", ignore_duplicates=True)
+        .execute()
+    )
+    return response.data if response.data else []
+
 async def get_news_list(limit: int = 20, offset: int = 0, min_score: int = None) -> List[dict]:
     try:
         query = db.client.table("news").select("*, stocks(*)")
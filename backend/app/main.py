@@ -1,8 +1,10 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import auth, users, news, alerts, market, market_ws, stocks
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from app.services.news_scraper import fetch_all_news
+from app.routers import auth, users, news, alerts, market, market_ws, news_ws, stocks
+from app.config import settings
+from app.services.news_events import NewsRelay
+from app.services.http_client import open_http_clients, close_http_clients
+from app import worker
 import asyncio
 import logging
 
@@ -10,9 +12,6 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# 스케줄러 초기화
-scheduler = AsyncIOScheduler()
-
 app = FastAPI(
     title="Stock News Alert API",
     description="US Stock Market News Aggregator & Alert System",
@@ -33,6 +32,7 @@ app.include_router(news.router, prefix="/api/news", tags=["News"])
 app.include_router(alerts.router, prefix="/api/alerts", tags=["Alerts"])
 app.include_router(market.router, prefix="/api/market", tags=["Market Data"])
 app.include_router(market_ws.router, tags=["Market WebSocket"])
+app.include_router(news_ws.router, tags=["News WebSocket"])
 app.include_router(stocks.router, prefix="/api", tags=["Stock Data"])
 
 @app.get("/")
@@ -48,29 +48,23 @@ async def startup():
     print("🚀 Stock News Alert API started")
     print("📚 API Docs: http://localhost:8000/docs")
     print("🔌 WebSocket: ws://localhost:8000/ws/market")
+    print("🔌 WebSocket: ws://localhost:8000/ws/news")
+
+    open_http_clients()
 
     # 백그라운드 태스크: 시장 데이터 브로드캐스트
     asyncio.create_task(market_ws.broadcast_market_updates())
 
-    # 뉴스 스크래핑 스케줄러 시작
-    # 매 시간 정각에 실행 (예: 1:00, 2:00, 3:00...)
-    scheduler.add_job(
-        fetch_all_news,
-        'cron',
-        minute=0,  # 매 시간 0분에 실행
-        id='news_scraper',
-        name='Hourly News Scraper',
-        replace_existing=True
-    )
-
-    # 앱 시작 시 바로 한 번 실행
-    logger.info("🔄 Running initial news fetch...")
-    asyncio.create_task(fetch_all_news())
-
-    scheduler.start()
-    logger.info("⏰ News scraper scheduler started (runs every hour at :00)")
+    if settings.embedded_worker:
+        # 로컬 개발용: 스크래핑 워커를 API 프로세스 안에서 실행
+        await worker.start_worker()
+    else:
+        # 스크래핑은 별도 워커(python -m app.worker)가 담당 - 새 뉴스만 DB에서 읽어 WebSocket으로 전달
+        asyncio.create_task(NewsRelay(settings.news_relay_interval_seconds).run())
 
 @app.on_event("shutdown")
 async def shutdown():
     logger.info("👋 Shutting down...")
-    scheduler.shutdown()
+    if settings.embedded_worker:
+        await worker.stop_worker()
+    await close_http_clients()
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Set, Any, Dict
+from typing import Set, Any, Optional
 import asyncio
 import json
 import math
+import time
+from app.config import settings
 from app.services.market_data import get_market_overview, get_trending_stocks
 
 router = APIRouter()
@@ -24,8 +26,14 @@ def clean_nan_values(obj: Any) -> Any:
 
 # 연결된 WebSocket 클라이언트 관리
 class ConnectionManager:
-    def __init__(self):
+    def __init__(self, snapshot_max_age: float = 15):
         self.active_connections: Set[WebSocket] = set()
+        # 브로드캐스트 시퀀스 번호 및 마지막 스냅샷
+        # (모든 메시지가 전체 시장 데이터이므로 재연결 시에는 최신 스냅샷 하나만 보내면 됨)
+        self.seq = 0
+        self.snapshot: Optional[dict] = None
+        self.snapshot_at = 0.0  # time.monotonic()
+        self.snapshot_max_age = snapshot_max_age
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
@@ -36,8 +44,27 @@ class ConnectionManager:
         self.active_connections.discard(websocket)
         print(f"❌ WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
+    def record_snapshot(self, message: dict) -> dict:
+        """시퀀스 번호를 부여하고 최신 스냅샷으로 저장"""
+        self.seq += 1
+        self.snapshot = {**message, "seq": self.seq}
+        self.snapshot_at = time.monotonic()
+        return self.snapshot
+
+    def fresh_snapshot(self) -> Optional[dict]:
+        """
+        최신 스냅샷 (없거나 snapshot_max_age보다 오래되면 None)
+
+        연결된 클라이언트가 없으면 브로드캐스트도 멈추므로, 한동안 접속이 없었다면 오래된 스냅샷일 수 있음
+        """
+        if self.snapshot is None or time.monotonic() - self.snapshot_at > self.snapshot_max_age:
+            return None
+        return self.snapshot
+
     async def broadcast(self, message: dict):
-        """모든 연결된 클라이언트에게 메시지 전송"""
+        """모든 연결된 클라이언트에게 메시지 전송 (시퀀스 번호 부여 후 최신 스냅샷으로 저장)"""
+        message = self.record_snapshot(message)
+
         disconnected = set()
         for connection in self.active_connections:
             try:
@@ -50,7 +77,19 @@ class ConnectionManager:
         for conn in disconnected:
             self.disconnect(conn)
 
-manager = ConnectionManager()
+manager = ConnectionManager(settings.ws_snapshot_max_age_seconds)
+
+
+async def fetch_market_snapshot() -> dict:
+    overview = await get_market_overview()
+    trending = await get_trending_stocks()
+    return clean_nan_values({
+        "type": "update",
+        "data": {
+            "overview": overview,
+            "trending": trending
+        }
+    })
 
 
 @router.websocket("/ws/market")
@@ -59,25 +98,28 @@ async def market_websocket(websocket: WebSocket):
     실시간 시장 데이터 WebSocket 엔드포인트
 
     클라이언트가 연결하면 5초마다 최신 시장 데이터를 전송합니다.
+    모든 메시지에는 시퀀스 번호(seq)가 포함되며, 재연결 시 `?last_seq=N`을 보내면
+    그 사이 업데이트가 없었을 때는 아무것도 보내지 않고, 있었으면 최신 스냅샷 하나만 전송합니다.
+    저장된 스냅샷이 오래되었으면 새로 조회해서 전송합니다.
     """
     await manager.connect(websocket)
 
     try:
-        # 초기 데이터 즉시 전송
+        last_seq = None
         try:
-            overview = await get_market_overview()
-            trending = await get_trending_stocks()
-
-            cleaned_data = clean_nan_values({
-                "type": "initial",
-                "data": {
-                    "overview": overview,
-                    "trending": trending
-                }
-            })
-            await websocket.send_json(cleaned_data)
-        except Exception as e:
-            print(f"Error sending initial data: {e}")
+            last_seq = int(websocket.query_params["last_seq"])
+        except (KeyError, ValueError):
+            pass
+
+        snapshot = manager.fresh_snapshot()
+        if last_seq is None or last_seq != manager.seq or snapshot is None:
+            # 초기 데이터 즉시 전송 (최근 스냅샷이 충분히 새로우면 재사용)
+            try:
+                if snapshot is None:
+                    snapshot = manager.record_snapshot(await fetch_market_snapshot())
+                await websocket.send_json({**snapshot, "type": "initial"})
+            except Exception as e:
+                print(f"Error sending initial data: {e}")
 
         # 클라이언트로부터의 메시지 대기 (연결 유지)
         while True:
@@ -107,19 +149,8 @@ async def broadcast_market_updates():
             await asyncio.sleep(5)  # 5초마다 업데이트
 
             if len(manager.active_connections) > 0:
-                # 최신 데이터 가져오기
-                overview = await get_market_overview()
-                trending = await get_trending_stocks()
-
-                # 모든 클라이언트에게 브로드캐스트
-                cleaned_data = clean_nan_values({
-                    "type": "update",
-                    "data": {
-                        "overview": overview,
-                        "trending": trending
-                    }
-                })
-                await manager.broadcast(cleaned_data)
+                # 최신 데이터를 가져와 모든 클라이언트에게 브로드캐스트
+                await manager.broadcast(await fetch_market_snapshot())
                 print(f"📊 Broadcast market update to {len(manager.active_connections)} clients")
 
         except Exception as e:
@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException, Query
 from app.models import NewsResponse, NewsWithStock, NewsAnalysis
 from app.database import get_news_list, get_news_by_id, get_news_by_ticker
 from app.services.ai_summarizer import analyze_news_detailed
+from app.services.analysis_precompute import save_analysis
 from typing import List, Optional
 
 router = APIRouter()
@@ -28,21 +29,31 @@ async def get_single_news(news_id: str):
 async def get_news_analysis(news_id: str):
     """
     뉴스에 대한 AI 기반 상세 분석 제공
+
+    워커가 미리 생성해 저장한 분석이 있으면 바로 반환하고, 없으면 생성 후 저장
     """
     news = await get_news_by_id(news_id)
     if not news:
         raise HTTPException(status_code=404, detail="News not found")
 
-    # AI 분석 수행
-    ticker = news.get('stock', {}).get('ticker') if news.get('stock') else None
-    analysis = await analyze_news_detailed(
-        title=news.get('title', ''),
-        content=news.get('content', ''),
-        ticker=ticker
-    )
-
+    analysis = news.get('analysis')
     if not analysis:
-        raise HTTPException(status_code=500, detail="Failed to analyze news")
+        # AI 분석 수행 (사전 생성되지 않은 뉴스)
+        stock = news.get('stocks') or news.get('stock')
+        ticker = stock.get('ticker') if stock else None
+        analysis = await analyze_news_detailed(
+            title=news.get('title', ''),
+            content=news.get('content', '') or '',
+            ticker=ticker
+        )
+
+        if not analysis:
+            raise HTTPException(status_code=500, detail="Failed to analyze news")
+
+        try:
+            await save_analysis(news_id, analysis)
+        except Exception as e:
+            print(f"Error saving news analysis {news_id}: {e}")
 
     return {
         "news_id": news_id,
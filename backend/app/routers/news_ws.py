@@ -0,0 +1,51 @@
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+import asyncio
+from app.routers.market_ws import clean_nan_values
+from app.services.news_events import news_events, matches_subscription
+
+router = APIRouter()
+
+
+@router.websocket("/ws/news")
+async def news_websocket(websocket: WebSocket):
+    """
+    실시간 뉴스 푸시 WebSocket 엔드포인트
+
+    스크래퍼가 새 뉴스를 저장하면 즉시 전송합니다.
+
+    - **tickers**: 구독할 티커 (쉼표 구분, 예: ?tickers=NVDA,TSLA)
+    - **min_score**: 영향도 임계값 (1-5), 이 점수 이상의 뉴스는 티커와 무관하게 전송
+
+    조건을 지정하지 않으면 모든 새 뉴스를 전송합니다.
+    """
+    await websocket.accept()
+
+    tickers_param = websocket.query_params.get("tickers", "")
+    tickers = {t.strip().upper() for t in tickers_param.split(",") if t.strip()}
+    min_score = None
+    try:
+        min_score = int(websocket.query_params["min_score"])
+    except (KeyError, ValueError):
+        pass
+
+    queue = news_events.subscribe()
+
+    async def push_events():
+        while True:
+            event = await queue.get()
+            if matches_subscription(event, tickers, min_score):
+                await websocket.send_json(clean_nan_values(event))
+
+    sender = asyncio.create_task(push_events())
+
+    try:
+        # 클라이언트로부터의 메시지 대기 (연결 유지)
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        print("News client disconnected")
+    except Exception as e:
+        print(f"News WebSocket error: {e}")
+    finally:
+        sender.cancel()
+        news_events.unsubscribe(queue)
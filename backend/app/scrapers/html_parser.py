@@ -0,0 +1,219 @@
+"""
+HTML 파서 백엔드
+스크래퍼가 BeautifulSoup(html.parser, 순수 Python) 대신 C 기반 파서를 쓸 수 있도록 추상화
+
+- selectolax(lexbor) > lxml > BeautifulSoup 순으로 설치된 가장 빠른 백엔드 사용
+  (settings.html_parser_backend로 고정 가능)
+- 백엔드는 문서 파싱 / 클래스로 div 찾기 / 태그 목록 / 텍스트 추출만 구현하고,
+  추출 규칙(article_text, document_text)은 공통으로 사용
+  (단, 잘못된 HTML(닫히지 않은 p 등)을 복구하는 방식이 파서마다 달라 결과가 다를 수 있음)
+- 결과와 속도 비교: python benchmark_html_parsers.py
+"""
+from typing import Dict, List, Optional
+from app.config import settings
+import importlib.util
+
+# 빠른 순서
+BACKEND_ORDER = ["selectolax", "lxml", "bs4"]
+BACKEND_MODULES = {"selectolax": "selectolax", "lxml": "lxml", "bs4": "bs4"}
+
+# Yahoo Finance 기사 본문 컨테이너 (앞에서부터 시도)
+ARTICLE_BODY_CLASSES = ["caas-body", "article-content", "body-content"]
+# 본문 컨테이너가 없을 때 전체 p 태그 중 이 길이보다 긴 문단만 사용
+MIN_PARAGRAPH_CHARS = 50
+
+# 파싱 직후 하위 요소까지 통째로 제거할 태그 (모든 백엔드 공통, 뒤에 오는 텍스트는 유지)
+SKIP_TEXT_TAGS = {"script", "style", "template"}
+
+
+def backend_available(name: str) -> bool:
+    return name in BACKEND_MODULES and importlib.util.find_spec(BACKEND_MODULES[name]) is not None
+
+
+class HtmlBackend:
+    """파서 백엔드 공통 인터페이스 + 추출 규칙"""
+
+    name = ""
+
+    def parse(self, html: str):
+        raise NotImplementedError
+
+    def find_div(self, node, class_name: str):
+        """class_name 클래스를 가진 첫 번째 div (없으면 None)"""
+        raise NotImplementedError
+
+    def find_all(self, node, tag: str) -> list:
+        raise NotImplementedError
+
+    def text(self, node, separator: str = "") -> str:
+        """하위 텍스트 조각을 각각 strip한 뒤 separator로 연결 (빈 조각 제외)"""
+        raise NotImplementedError
+
+    def article_text(self, html: str) -> str:
+        """
+        기사 페이지에서 본문 추출
+
+        1. 알려진 본문 컨테이너(div)의 p 태그 (p가 없으면 컨테이너 전체 텍스트)
+        2. 컨테이너가 없으면 문서 전체에서 충분히 긴 p 태그만
+        """
+        if not html or not html.strip():
+            return ""
+        doc = self.parse(html)
+
+        body = None
+        for class_name in ARTICLE_BODY_CLASSES:
+            body = self.find_div(doc, class_name)
+            if body is not None:
+                break
+
+        if body is None:
+            texts = [self.text(p) for p in self.find_all(doc, "p")]
+            return "\n\n".join(text for text in texts if len(text) > MIN_PARAGRAPH_CHARS)
+
+        content = "\n\n".join(self.text(p) for p in self.find_all(body, "p"))
+        return content if content else self.text(body)
+
+    def document_text(self, html: str) -> str:
+        """문서 전체의 보이는 텍스트 (조각마다 한 줄)"""
+        if not html or not html.strip():
+            return ""
+        return self.text(self.parse(html), "\n")
+
+
+class SoupBackend(HtmlBackend):
+    """BeautifulSoup + html.parser (추가 설치 없이 동작하는 기본값)"""
+
+    name = "bs4"
+
+    def __init__(self):
+        from bs4 import BeautifulSoup
+        self.BeautifulSoup = BeautifulSoup
+
+    def parse(self, html: str):
+        soup = self.BeautifulSoup(html, "html.parser")
+        for tag in soup.find_all(list(SKIP_TEXT_TAGS)):
+            tag.decompose()
+        return soup
+
+    def find_div(self, node, class_name: str):
+        return node.find("div", class_=class_name)
+
+    def find_all(self, node, tag: str) -> list:
+        return node.find_all(tag)
+
+    def text(self, node, separator: str = "") -> str:
+        return node.get_text(separator, strip=True)
+
+
+class LxmlBackend(HtmlBackend):
+    """lxml (libxml2)"""
+
+    name = "lxml"
+
+    def __init__(self):
+        import lxml.etree
+        import lxml.html
+        self.etree = lxml.etree
+        self.lxml_html = lxml.html
+        # 인코딩 선언(<?xml ... encoding=...?>)이 있는 문서도 읽을 수 있도록 bytes로 파싱
+        self.parser = lxml.html.HTMLParser(encoding="utf-8")
+
+    def parse(self, html: str):
+        doc = self.lxml_html.document_fromstring(html.encode("utf-8", errors="replace"), parser=self.parser)
+        for element in list(doc.iter(*SKIP_TEXT_TAGS)):
+            parent = element.getparent()
+            if parent is not None:
+                # 빈 주석으로 교체 (drop_tree처럼 tail을 앞 텍스트에 합치지 않고 별도 조각으로 유지)
+                placeholder = self.etree.Comment()
+                placeholder.tail = element.tail
+                parent.replace(element, placeholder)
+        return doc
+
+    def find_div(self, node, class_name: str):
+        matches = node.xpath(
+            "//div[contains(concat(' ', normalize-space(@class), ' '), $name)]",
+            name=f" {class_name} ",
+        )
+        return matches[0] if matches else None
+
+    def find_all(self, node, tag: str) -> list:
+        return list(node.iter(tag))
+
+    def text(self, node, separator: str = "") -> str:
+        # 문서 순서대로 순회 (요소의 tail은 하위 요소 텍스트 뒤에 오도록 스택에 표시를 남김)
+        # 주석 / 처리 명령은 tag가 문자열이 아니므로 내용은 제외하지만, 뒤에 오는 tail 텍스트는 포함
+        parts = []
+        stack = [(node, False)]
+        while stack:
+            element, finished = stack.pop()
+            if finished:
+                if element is not node and element.tail:
+                    parts.append(element.tail)
+                continue
+
+            stack.append((element, True))
+            if isinstance(element.tag, str):
+                if element.text:
+                    parts.append(element.text)
+                stack.extend((child, False) for child in reversed(element))
+        return separator.join(part.strip() for part in parts if part.strip())
+
+
+class SelectolaxBackend(HtmlBackend):
+    """selectolax (lexbor)"""
+
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+        self.LexborHTMLParser = LexborHTMLParser
+
+    def parse(self, html: str):
+        tree = self.LexborHTMLParser(html)
+        tree.strip_tags(list(SKIP_TEXT_TAGS))
+        return tree
+
+    def find_div(self, node, class_name: str):
+        return node.css_first(f"div.{class_name}")
+
+    def find_all(self, node, tag: str) -> list:
+        return node.css(tag)
+
+    def text(self, node, separator: str = "") -> str:
+        if hasattr(node, "root"):  # 문서 전체
+            node = node.root
+            if node is None:
+                return ""
+        parts = (part.strip() for part in node.text(deep=True, separator="\0").split("\0"))
+        return separator.join(part for part in parts if part)
+
+
+BACKEND_CLASSES = {"selectolax": SelectolaxBackend, "lxml": LxmlBackend, "bs4": SoupBackend}
+
+_backends: Dict[str, HtmlBackend] = {}
+
+
+def available_backends() -> List[str]:
+    return [name for name in BACKEND_ORDER if backend_available(name)]
+
+
+def get_html_backend(name: Optional[str] = None) -> HtmlBackend:
+    """
+    HTML 파서 백엔드 반환 (최초 호출 시 생성)
+
+    Args:
+        name: "selectolax" / "lxml" / "bs4" (없으면 설정값, 설정도 없으면 설치된 가장 빠른 백엔드)
+    """
+    name = name or settings.html_parser_backend
+    if name is None:
+        available = available_backends()
+        if not available:
+            raise RuntimeError("No HTML parser backend installed (selectolax, lxml or beautifulsoup4)")
+        name = available[0]
+    elif name not in BACKEND_CLASSES:
+        raise ValueError(f"Unknown HTML parser backend: {name}")
+
+    backend = _backends.get(name)
+    if backend is None:
+        backend = _backends[name] = BACKEND_CLASSES[name]()
+    return backend
@@ -1,64 +1,247 @@
-import httpx
-from bs4 import BeautifulSoup
-from typing import List, Dict
-from datetime import datetime
+"""
+SEC EDGAR 공시 클라이언트
+- 티커 → CIK 매핑(company_tickers.json)을 로컬 파일에 캐싱 (하루 한 번 갱신)
+- 회사별 submissions JSON을 한 번만 받아 8-K / 10-Q / 10-K 필터를 모두 처리
+- 전체 최신 공시 피드(getcurrent Atom)를 조회해 추적 중인 회사의 공시만 골라냄
+- 요청은 SEC 정책(초당 10건)에 맞춘 sec.gov rate limit과 공유 SEC 클라이언트를 거침
+"""
+from typing import Dict, List, Optional
 from app.config import settings
+from app.services.feed_cache import fetch_feed
+from app.services.http_client import get_http_client
+from app.services.rate_limiter import rate_limiter
+import asyncio
+import html
+import json
+import os
+import re
+import time
+
+COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK{cik:010d}.json"
+ARCHIVES_URL = "https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/{document}"
+LATEST_FILINGS_URL = (
+    "https://www.sec.gov/cgi-bin/browse-edgar?action=getcurrent&type={form}&company=&dateb="
+    "&owner=include&start={start}&count={count}&output=atom"
+)
+
+# 최신 공시 피드 항목 파싱
+ACCESSION_RE = re.compile(r"accession-number=(\d{10}-\d{2}-\d{6})")
+CIK_RE = re.compile(r"\((\d{10})\)")
+TAG_RE = re.compile(r"<[^>]+>")
+
+# 티커 → CIK 매핑 갱신 주기 (초)
+TICKER_MAP_MAX_AGE = 24 * 3600
+
+# 회사별 submissions 응답 재사용 시간 (초) - 여러 공시 유형 조회가 한 번의 요청을 공유
+SUBMISSIONS_TTL = 300
+
+
+async def sec_get_json(url: str) -> dict:
+    """SEC rate limit을 지켜 JSON 조회"""
+    await rate_limiter.acquire(url)
+    response = await get_http_client(url).get(url)
+    rate_limiter.record_response(url, response)
+    response.raise_for_status()
+    return response.json()
+
+
+class EdgarClient:
+    """티커 → CIK 매핑과 회사별 submissions 캐시"""
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        self.ciks: Dict[str, int] = {}
+        self.ciks_loaded_at = 0.0
+        self.submissions: Dict[int, tuple] = {}  # CIK → (조회 시각, submissions JSON)
+        self.in_flight: Dict[int, asyncio.Task] = {}
+        self.lock = asyncio.Lock()
+
+    def _load_cached_map(self) -> Optional[dict]:
+        try:
+            if time.time() - os.path.getmtime(self.cache_path) > TICKER_MAP_MAX_AGE:
+                return None
+            with open(self.cache_path, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _save_cached_map(self, data: dict):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            print(f"Error saving SEC ticker map: {e}")
+
+    async def load_ticker_map(self):
+        """티커 → CIK 매핑 로드 (로컬 캐시가 오래되었으면 SEC에서 다시 받음)"""
+        async with self.lock:
+            if self.ciks and time.time() - self.ciks_loaded_at < TICKER_MAP_MAX_AGE:
+                return
+
+            data = await asyncio.to_thread(self._load_cached_map)
+            if data is None:
+                data = await sec_get_json(COMPANY_TICKERS_URL)
+                await asyncio.to_thread(self._save_cached_map, data)
+
+            # {"0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."}, ...}
+            self.ciks = {row["ticker"].upper(): int(row["cik_str"]) for row in data.values()}
+            self.ciks_loaded_at = time.time()
+
+    async def get_cik(self, ticker: str) -> Optional[int]:
+        await self.load_ticker_map()
+        return self.ciks.get(ticker.upper())
+
+    async def get_submissions(self, cik: int) -> dict:
+        """
+        회사 submissions JSON (TTL 동안 재사용, 동시에 들어온 요청은 한 번의 조회를 공유)
+        """
+        cached = self.submissions.get(cik)
+        if cached and time.time() - cached[0] < SUBMISSIONS_TTL:
+            return cached[1]
+
+        task = self.in_flight.get(cik)
+        if task is None:
+            task = asyncio.create_task(sec_get_json(SUBMISSIONS_URL.format(cik=cik)))
+            self.in_flight[cik] = task
+            task.add_done_callback(lambda _: self.in_flight.pop(cik, None))
+
+        data = await task
+        self.submissions[cik] = (time.time(), data)
+        return data
+
+    async def get_filings(self, ticker: str, forms: List[str], count: int = 10) -> List[Dict]:
+        """
+        최근 공시 중 지정한 유형만 반환
+
+        Args:
+            ticker: 주식 티커
+            forms: 공시 유형 목록 (예: ["8-K"], ["10-Q", "10-K"])
+            count: 유형별 최대 개수
+
+        Returns:
+            List[Dict]: 공시 목록 (최신순)
+        """
+        cik = await self.get_cik(ticker)
+        if cik is None:
+            print(f"No SEC CIK found for {ticker}")
+            return []
+
+        submissions = await self.get_submissions(cik)
+        return filings_from_submissions(ticker, cik, submissions, forms, count)
+
+
+def filing_url(cik: int, accession_number: str, primary_document: str) -> str:
+    return ARCHIVES_URL.format(cik=cik, accession=accession_number.replace("-", ""), document=primary_document)
+
+
+def filings_from_submissions(ticker: str, cik: int, submissions: dict, forms: List[str], count: int) -> List[Dict]:
+    """submissions JSON의 최근 공시(열 단위 배열)에서 지정한 유형만 골라 공시 dict로 변환"""
+    recent = submissions.get("filings", {}).get("recent", {})
+    form_list = recent.get("form", [])
+    counts = {form: 0 for form in forms}
+    filings = []
+
+    for i, form in enumerate(form_list):
+        if form not in counts or counts[form] >= count:
+            continue
+        counts[form] += 1
+
+        def column(name: str, default=""):
+            values = recent.get(name, [])
+            return values[i] if i < len(values) else default
+
+        description = column("primaryDocDescription") or form
+        items = column("items")
+        filings.append({
+            "source": "sec",
+            "title": f"{ticker} files {form}",
+            "content": f"{description} (Items: {items})" if items else description,
+            "url": filing_url(cik, column("accessionNumber"), column("primaryDocument")),
+            "published_at": column("acceptanceDateTime") or column("filingDate") or None,
+            "form": form,
+            "accession_number": column("accessionNumber"),
+        })
+
+        if all(n >= count for n in counts.values()):
+            break
+
+    return filings
+
+
+def parse_latest_filing_entry(entry) -> Optional[Dict]:
+    """
+    최신 공시 피드 항목 → 공시 dict
+
+    예: title "8-K - Apple Inc. (0000320193) (Filer)",
+        id "urn:tag:sec.gov,2008:accession-number=0000320193-24-000123"
+    """
+    title = entry.get('title', '')
+    accession = ACCESSION_RE.search(entry.get('id', ''))
+    cik = CIK_RE.search(title)
+    if not accession or not cik:
+        return None
+
+    form, _, rest = title.partition(" - ")
+    company = CIK_RE.split(rest)[0].strip()
+    summary = html.unescape(TAG_RE.sub(" ", entry.get('summary', '')))
+
+    return {
+        "cik": int(cik.group(1)),
+        "form": form.strip(),
+        "company": company,
+        "accession_number": accession.group(1),
+        "url": entry.get('link', ''),
+        "summary": " ".join(summary.split()),
+        "published_at": entry.get('updated') or entry.get('published'),
+    }
+
+
+def latest_filings_url(form: str, start: int = 0, count: int = 100) -> str:
+    return LATEST_FILINGS_URL.format(form=form, start=start, count=count)
+
+
+async def fetch_latest_filings(form: str, start: int = 0, count: int = 100) -> Optional[List[Dict]]:
+    """
+    EDGAR 전체 최신 공시 피드 한 페이지 조회 (최신순)
+
+    공시를 모두 처리한 뒤 feed_cache.commit([latest_filings_url(...)])을 호출해야
+    다음 조회에서 같은 페이지를 건너뜀
+
+    Args:
+        form: 공시 유형 (예: "8-K")
+        start: 시작 위치 (페이지 이동용)
+        count: 페이지 크기 (최대 100)
+
+    Returns:
+        공시 목록 (피드가 이전 조회 이후 바뀌지 않았으면 None)
+    """
+    feed = await fetch_feed(latest_filings_url(form, start, count))
+    if feed is None:
+        return None
+    return [filing for filing in map(parse_latest_filing_entry, feed.entries) if filing]
+
+
+edgar_client = EdgarClient(os.path.join(settings.cache_dir, "sec", "company_tickers.json"))
+
 
 async def fetch_recent_filings(ticker: str, filing_type: str = "8-K", count: int = 10) -> List[Dict]:
     """
     SEC Edgar에서 최근 공시 가져오기
-    
+
     Args:
         ticker: 주식 티커
         filing_type: 공시 유형 (10-K, 10-Q, 8-K 등)
         count: 가져올 공시 개수
-    
+
     Returns:
         List[Dict]: 공시 목록
     """
-    url = "https://www.sec.gov/cgi-bin/browse-edgar"
-    params = {
-        "action": "getcompany",
-        "CIK": ticker,
-        "type": filing_type,
-        "dateb": "",
-        "owner": "exclude",
-        "count": count
-    }
-    
-    headers = {
-        "User-Agent": settings.sec_edgar_user_agent
-    }
-    
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            filings = []
-            
-            # SEC Edgar HTML 파싱 (실제 구조에 맞게 조정 필요)
-            table = soup.find('table', {'class': 'tableFile2'})
-            if not table:
-                return []
-            
-            rows = table.find_all('tr')[1:]  # 헤더 제외
-            
-            for row in rows[:count]:
-                cols = row.find_all('td')
-                if len(cols) >= 4:
-                    filing_data = {
-                        "source": "sec",
-                        "title": f"{ticker} files {filing_type}",
-                        "content": cols[2].get_text(strip=True) if len(cols) > 2 else "",
-                        "url": f"https://www.sec.gov{cols[1].find('a')['href']}" if cols[1].find('a') else "",
-                        "published_at": cols[3].get_text(strip=True) if len(cols) > 3 else None
-                    }
-                    filings.append(filing_data)
-            
-            return filings
-    
+        return await edgar_client.get_filings(ticker, [filing_type], count)
     except Exception as e:
         print(f"Error fetching SEC filings: {e}")
         return []
@@ -0,0 +1,196 @@
+"""
+대용량 SEC 공시 문서(10-K / 10-Q, HTML / inline XBRL) 스트리밍 파서
+문서 전체를 DOM으로 만들지 않고 청크 단위로 읽으면서 필요한 부분만 추출
+- 섹션: Item 1A (Risk Factors), MD&A (10-K Item 7 / 10-Q Item 2)
+- inline XBRL 숫자 항목 (ix:nonFraction)
+
+메모리 사용량은 문서 크기와 관계없이 추출 결과 크기 제한 + 청크 크기로 제한됨
+파싱은 CPU 작업이므로 프로세스 풀에서 실행 (parse_filing_file은 파일 경로만 받음)
+"""
+from html.parser import HTMLParser
+from typing import Dict, List, Optional
+from app.services.http_client import get_http_client
+from app.services.rate_limiter import rate_limiter
+import asyncio
+import os
+import re
+import tempfile
+
+CHUNK_SIZE = 64 * 1024
+
+# 섹션 제목 패턴 (줄 시작 기준)
+SECTION_PATTERNS = {
+    "risk_factors": re.compile(r"^item\s*1a\W+risk\s+factors", re.IGNORECASE),
+    "mda": re.compile(r"^item\s*[27]\W+management.{0,5}s\s+discussion", re.IGNORECASE),
+}
+# 다른 Item 제목이 나오면 현재 섹션 종료 (본문 문장이 "Item 7 ..."로 시작하는 경우와 구분하기 위해 짧은 줄만)
+ITEM_HEADING_RE = re.compile(r"^item\s*\d{1,2}[a-c]?\b\W", re.IGNORECASE)
+MAX_HEADING_CHARS = 200
+
+# 줄바꿈으로 취급할 블록 태그
+BLOCK_TAGS = {"p", "div", "br", "tr", "li", "h1", "h2", "h3", "h4", "h5", "h6", "table", "section"}
+# 텍스트를 무시할 태그 (ix:header는 숨겨진 XBRL 메타데이터)
+SKIP_TAGS = {"script", "style", "ix:header"}
+
+MAX_LINE_CHARS = 10000
+
+
+class FilingStreamParser(HTMLParser):
+    """청크 단위로 feed()하면서 섹션 텍스트와 XBRL 숫자 항목만 모음"""
+
+    def __init__(self, max_section_chars: int = 200000, max_facts: int = 5000):
+        super().__init__(convert_charrefs=True)
+        self.max_section_chars = max_section_chars
+        self.max_facts = max_facts
+
+        self.sections: Dict[str, str] = {}
+        self.facts: List[dict] = []
+
+        self.line: List[str] = []
+        self.line_chars = 0
+        self.current: Optional[str] = None  # 현재 수집 중인 섹션
+        self.current_parts: List[str] = []
+        self.current_chars = 0
+        self.skip_depth = 0
+        self.fact: Optional[dict] = None  # 현재 읽는 ix:nonFraction
+
+    # --- 태그 처리 ---
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            self._flush_line()
+
+        if tag == "ix:nonfraction" and self.fact is None and len(self.facts) < self.max_facts:
+            attrs = dict(attrs)
+            self.fact = {
+                "name": attrs.get("name"),
+                "context": attrs.get("contextref"),
+                "unit": attrs.get("unitref"),
+                "scale": attrs.get("scale"),
+                "decimals": attrs.get("decimals"),
+                "sign": attrs.get("sign"),
+                "text": [],
+            }
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif tag in BLOCK_TAGS:
+            self._flush_line()
+
+        if tag == "ix:nonfraction" and self.fact is not None:
+            self._finish_fact()
+
+    def handle_data(self, data):
+        if self.fact is not None:
+            self.fact["text"].append(data)
+        if self.skip_depth:
+            return
+        self.line.append(data)
+        self.line_chars += len(data)
+        if self.line_chars > MAX_LINE_CHARS:
+            self._flush_line()
+
+    # --- 섹션 ---
+
+    def _flush_line(self):
+        if not self.line:
+            return
+        text = " ".join("".join(self.line).split())
+        self.line, self.line_chars = [], 0
+        if not text:
+            return
+
+        if len(text) <= MAX_HEADING_CHARS and ITEM_HEADING_RE.match(text):
+            self._end_section()
+            for name, pattern in SECTION_PATTERNS.items():
+                if pattern.match(text):
+                    self.current = name
+                    break
+
+        if self.current and self.current_chars < self.max_section_chars:
+            text = text[:self.max_section_chars - self.current_chars]
+            self.current_parts.append(text)
+            self.current_chars += len(text) + 1
+
+    def _end_section(self):
+        """현재 섹션 저장 (목차의 짧은 제목 줄보다 본문이 길므로 가장 긴 것을 유지)"""
+        if self.current:
+            text = "\n".join(self.current_parts)
+            if len(text) > len(self.sections.get(self.current, "")):
+                self.sections[self.current] = text
+        self.current, self.current_parts, self.current_chars = None, [], 0
+
+    # --- XBRL ---
+
+    def _finish_fact(self):
+        fact, self.fact = self.fact, None
+        raw = "".join(fact.pop("text")).strip()
+        try:
+            value = float(raw.replace(",", "").replace("$", "")) if raw not in ("", "-", "—") else 0.0
+            if fact["scale"]:
+                value *= 10 ** int(fact["scale"])
+            if fact.pop("sign") == "-":
+                value = -value
+        except ValueError:
+            return
+        fact["value"] = value
+        self.facts.append(fact)
+
+    def close(self):
+        super().close()
+        self._flush_line()
+        self._end_section()
+
+
+def parse_filing_file(path: str, max_section_chars: int = 200000, max_facts: int = 5000) -> dict:
+    """
+    저장된 공시 문서를 청크 단위로 읽어 섹션과 XBRL 숫자 항목 추출 (프로세스 풀에서 실행 가능)
+
+    Returns:
+        {"sections": {"risk_factors": str, "mda": str}, "facts": [{"name", "context", "unit", "value", ...}]}
+    """
+    parser = FilingStreamParser(max_section_chars, max_facts)
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            parser.feed(chunk)
+    parser.close()
+    return {"sections": parser.sections, "facts": parser.facts}
+
+
+async def download_filing(url: str, path: str):
+    """공시 문서를 메모리에 올리지 않고 파일로 스트리밍 저장"""
+    await rate_limiter.acquire(url)
+    async with get_http_client(url).stream("GET", url) as response:
+        rate_limiter.record_response(url, response)
+        response.raise_for_status()
+        with open(path, "wb") as f:
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                f.write(chunk)
+
+
+async def extract_filing(url: str, executor=None, max_section_chars: int = 200000) -> dict:
+    """
+    공시 문서 다운로드 후 섹션 / XBRL 항목 추출
+
+    Args:
+        url: 공시 주 문서 URL (sec_edgar의 filing url)
+        executor: 파싱을 실행할 프로세스 풀 (None이면 기본 스레드 풀)
+        max_section_chars: 섹션별 최대 글자 수
+    """
+    fd, path = tempfile.mkstemp(suffix=".htm")
+    os.close(fd)
+    try:
+        await download_filing(url, path)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, parse_filing_file, path, max_section_chars)
+    finally:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -1,8 +1,14 @@
-import httpx
-import feedparser
-from typing import List, Dict
+from typing import AsyncIterator, List, Dict
 from datetime import datetime
-from bs4 import BeautifulSoup
+from app.scrapers.html_parser import get_html_backend
+from app.services.feed_cache import fetch_feed
+from app.services.http_client import get_http_client
+from app.services.rate_limiter import rate_limiter, host_key
+import asyncio
+
+# 기사 전문 동시 크롤링 설정
+ARTICLE_HOST_CONCURRENCY = 4  # 같은 발행처(호스트)에 동시에 보낼 최대 요청 수
+ARTICLE_TIMEOUT_SECONDS = 15.0  # 기사 하나당 최대 대기 시간 (호스트 동시 요청 제한 대기 포함, 초과하면 요약 사용)
 
 async def fetch_article_content(url: str) -> str:
     """
@@ -15,43 +21,89 @@ async def fetch_article_content(url: str) -> str:
         str: 기사 전문
     """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, follow_redirects=True)
-            response.raise_for_status()
+        await rate_limiter.acquire(url)
+        response = await get_http_client(url).get(url)
+        rate_limiter.record_response(url, response)
+        response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+        # Yahoo Finance 기사 본문 추출 (caas-body 등 본문 컨테이너 → 없으면 긴 p 태그만)
+        return get_html_backend().article_text(response.text)
 
-            # Yahoo Finance 기사 본문 추출 (여러 가능한 클래스 시도)
-            article_body = None
+    except Exception as e:
+        print(f"Error fetching article content from {url}: {e}")
+        return ""
 
-            # 방법 1: caas-body 클래스 (일반적인 Yahoo Finance 기사)
-            article_body = soup.find('div', class_='caas-body')
+def feed_entry_to_news(entry, content: str = None) -> Dict:
+    """RSS 항목 → 뉴스 dict (content가 없으면 요약 사용)"""
+    return {
+        "source": "yahoo",
+        "title": entry.get('title', ''),
+        "content": content or entry.get('summary', ''),
+        "url": entry.get('link', ''),
+        "published_at": entry.get('published', None)
+    }
+
+async def iter_news_rss(ticker: str = None, full_content: bool = True) -> AsyncIterator[Dict]:
+    """
+    Yahoo Finance RSS 뉴스를 처리가 끝나는 순서대로 반환
 
-            # 방법 2: article-content 클래스
-            if not article_body:
-                article_body = soup.find('div', class_='article-content')
+    전문 크롤링은 기사별로 동시에 실행하되 호스트별 동시 요청 수를 제한하고,
+    기사마다 타임아웃을 두어 느린 발행처가 있어도 나머지 기사는 먼저 반환됨
+    (전문을 못 가져온 기사는 RSS 요약으로 반환)
 
-            # 방법 3: body-content 클래스
-            if not article_body:
-                article_body = soup.find('div', class_='body-content')
+    Args:
+        ticker: 주식 티커 (None이면 전체 뉴스)
+        full_content: True면 기사 전문 크롤링, False면 요약만
 
-            # 방법 4: 모든 p 태그 수집
-            if not article_body:
-                paragraphs = soup.find_all('p')
-                if paragraphs:
-                    return '\n\n'.join([p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 50])
+    Yields:
+        Dict: 뉴스 (feed_index에 피드 내 순서 포함)
+    """
+    if ticker:
+        url = f"https://finance.yahoo.com/rss/headline?s={ticker}"
+    else:
+        url = "https://finance.yahoo.com/news/rssindex"
 
-            if article_body:
-                # 본문 내 모든 p 태그 추출
-                paragraphs = article_body.find_all('p')
-                content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs])
-                return content if content else article_body.get_text(strip=True)
+    # 호출할 때마다 전체 피드를 반환 (조건부 요청 캐시를 쓰면 반복 호출 시 빈 결과가 되므로 사용하지 않음)
+    feed = await fetch_feed(url, conditional=False)
 
-            return ""
+    entries = feed.entries[:20]  # 최근 20개
 
-    except Exception as e:
-        print(f"Error fetching article content from {url}: {e}")
-        return ""
+    if not full_content:
+        for index, entry in enumerate(entries):
+            yield {**feed_entry_to_news(entry), "feed_index": index}
+        return
+
+    host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async def fetch_limited(article_url: str) -> str:
+        limit = host_limits.setdefault(host_key(article_url), asyncio.Semaphore(ARTICLE_HOST_CONCURRENCY))
+        async with limit:
+            return await fetch_article_content(article_url)
+
+    async def fetch_entry(index: int, entry) -> Dict:
+        article_url = entry.get('link', '')
+        summary = entry.get('summary', '')
+        content = summary
+
+        if article_url:
+            try:
+                # 같은 호스트의 앞선 요청을 기다리는 시간도 타임아웃에 포함
+                full_article = await asyncio.wait_for(fetch_limited(article_url), ARTICLE_TIMEOUT_SECONDS)
+                if full_article and len(full_article) > len(summary):
+                    content = full_article
+            except asyncio.TimeoutError:
+                print(f"Timed out fetching article content from {article_url}")
+
+        return {**feed_entry_to_news(entry, content), "feed_index": index}
+
+    tasks = [asyncio.create_task(fetch_entry(index, entry)) for index, entry in enumerate(entries)]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            yield await finished
+    finally:
+        # 호출자가 중간에 멈추면 남은 요청 취소
+        for task in tasks:
+            task.cancel()
 
 async def fetch_news_rss(ticker: str = None, full_content: bool = True) -> List[Dict]:
     """
@@ -59,45 +111,15 @@ async def fetch_news_rss(ticker: str = None, full_content: bool = True) -> List[
 
     Args:
         ticker: 주식 티커 (None이면 전체 뉴스)
-        full_content: True면 기사 전문 크롤링, False면 요약만
+        full_content: True면 기사 전문 크롤링 (동시 실행), False면 요약만
 
     Returns:
-        List[Dict]: 뉴스 목록
+        List[Dict]: 뉴스 목록 (피드 순서)
     """
-    if ticker:
-        url = f"https://finance.yahoo.com/rss/headline?s={ticker}"
-    else:
-        url = "https://finance.yahoo.com/news/rssindex"
-
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, follow_redirects=True)
-            response.raise_for_status()
-
-            feed = feedparser.parse(response.text)
-            news_list = []
-
-            for entry in feed.entries[:20]:  # 최근 20개
-                article_url = entry.get('link', '')
-                summary = entry.get('summary', '')
-
-                # 기사 전문 크롤링
-                content = summary
-                if full_content and article_url:
-                    full_article = await fetch_article_content(article_url)
-                    if full_article and len(full_article) > len(summary):
-                        content = full_article
-
-                news_data = {
-                    "source": "yahoo",
-                    "title": entry.get('title', ''),
-                    "content": content,
-                    "url": article_url,
-                    "published_at": entry.get('published', None)
-                }
-                news_list.append(news_data)
-
-            return news_list
+        news_list = [news async for news in iter_news_rss(ticker, full_content)]
+        news_list.sort(key=lambda news: news.pop("feed_index"))
+        return news_list
 
     except Exception as e:
         print(f"Error fetching Yahoo Finance news: {e}")
@@ -0,0 +1,106 @@
+"""
+AI 요약 / 상세 분석 결과 캐시 (content-addressed)
+- 키: (종류, 프롬프트 버전, 모델, 종목, 제목, 본문)의 SHA-256
+  → 같은 기사는 조회할 때마다 Gemini를 다시 호출하지 않음
+  → 프롬프트를 바꾸면 PROMPT_VERSIONS만 올리면 되고, 모델을 바꾸면 자동으로 새 키
+- 메모리 LRU + Supabase ai_cache 테이블 (API 서버와 워커가 같은 결과를 공유)
+- 캐시 조회 / 저장 실패는 로그만 남기고 생성 요청으로 진행
+"""
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+from app.config import settings
+from app.database import db
+import asyncio
+import hashlib
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 프롬프트나 응답 형식이 바뀌면 해당 종류의 버전을 올릴 것 (이전 결과는 무시됨)
+PROMPT_VERSIONS = {
+    "summary": 1,  # 기사별 / 묶음 요약 (같은 형식의 결과)
+    "analysis": 1,  # analyze_news_detailed
+}
+
+# IN 쿼리 한 번에 보낼 키 개수 (PostgREST 요청 URL 길이 제한)
+IN_QUERY_CHUNK_SIZE = 50
+
+
+def cache_key(kind: str, title: str, content: str, ticker: Optional[str] = None) -> str:
+    payload = json.dumps(
+        [kind, PROMPT_VERSIONS[kind], settings.gemini_model, ticker or "", title or "", content or ""],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AiResultCache:
+    """키 → 결과 dict (크기 제한 LRU + DB)"""
+
+    def __init__(self, max_size: int = 2000):
+        self.max_size = max_size
+        self.results: OrderedDict = OrderedDict()
+
+    def _remember(self, key: str, result: dict):
+        self.results[key] = result
+        self.results.move_to_end(key)
+        while len(self.results) > self.max_size:
+            self.results.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[dict]:
+        return (await self.get_many([key])).get(key)
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, dict]:
+        """
+        캐시된 결과 조회 (메모리에 없는 키만 한 번의 IN 쿼리로 DB에서 확인)
+
+        Returns:
+            dict: 키 → 결과 (캐시에 없는 키는 제외)
+        """
+        found = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            if key in self.results:
+                self.results.move_to_end(key)
+                found[key] = self.results[key]
+            else:
+                missing.append(key)
+
+        try:
+            for i in range(0, len(missing), IN_QUERY_CHUNK_SIZE):
+                chunk = missing[i:i + IN_QUERY_CHUNK_SIZE]
+                result = await asyncio.to_thread(
+                    lambda chunk=chunk: db.client.table("ai_cache").select("key, result").in_("key", chunk).execute()
+                )
+                for row in result.data or []:
+                    self._remember(row["key"], row["result"])
+                    found[row["key"]] = row["result"]
+        except Exception as e:
+            logger.error(f"Error reading AI result cache: {e}")
+
+        return found
+
+    async def put(self, key: str, kind: str, result: dict):
+        await self.put_many([(key, kind, result)])
+
+    async def put_many(self, entries: List[tuple]):
+        """(키, 종류, 결과) 목록을 메모리와 DB에 저장 (DB는 한 번의 upsert)"""
+        if not entries:
+            return
+        for key, _, result in entries:
+            self._remember(key, result)
+
+        rows = [
+            {"key": key, "kind": kind, "model": settings.gemini_model, "result": result}
+            for key, kind, result in entries
+        ]
+        try:
+            await asyncio.to_thread(
+                lambda: db.client.table("ai_cache").upsert(rows, on_conflict="key").execute()
+            )
+        except Exception as e:
+            logger.error(f"Error saving AI result cache: {e}")
+
+
+ai_cache = AiResultCache(settings.ai_cache_size)
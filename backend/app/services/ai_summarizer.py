@@ -1,10 +1,102 @@
+"""
+Gemini 기반 뉴스 요약 / 상세 분석
+- 비동기 생성 API(generate_content_async)를 사용해 이벤트 루프를 막지 않음
+- 동시 요청 수는 settings.ai_max_concurrency로 제한, 429 등 일시적 오류는 지수 백오프로 재시도
+- 일괄 요약은 여러 기사를 한 프롬프트에 묶어 요청 (지시문 반복 / 요청 수 감소),
+  응답 검증에 실패한 기사만 기사별 요청으로 다시 요약
+- 성공한 요약 / 분석은 내용 해시 기준으로 캐시 (ai_cache) → 같은 기사는 다시 생성하지 않음
+"""
+from typing import Dict, List, Optional
+from google.api_core import exceptions as google_exceptions
 import google.generativeai as genai
 from app.config import settings
+from app.services.ai_cache import ai_cache, cache_key
+import asyncio
 import json
+import logging
+import random
+
+logger = logging.getLogger(__name__)
+
+# 재시도할 오류 (rate limit, 일시적 서버 오류)
+RETRYABLE_ERRORS = (
+    google_exceptions.ResourceExhausted,  # 429
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+    google_exceptions.DeadlineExceeded,
+)
+
+# 요약 프롬프트에서 기사 본문 최대 글자 수
+SUMMARY_CONTENT_CHARS = 1000
+
+# 토큰 수 추정 (영문 기준 약 4글자 = 1토큰)
+CHARS_PER_TOKEN = 4
+
+PACKED_SUMMARY_PROMPT = """Analyze each of the following financial news articles and provide for each:
+1. A 2-sentence summary in English
+2. An impact score (1-5) where:
+   1 = Minor news, no market impact
+   2 = Low impact, sector-specific
+   3 = Moderate impact, could affect stock price
+   4 = High impact, significant market news
+   5 = Critical impact, major market-moving event
+
+{articles}
+
+Respond with a JSON array containing one object per article, using the article id:
+[{{"id": 0, "summary": "...", "impact_score": 3}}]"""
+
+_model = None
+_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def get_model():
+    """Gemini 모델 (최초 호출 시 API 키 설정 후 생성)"""
+    global _model
+    if _model is None:
+        if settings.gemini_api_key:
+            genai.configure(api_key=settings.gemini_api_key)
+        _model = genai.GenerativeModel(settings.gemini_model)
+    return _model
+
+
+async def generate(prompt: str) -> str:
+    """
+    프롬프트 → 응답 텍스트 (동시 요청 수 제한 + 일시적 오류 재시도)
+
+    재시도 대기: ai_retry_base_seconds * 2^시도 (+ 무작위 지터)
+    """
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(settings.ai_max_concurrency)
+
+    for attempt in range(settings.ai_max_retries + 1):
+        try:
+            async with _semaphore:
+                response = await get_model().generate_content_async(prompt)
+            return response.text
+        except RETRYABLE_ERRORS as e:
+            if attempt >= settings.ai_max_retries:
+                raise
+            delay = settings.ai_retry_base_seconds * (2 ** attempt) * random.uniform(1.0, 1.5)
+            logger.warning(f"⏳ Gemini request failed ({type(e).__name__}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+def parse_json_response(result_text: str):
+    """응답 텍스트 → JSON (마크다운 코드 블록 제거, 실패 시 json.JSONDecodeError)"""
+    result_text = result_text.strip()
+    if result_text.startswith('```'):
+        result_text = result_text.split('```')[1]
+        if result_text.startswith('json'):
+            result_text = result_text[4:]
+        result_text = result_text.strip()
+    return json.loads(result_text)
+
 
 async def summarize_news(title: str, content: str) -> dict:
     """
-    뉴스 요약 및 영향도 점수 생성
+    뉴스 요약 및 영향도 점수 생성 (캐시된 결과가 있으면 재사용)
 
     Args:
         title: 뉴스 제목
@@ -13,6 +105,14 @@ async def summarize_news(title: str, content: str) -> dict:
     Returns:
         dict: {"summary": str, "impact_score": int}
     """
+    key = cache_key("summary", title, content)
+    cached = await ai_cache.get(key)
+    if cached:
+        return cached
+    return await request_summary(title, content, key)
+
+async def request_summary(title: str, content: str, key: str) -> dict:
+    """기사 하나를 요약 요청 (성공한 결과만 key로 캐시, 실패 시 기본값)"""
     prompt = f"""Analyze this financial news and provide:
 1. A 2-sentence summary in English
 2. An impact score (1-5) where:
@@ -23,34 +123,23 @@ async def summarize_news(title: str, content: str) -> dict:
    5 = Critical impact, major market-moving event
 
 Title: {title}
-Content: {content[:1000]}
+Content: {content[:SUMMARY_CONTENT_CHARS]}
 
 Respond in JSON format:
 {{"summary": "...", "impact_score": 3}}"""
 
     try:
-        # Gemini 설정
-        if settings.gemini_api_key:
-            genai.configure(api_key=settings.gemini_api_key)
-
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        response = model.generate_content(prompt)
-        result_text = response.text
+        result_text = await generate(prompt)
 
         # JSON 파싱
         try:
-            # Remove markdown code blocks if present
-            if result_text.startswith('```'):
-                result_text = result_text.split('```')[1]
-                if result_text.startswith('json'):
-                    result_text = result_text[4:]
-                result_text = result_text.strip()
-
-            result = json.loads(result_text)
-            return {
+            result = parse_json_response(result_text)
+            summary = {
                 "summary": result.get("summary", "Unable to generate summary"),
                 "impact_score": min(max(result.get("impact_score", 3), 1), 5)
             }
+            await ai_cache.put(key, "summary", summary)
+            return summary
         except json.JSONDecodeError:
             # JSON 파싱 실패 시 기본값 반환
             return {
@@ -65,23 +154,133 @@ Respond in JSON format:
             "impact_score": 3
         }
 
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def format_packed_article(article_id: int, news: dict) -> str:
+    content = (news.get("content") or "")[:SUMMARY_CONTENT_CHARS]
+    return f"[Article {article_id}]\nTitle: {news.get('title', '')}\nContent: {content}"
+
+
+def pack_articles(news_list: list) -> List[List[int]]:
+    """
+    기사 인덱스를 묶음으로 나눔 (묶음당 최대 ai_pack_max_articles개, 기사 토큰 합이 ai_pack_token_budget 이하)
+
+    예산보다 큰 기사 하나는 단독 묶음
+    """
+    packs, current, current_tokens = [], [], 0
+    for index, news in enumerate(news_list):
+        tokens = estimate_tokens(format_packed_article(index, news))
+        if current and (len(current) >= settings.ai_pack_max_articles
+                        or current_tokens + tokens > settings.ai_pack_token_budget):
+            packs.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+    if current:
+        packs.append(current)
+    return packs
+
+
+def validate_packed_item(item, expected_ids: set) -> Optional[tuple]:
+    """
+    묶음 응답 항목 검증 (id가 요청한 기사이고 요약이 있고 점수가 숫자인 경우만)
+
+    Returns:
+        (기사 인덱스, {"summary", "impact_score"}) 또는 None
+    """
+    if not isinstance(item, dict):
+        return None
+    try:
+        article_id = int(item.get("id"))
+    except (TypeError, ValueError):
+        return None
+    if article_id not in expected_ids:
+        return None
+    summary = item.get("summary")
+    score = item.get("impact_score")
+    if not isinstance(summary, str) or not summary.strip():
+        return None
+    if isinstance(score, bool) or not isinstance(score, (int, float)):
+        return None
+    return article_id, {"summary": summary.strip(), "impact_score": min(max(int(round(score)), 1), 5)}
+
+
+async def summarize_packed(news_list: list, indices: List[int]) -> Dict[int, dict]:
+    """
+    여러 기사를 한 번의 요청으로 요약
+
+    Returns:
+        기사 인덱스 → {"summary", "impact_score"} (검증에 실패한 기사는 제외)
+    """
+    articles = "\n\n".join(format_packed_article(index, news_list[index]) for index in indices)
+    try:
+        items = parse_json_response(await generate(PACKED_SUMMARY_PROMPT.format(articles=articles)))
+    except Exception as e:
+        logger.warning(f"Packed summary failed for {len(indices)} articles: {e}")
+        return {}
+
+    if not isinstance(items, list):
+        return {}
+
+    expected = set(indices)
+    results = {}
+    for item in items:
+        validated = validate_packed_item(item, expected)
+        if validated is not None:
+            results.setdefault(*validated)
+    return results
+
 async def batch_summarize(news_list: list) -> list:
     """
     여러 뉴스를 일괄 요약
 
+    캐시된 기사는 요청하지 않고, 나머지는
+    ai_packed_summaries가 켜져 있으면 여러 기사를 한 프롬프트로 묶어 요청하고,
+    결과가 없거나 검증에 실패한 기사만 기사별로 다시 요청 (모든 요청은 동시에, ai_max_concurrency로 제한)
+
     Args:
         news_list: 뉴스 목록
 
     Returns:
-        list: 요약된 뉴스 목록
+        list: 요약된 뉴스 목록 (입력 순서)
     """
-    results = []
-    for news in news_list:
-        summary_data = await summarize_news(news.get("title", ""), news.get("content", ""))
-        news["summary"] = summary_data["summary"]
-        news["impact_score"] = summary_data["impact_score"]
-        results.append(news)
-    return results
+    keys = [cache_key("summary", news.get("title", ""), news.get("content", "")) for news in news_list]
+    cached = await ai_cache.get_many(keys)
+    results: Dict[int, dict] = {index: cached[key] for index, key in enumerate(keys) if key in cached}
+    requests = 0
+
+    uncached = [index for index in range(len(news_list)) if index not in results]
+    if settings.ai_packed_summaries and len(uncached) > 1:
+        packs = [
+            [uncached[i] for i in pack]
+            for pack in pack_articles([news_list[index] for index in uncached])
+            if len(pack) > 1
+        ]
+        requests += len(packs)
+        for packed in await asyncio.gather(*[summarize_packed(news_list, pack) for pack in packs]):
+            results.update(packed)
+            await ai_cache.put_many([(keys[index], "summary", result) for index, result in packed.items()])
+
+    remaining = [index for index in range(len(news_list)) if index not in results]
+    requests += len(remaining)
+    singles = await asyncio.gather(*[
+        request_summary(news_list[index].get("title", ""), news_list[index].get("content", ""), keys[index])
+        for index in remaining
+    ])
+    results.update(zip(remaining, singles))
+
+    if news_list:
+        logger.info(
+            f"🤖 Summarized {len(news_list)} articles in {requests} requests "
+            f"({len(cached)} cached, {len(remaining)} single)"
+        )
+
+    for index, news in enumerate(news_list):
+        news["summary"] = results[index]["summary"]
+        news["impact_score"] = results[index]["impact_score"]
+    return news_list
 
 async def analyze_news_detailed(title: str, content: str, ticker: str = None) -> dict:
     """
@@ -93,8 +292,13 @@ async def analyze_news_detailed(title: str, content: str, ticker: str = None) ->
         ticker: 주식 티커 (선택)
 
     Returns:
-        dict: 시장 영향, 투자자 인사이트, AI 추천 포함
+        dict: 시장 영향, 투자자 인사이트, AI 추천 포함 (캐시된 결과가 있으면 재사용)
     """
+    key = cache_key("analysis", title, content, ticker)
+    cached = await ai_cache.get(key)
+    if cached:
+        return cached
+
     prompt = f"""Analyze this financial news comprehensively:
 
 Title: {title}
@@ -124,25 +328,14 @@ Provide detailed analysis in JSON format with:
 Return ONLY valid JSON without markdown code blocks."""
 
     try:
-        # Gemini 설정
-        if settings.gemini_api_key:
-            genai.configure(api_key=settings.gemini_api_key)
-
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        response = model.generate_content(prompt)
-        result_text = response.text
+        result_text = await generate(prompt)
 
         # JSON 파싱
         try:
-            # Remove markdown code blocks if present
-            if result_text.startswith('```'):
-                result_text = result_text.split('```')[1]
-                if result_text.startswith('json'):
-                    result_text = result_text[4:]
-                result_text = result_text.strip()
-
-            result = json.loads(result_text)
-            return result
+            analysis = parse_json_response(result_text)
+            if isinstance(analysis, dict):
+                await ai_cache.put(key, "analysis", analysis)
+            return analysis
         except json.JSONDecodeError as e:
             # JSON 파싱 실패 시 None 반환
             print(f"Failed to parse AI analysis response: {result_text[:200]}")
@@ -1,5 +1,5 @@
 from typing import Optional
-import httpx
+from app.services.http_client import get_http_client
 
 async def send_telegram_alert(telegram_id: str, message: str, bot_token: str) -> bool:
     """
@@ -25,9 +25,8 @@ async def send_telegram_alert(telegram_id: str, message: str, bot_token: str) ->
     }
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload)
-            return response.status_code == 200
+        response = await get_http_client(url).post(url, json=payload)
+        return response.status_code == 200
     except Exception as e:
         print(f"Error sending Telegram alert: {e}")
         return False
@@ -62,9 +61,8 @@ async def send_email_alert(email: str, subject: str, body: str, sendgrid_key: st
     }
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json=payload)
-            return response.status_code == 202
+        response = await get_http_client(url).post(url, headers=headers, json=payload)
+        return response.status_code == 202
     except Exception as e:
         print(f"Error sending email alert: {e}")
         return False
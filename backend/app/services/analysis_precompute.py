@@ -0,0 +1,127 @@
+"""
+영향도가 높은 뉴스의 AI 상세 분석 사전 생성 (워커에서 실행)
+- 새로 저장된 뉴스 중 impact_score가 ai_precompute_min_impact 이상인 뉴스를 우선순위 큐에 추가
+  (영향도 높은 순 → 최신 순)
+- 분석 결과는 news 테이블의 analysis 컬럼에 저장
+  → /api/news/{id}/analysis는 저장된 분석을 바로 반환하고, 없을 때만 요청 시 생성
+- 워커 재시작 시 최근 분석되지 않은 뉴스를 다시 큐에 채움
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from app.config import settings
+from app.database import db
+from app.services.ai_summarizer import analyze_news_detailed
+from app.services.ingest_cursors import parse_timestamp
+import asyncio
+import heapq
+import itertools
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 워커 시작 시 다시 큐에 채울 뉴스 범위 (시간)
+BACKFILL_HOURS = 24
+
+
+async def save_analysis(news_id: str, analysis: dict):
+    """뉴스 row에 분석 결과 저장"""
+    await asyncio.to_thread(
+        lambda: db.client.table("news").update({
+            "analysis": analysis,
+            "analyzed_at": datetime.now(timezone.utc).isoformat()
+        }).eq("id", news_id).execute()
+    )
+
+
+class AnalysisPrecomputer:
+    """(영향도, 최신순) 우선순위 큐 + 분석 워커"""
+
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self.heap: List[tuple] = []  # (-영향도, -게시 시각, 순번, 뉴스 ID)
+        self.queued: Dict[str, tuple] = {}  # 뉴스 ID → (row, 티커)
+        self.counter = itertools.count()
+        self.available = asyncio.Event()
+        self.analyzed = 0
+        self.failed = 0
+
+    def enqueue(self, row: dict, ticker: Optional[str] = None):
+        """영향도가 기준 이상이고 아직 분석되지 않은 뉴스를 큐에 추가"""
+        news_id = row.get("id")
+        impact = row.get("impact_score") or 0
+        if not settings.ai_precompute_enabled or not news_id or news_id in self.queued:
+            return
+        if impact < settings.ai_precompute_min_impact or row.get("analysis"):
+            return
+
+        published = parse_timestamp(row.get("published_at")) or parse_timestamp(row.get("created_at"))
+        timestamp = published.timestamp() if published else 0.0
+        heapq.heappush(self.heap, (-impact, -timestamp, next(self.counter), news_id))
+        self.queued[news_id] = (row, ticker)
+
+        # 큐가 가득 차면 우선순위가 가장 낮은 뉴스부터 버림
+        if len(self.heap) > self.max_size:
+            kept = heapq.nsmallest(self.max_size, self.heap)
+            for entry in set(self.heap) - set(kept):
+                self.queued.pop(entry[3], None)
+            self.heap = kept  # 정렬된 리스트는 그대로 힙
+
+        self.available.set()
+
+    async def next_item(self) -> tuple:
+        while not self.heap:
+            self.available.clear()
+            await self.available.wait()
+        news_id = heapq.heappop(self.heap)[3]
+        return news_id, self.queued.pop(news_id)
+
+    async def analyze(self, news_id: str, row: dict, ticker: Optional[str]):
+        analysis = await analyze_news_detailed(
+            title=row.get("title", ""),
+            content=row.get("content", "") or "",
+            ticker=ticker
+        )
+        if not analysis:
+            self.failed += 1
+            return
+        await save_analysis(news_id, analysis)
+        self.analyzed += 1
+        logger.info(f"🧠 Precomputed analysis for {ticker or 'market'} (impact {row.get('impact_score')}): {row.get('title', '')[:50]}")
+
+    async def backfill(self):
+        """최근 저장되었지만 분석되지 않은 고영향 뉴스를 큐에 채움"""
+        since = (datetime.now(timezone.utc) - timedelta(hours=BACKFILL_HOURS)).isoformat()
+        try:
+            result = await asyncio.to_thread(
+                lambda: db.client.table("news")
+                .select("id, title, content, impact_score, published_at, created_at, stocks(ticker)")
+                .is_("analysis", "null")
+                .gte("impact_score", settings.ai_precompute_min_impact)
+                .gte("created_at", since)
+                .order("impact_score", desc=True)
+                .limit(self.max_size)
+                .execute()
+            )
+            for row in result.data or []:
+                self.enqueue(row, (row.get("stocks") or {}).get("ticker"))
+            logger.info(f"🧠 Queued {len(self.heap)} high-impact news for analysis")
+        except Exception as e:
+            logger.error(f"Error loading news for analysis precompute: {e}")
+
+    async def worker(self):
+        while True:
+            news_id, (row, ticker) = await self.next_item()
+            try:
+                await self.analyze(news_id, row, ticker)
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Error precomputing analysis for news {news_id}: {e}")
+
+    async def run(self):
+        """메인 루프 (ai_precompute_concurrency개의 분석 워커)"""
+        logger.info(f"🧠 Analysis precompute started (impact >= {settings.ai_precompute_min_impact})")
+        await self.backfill()
+        await asyncio.gather(*[self.worker() for _ in range(settings.ai_precompute_concurrency)])
+
+
+analysis_precomputer = AnalysisPrecomputer(settings.ai_precompute_queue_size)
@@ -0,0 +1,206 @@
+"""
+기사 HTML / 추출 결과 디스크 캐시 (content-addressed)
+- 원본 HTML은 내용 해시 기준으로 gzip 압축 저장 (같은 HTML은 한 번만 저장)
+- 추출 결과는 (내용 해시, 추출기 버전) 기준으로 저장
+  → 추출기를 바꾸면 EXTRACTOR_VERSION만 올리면 되고, 네트워크 없이 캐시된 HTML로 재추출
+- 전체 크기(압축된 HTML + 추출 결과 파일)가 제한을 넘으면 가장 오래 사용되지 않은 내용부터 삭제 (LRU)
+  → 크기는 시작 시 디스크에서 한 번 계산하고 이후에는 저장 / 삭제할 때마다 증감만 반영
+- 추출에 실패한 기사는 캐시하지 않음 (차단 / 동의 페이지 등을 다음 시도에 다시 다운로드)
+"""
+from typing import Dict, Optional
+from app.config import settings
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 기사 본문 추출 로직이 바뀌면 올릴 것 (이전 추출 결과는 무시되고 캐시된 HTML로 재추출)
+EXTRACTOR_VERSION = 1
+
+# 크기 제한을 넘으면 이 비율까지 줄임 (저장할 때마다 삭제가 반복되지 않도록)
+EVICT_TARGET_RATIO = 0.9
+
+
+class ArticleCache:
+    """URL → 내용 해시 인덱스(sqlite) + 해시별 압축 파일"""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.conn = None
+        self.sizes: Dict[str, int] = {}  # 내용 해시 → 디스크 사용량 (HTML + 추출 결과 파일)
+        self.total_bytes = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.conn is None:
+            os.makedirs(os.path.join(self.directory, "html"), exist_ok=True)
+            os.makedirs(os.path.join(self.directory, "text"), exist_ok=True)
+            self.conn = sqlite3.connect(os.path.join(self.directory, "index.db"), check_same_thread=False)
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "url TEXT PRIMARY KEY, content_hash TEXT NOT NULL, size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed_at ON entries(accessed_at)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_content_hash ON entries(content_hash)")
+            self.conn.commit()
+            self._load_sizes(self.conn)
+        return self.conn
+
+    def _load_sizes(self, conn: sqlite3.Connection):
+        """
+        디스크의 캐시 파일 크기를 내용 해시별로 합산 (시작 시 한 번)
+
+        인덱스에 없는 파일, 파일이 없는 항목, 이전 추출기 버전의 결과 파일은 정리
+        → 이후에는 해시마다 _html_path / _text_path 두 파일만 존재
+        """
+        text_suffix = f".v{EXTRACTOR_VERSION}.json.gz"
+        sizes: Dict[str, int] = {}
+        for kind in ("html", "text"):
+            for entry in os.scandir(os.path.join(self.directory, kind)):
+                if kind == "text" and not entry.name.endswith(text_suffix):
+                    os.remove(entry.path)
+                    continue
+                content_hash = entry.name.split(".", 1)[0]
+                sizes[content_hash] = sizes.get(content_hash, 0) + entry.stat().st_size
+
+        used = {row[0] for row in conn.execute("SELECT DISTINCT content_hash FROM entries")}
+        for content_hash in used - set(sizes):
+            conn.execute("DELETE FROM entries WHERE content_hash = ?", (content_hash,))
+        conn.commit()
+        for content_hash in set(sizes) - used:
+            self._remove_files(content_hash)
+            del sizes[content_hash]
+
+        self.sizes = sizes
+        self.total_bytes = sum(sizes.values())
+
+    def _html_path(self, content_hash: str) -> str:
+        return os.path.join(self.directory, "html", f"{content_hash}.html.gz")
+
+    def _text_path(self, content_hash: str) -> str:
+        return os.path.join(self.directory, "text", f"{content_hash}.v{EXTRACTOR_VERSION}.json.gz")
+
+    def get_html(self, url: str) -> Optional[tuple]:
+        """
+        캐시된 원본 HTML 조회
+
+        Returns:
+            (content_hash, html) 또는 None
+        """
+        with self.lock:
+            conn = self._connect()
+            row = conn.execute("SELECT content_hash FROM entries WHERE url = ?", (url,)).fetchone()
+            if not row:
+                return None
+            content_hash = row[0]
+            try:
+                with gzip.open(self._html_path(content_hash), "rt", encoding="utf-8") as f:
+                    html = f.read()
+            except FileNotFoundError:
+                conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+                self._drop_if_unused(conn, content_hash)
+                conn.commit()
+                return None
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE url = ?", (time.time(), url))
+            conn.commit()
+            return content_hash, html
+
+    def put_html(self, url: str, html: str) -> str:
+        """원본 HTML 저장 후 내용 해시 반환"""
+        data = html.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        with self.lock:
+            conn = self._connect()
+            path = self._html_path(content_hash)
+            if not os.path.exists(path):
+                with gzip.open(path, "wb") as f:
+                    f.write(data)
+                self._add_size(content_hash, os.path.getsize(path))
+            size = os.path.getsize(path)
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (url, content_hash, size, accessed_at) VALUES (?, ?, ?, ?)",
+                (url, content_hash, size, time.time()),
+            )
+            conn.commit()
+            if self.total_bytes > self.max_bytes:
+                self._evict(conn)
+        return content_hash
+
+    def get_extracted(self, content_hash: str) -> Optional[dict]:
+        """현재 추출기 버전의 추출 결과 조회"""
+        try:
+            with gzip.open(self._text_path(content_hash), "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def put_extracted(self, content_hash: str, result: dict):
+        """추출 결과 저장 (추출에 실패했거나 본문이 비어 있으면 저장하지 않음)"""
+        if not result.get("success") or not result.get("content"):
+            return
+        with self.lock:
+            self._connect()
+            if content_hash not in self.sizes:
+                return  # HTML이 이미 삭제됨
+            path = self._text_path(content_hash)
+            if os.path.exists(path):
+                self._add_size(content_hash, -os.path.getsize(path))
+            with gzip.open(path, "wt", encoding="utf-8") as f:
+                json.dump(result, f)
+            self._add_size(content_hash, os.path.getsize(path))
+
+    def forget(self, url: str):
+        """URL 항목 삭제 (추출에 실패한 HTML을 다음 시도에 다시 다운로드하도록)"""
+        with self.lock:
+            conn = self._connect()
+            row = conn.execute("SELECT content_hash FROM entries WHERE url = ?", (url,)).fetchone()
+            if not row:
+                return
+            conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+            self._drop_if_unused(conn, row[0])
+            conn.commit()
+
+    def _add_size(self, content_hash: str, size: int):
+        self.sizes[content_hash] = self.sizes.get(content_hash, 0) + size
+        self.total_bytes += size
+
+    def _remove_files(self, content_hash: str):
+        for path in (self._html_path(content_hash), self._text_path(content_hash)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _drop_if_unused(self, conn: sqlite3.Connection, content_hash: str):
+        """같은 HTML을 가리키는 다른 URL이 없으면 파일 삭제"""
+        still_used = conn.execute(
+            "SELECT 1 FROM entries WHERE content_hash = ? LIMIT 1", (content_hash,)
+        ).fetchone()
+        if not still_used:
+            self._remove_files(content_hash)
+            self.total_bytes -= self.sizes.pop(content_hash, 0)
+
+    def _evict(self, conn: sqlite3.Connection):
+        """오래 사용되지 않은 내용부터 삭제해 전체 크기를 제한의 EVICT_TARGET_RATIO 이하로 줄임"""
+        target = self.max_bytes * EVICT_TARGET_RATIO
+        for (content_hash,) in conn.execute(
+            "SELECT content_hash FROM entries GROUP BY content_hash ORDER BY MAX(accessed_at)"
+        ).fetchall():
+            if self.total_bytes <= target:
+                break
+            conn.execute("DELETE FROM entries WHERE content_hash = ?", (content_hash,))
+            self._drop_if_unused(conn, content_hash)
+        conn.commit()
+
+
+article_cache = ArticleCache(
+    os.path.join(settings.cache_dir, "articles"),
+    settings.article_cache_max_mb * 1024 * 1024,
+)
@@ -0,0 +1,224 @@
+"""
+SEC EDGAR 실시간 공시 감시
+회사별로 EDGAR를 조회하지 않고, 주기마다 공시 유형별 전체 최신 공시 피드만 조회한 뒤
+추적 중인 종목의 CIK와 메모리에서 대조 → 해당하는 공시만 상세 조회 후 뉴스로 저장
+
+조회 비용은 추적 종목 수와 관계없이 거의 일정함 (주기당 공시 유형 수만큼의 요청)
+"""
+from typing import Dict, List
+from app.config import settings
+from app.services.analysis_precompute import analysis_precomputer
+from app.database import db, upsert_news_batch
+from app.scrapers.sec_edgar import edgar_client, fetch_latest_filings, filings_from_submissions, latest_filings_url
+from app.scrapers.sec_filing_parser import extract_filing
+from app.services.feed_cache import feed_cache
+from app.services.impact_scorer import ImpactScorer
+from app.services.ingest_cursors import ingest_cursors
+from app.services.news_dedup import seen_urls
+from app.services.news_events import publish_news
+from app.services.news_scraper import get_parse_pool
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# 감시할 공시 유형과 기본 영향도 점수
+WATCHED_FORMS = {"8-K": 4, "10-Q": 3, "10-K": 3}
+
+# 피드 한 번 조회 시 최대 페이지 수 (페이지당 100건)
+MAX_PAGES = 5
+
+# 본문 섹션을 추출할 정기 보고서 유형과 섹션별 최대 글자 수
+REPORT_FORMS = {"10-K", "10-Q"}
+REPORT_EXCERPT_CHARS = 5000
+
+# 추적 종목 목록 갱신 주기 (초)
+TRACKED_REFRESH_SECONDS = 600
+
+
+def base_form(form: str) -> str:
+    """정정 공시 유형을 원래 유형으로 (예: "8-K/A" → "8-K")"""
+    return form[:-2] if form.endswith("/A") else form
+
+
+class EdgarWatcher:
+    """최신 공시 피드 → 추적 CIK 대조 → 뉴스 저장"""
+
+    def __init__(self):
+        self.tracked: Dict[int, dict] = {}  # CIK → stocks 테이블 row
+        self.tracked_refreshed_at = 0.0
+        self.tracked_ok = False  # 마지막 추적 종목 갱신 성공 여부
+        self.scorer = ImpactScorer(settings.impact_keyword_tiers)
+
+    async def refresh_tracked(self):
+        """stocks 테이블의 종목을 CIK로 변환"""
+        try:
+            result = await asyncio.to_thread(lambda: db.client.table("stocks").select("*").execute())
+            tracked = {}
+            for stock in result.data or []:
+                cik = await edgar_client.get_cik(stock["ticker"])
+                if cik is not None:
+                    tracked[cik] = stock
+            self.tracked = tracked
+            self.tracked_refreshed_at = time.time()
+            self.tracked_ok = True
+            logger.info(f"🏛️ Watching EDGAR filings for {len(tracked)} companies")
+        except Exception as e:
+            self.tracked_ok = False
+            logger.error(f"Error refreshing EDGAR watch list: {e}")
+
+    async def new_filings(self, form: str, feed_urls: List[str]) -> List[dict]:
+        """
+        커서 이후의 최신 공시 (최신순, 추적 여부와 관계없이 전체)
+
+        이전 조회 이후 공시가 한 페이지보다 많으면 커서에 닿을 때까지 다음 페이지를 조회
+        (조회한 페이지 URL은 feed_urls에 기록 → 저장이 끝난 뒤 feed_cache.commit())
+        """
+        filings = []
+        for page in range(MAX_PAGES):
+            entries = await fetch_latest_filings(form, start=page * 100)
+            if not entries:
+                break
+            feed_urls.append(latest_filings_url(form, start=page * 100))
+
+            for entry in entries:
+                if not ingest_cursors.is_new("sec", form, entry["published_at"], entry["accession_number"]):
+                    return filings
+                filings.append(entry)
+
+        return filings
+
+    async def filing_details(self, filing: dict) -> dict:
+        """
+        추적 종목의 공시 상세 (submissions JSON에서 주 문서 URL, 8-K 항목 등)
+
+        submissions에 아직 반영되지 않았으면 피드 항목 정보를 그대로 사용
+        """
+        stock = self.tracked[filing["cik"]]
+        details = {
+            "title": f"{stock['ticker']} files {filing['form']}",
+            "content": filing["summary"] or filing["form"],
+            "url": filing["url"],
+        }
+        try:
+            # 방금 올라온 공시이므로 캐시된 submissions는 사용하지 않음
+            edgar_client.submissions.pop(filing["cik"], None)
+            submissions = await edgar_client.get_submissions(filing["cik"])
+            for match in filings_from_submissions(stock["ticker"], filing["cik"], submissions, [filing["form"]], 20):
+                if match["accession_number"] == filing["accession_number"]:
+                    details.update(title=match["title"], content=match["content"], url=match["url"])
+                    break
+        except Exception as e:
+            logger.error(f"Error fetching EDGAR details for {filing['accession_number']}: {e}")
+
+        if base_form(filing["form"]) in REPORT_FORMS and "/Archives/" in details["url"]:
+            # 정기 보고서는 MD&A(없으면 Risk Factors) 앞부분을 본문으로 사용 (스트리밍 파싱, 프로세스 풀)
+            try:
+                extracted = await extract_filing(details["url"], get_parse_pool(), REPORT_EXCERPT_CHARS)
+                sections = extracted["sections"]
+                excerpt = sections.get("mda") or sections.get("risk_factors")
+                if excerpt:
+                    details["content"] = f"{details['content']}\n\n{excerpt}"
+            except Exception as e:
+                logger.error(f"Error extracting EDGAR report {details['url']}: {e}")
+
+        return details
+
+    def build_row(self, filing: dict, details: dict) -> dict:
+        stock = self.tracked[filing["cik"]]
+        content = details["content"]
+        return {
+            "stock_id": stock["id"],
+            "title": details["title"],
+            "content": content,
+            "summary": content[:500],
+            "url": details["url"],
+            "source": "SEC EDGAR",
+            "published_at": filing["published_at"],
+            "impact_score": max(WATCHED_FORMS[base_form(filing["form"])], self.scorer.score(details["title"], content)),
+        }
+
+    async def persist(self, rows: List[dict], tickers: Dict[str, str]) -> int:
+        """
+        한 번의 bulk upsert로 저장 후 실시간 전송 (이미 저장된 URL은 제외)
+
+        중복 확인이나 저장에 실패하면 예외를 올려 커서가 전진하지 않게 함
+        """
+        new_urls = set(await seen_urls.filter_new([row["url"] for row in rows]))
+        rows = [row for row in rows if row["url"] in new_urls]
+        if not rows:
+            return 0
+
+        try:
+            inserted = await upsert_news_batch(rows)
+            seen_urls.mark_seen(row["url"] for row in rows)
+            for row in inserted:
+                logger.info(f"🏛️ Added SEC filing for {tickers.get(row['url'])}: {row.get('title', '')[:50]}")
+                publish_news(row, tickers.get(row["url"]))
+                analysis_precomputer.enqueue(row, tickers.get(row["url"]))
+            return len(inserted)
+        finally:
+            for row in rows:
+                seen_urls.release(row["url"])
+
+    async def poll(self) -> int:
+        """
+        공시 유형별 최신 공시 피드를 한 번 조회 (정정 공시 포함, 예: 8-K/A)
+
+        추적 종목 갱신에 실패했으면 이전 목록으로 대조만 하고 커서는 전진하지 않음
+        → 목록이 복구된 뒤 같은 구간을 다시 대조 (이미 저장된 공시는 seen_urls에서 제외)
+        """
+        if time.time() - self.tracked_refreshed_at > TRACKED_REFRESH_SECONDS:
+            await self.refresh_tracked()
+        if not self.tracked:
+            return 0
+
+        total = 0
+        for form in WATCHED_FORMS:
+            feed_urls = []
+            try:
+                filings = await self.new_filings(form, feed_urls)
+                if not filings:
+                    feed_cache.commit(feed_urls)
+                    continue
+
+                hits = [
+                    filing for filing in filings
+                    if filing["cik"] in self.tracked and base_form(filing["form"]) == form
+                ]
+                details = await asyncio.gather(*[self.filing_details(filing) for filing in hits])
+                rows = [self.build_row(filing, detail) for filing, detail in zip(hits, details)]
+                tickers = {row["url"]: self.tracked[filing["cik"]]["ticker"] for row, filing in zip(rows, hits)}
+
+                total += await self.persist(rows, tickers)
+                if not self.tracked_ok:
+                    feed_cache.discard(feed_urls)
+                    continue
+
+                # 모든 항목을 처리한 뒤에 커서 전진 (저장에 실패하면 다음 주기에 재시도)
+                newest = filings[0]
+                await ingest_cursors.advance({("sec", form): (newest["published_at"], newest["accession_number"])})
+                feed_cache.commit(feed_urls)
+
+            except Exception as e:
+                feed_cache.discard(feed_urls)
+                logger.error(f"Error polling EDGAR {form} filings: {e}")
+
+        return total
+
+    async def run(self):
+        """메인 루프"""
+        logger.info("🏛️ EDGAR filing watcher started")
+        if not ingest_cursors.loaded:
+            await ingest_cursors.load()
+
+        while True:
+            started = time.perf_counter()
+            added = await self.poll()
+            if added:
+                logger.info(f"🏛️ Added {added} SEC filings in {time.perf_counter() - started:.1f}s")
+            await asyncio.sleep(settings.sec_poll_interval_seconds)
+
+
+edgar_watcher = EdgarWatcher()
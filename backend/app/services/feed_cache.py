@@ -0,0 +1,153 @@
+"""
+RSS 피드 조건부 요청 캐시
+피드별 ETag / Last-Modified / 내용 해시를 파일에 저장하고, 변경이 없으면 피드 처리를 건너뜀
+"""
+from typing import Iterable, Optional
+from app.config import settings
+from app.services.http_client import get_http_client
+from app.services.rate_limiter import rate_limiter
+import asyncio
+import feedparser
+import hashlib
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+# 검증값 변경을 모아서 파일에 쓰기까지 대기 시간 (초)
+SAVE_DELAY_SECONDS = 2.0
+
+
+class FeedCache:
+    """
+    피드 URL → {"etag", "last_modified", "content_hash"} (JSON 파일에 영구 저장)
+
+    새 검증값은 바로 저장하지 않고 pending에 두었다가, 호출자가 피드 항목을 모두 처리(저장)한 뒤
+    commit()해야 반영됨 → 처리 중 실패하거나 프로세스가 죽으면 다음 실행에서 같은 피드를 다시 처리
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: dict = {}
+        self.pending: dict = {}
+        self.loaded = False
+        self.dirty = False
+        self.save_task: Optional[asyncio.Task] = None
+
+    def load(self):
+        try:
+            with open(self.path, "r") as f:
+                self.entries = json.load(f)
+        except FileNotFoundError:
+            self.entries = {}
+        except Exception as e:
+            logger.error(f"Error loading feed cache: {e}")
+            self.entries = {}
+        self.loaded = True
+
+    def _write(self, data: str):
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Error saving feed cache: {e}")
+
+    async def _save_later(self):
+        """잠시 기다렸다가 그 사이 쌓인 변경을 한 번에 파일로 저장 (파일 쓰기는 스레드에서)"""
+        await asyncio.sleep(SAVE_DELAY_SECONDS)
+        while self.dirty:
+            self.dirty = False
+            await asyncio.to_thread(self._write, json.dumps(self.entries))
+        self.save_task = None
+
+    def _schedule_save(self):
+        self.dirty = True
+        if self.save_task is None:
+            self.save_task = asyncio.create_task(self._save_later())
+
+    async def get(self, url: str) -> dict:
+        if not self.loaded:
+            await asyncio.to_thread(self.load)
+        return self.entries.get(url, {})
+
+    def set(self, url: str, entry: dict):
+        """검증값 바로 반영 (처리할 항목이 없는 경우)"""
+        self.pending.pop(url, None)
+        self.entries[url] = entry
+        self._schedule_save()
+
+    def stage(self, url: str, entry: dict):
+        """새 검증값을 처리 완료 전까지 보류"""
+        self.pending[url] = entry
+
+    def commit(self, urls: Iterable[str]):
+        """피드 항목을 모두 처리한 뒤 보류 중인 검증값 반영"""
+        changed = False
+        for url in urls:
+            entry = self.pending.pop(url, None)
+            if entry is not None:
+                self.entries[url] = entry
+                changed = True
+        if changed:
+            self._schedule_save()
+
+    def discard(self, urls: Iterable[str]):
+        """처리에 실패한 피드의 보류 중인 검증값 버림 (다음 실행에서 다시 처리)"""
+        for url in urls:
+            self.pending.pop(url, None)
+
+
+feed_cache = FeedCache(os.path.join(settings.cache_dir, "feeds.json"))
+
+
+async def fetch_feed(url: str, conditional: bool = True):
+    """
+    조건부 GET으로 RSS 피드 가져오기
+
+    피드가 바뀌었으면 새 검증값을 보류해 두므로, 호출자는 항목을 모두 처리한 뒤
+    feed_cache.commit([url])을 호출해야 함 (호출하지 않으면 다음에도 같은 피드를 다시 처리)
+
+    Args:
+        url: 피드 URL
+        conditional: False면 캐시를 사용하지 않고 항상 전체 피드 반환
+
+    Returns:
+        feedparser 결과 (조건부 요청에서 304 응답이거나 내용이 이전과 같으면 None)
+    """
+    cached = await feed_cache.get(url) if conditional else {}
+
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    await rate_limiter.acquire(url)
+    response = await get_http_client(url).get(url, headers=headers)
+    rate_limiter.record_response(url, response)
+
+    if response.status_code == 304:
+        logger.info(f"💤 Feed not modified: {url[:80]}")
+        return None
+
+    response.raise_for_status()
+
+    if conditional:
+        entry = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_hash": hashlib.sha256(response.content).hexdigest(),
+        }
+        if entry["content_hash"] == cached.get("content_hash"):
+            # 이미 처리한 내용 - 바뀐 검증값만 바로 반영
+            feed_cache.set(url, entry)
+            logger.info(f"💤 Feed unchanged: {url[:80]}")
+            return None
+        feed_cache.stage(url, entry)
+
+    return await asyncio.to_thread(feedparser.parse, response.content)
@@ -0,0 +1,91 @@
+"""
+공유 HTTP 클라이언트 레지스트리
+요청마다 새 연결(TCP/TLS 핸드셰이크)을 만들지 않도록 용도별 httpx.AsyncClient를 앱 전체에서 재사용
+
+- 호스트별 프로필(연결 수 제한, 타임아웃, 헤더)에 따라 클라이언트를 나눔
+  (예: SEC는 정책상 동시 연결 수를 작게, 알림 API는 짧은 타임아웃)
+- keep-alive 연결 풀 + HTTP/2 (h2 패키지가 설치되어 있고 서버가 지원하면 사용)
+- 앱 시작 시 open_http_clients(), 종료 시 close_http_clients() 호출
+"""
+from typing import Dict, Optional
+from app.config import settings
+from app.services.rate_limiter import host_key
+import importlib.util
+import httpx
+import logging
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+}
+
+# 클라이언트 프로필: 이름 → 설정 (hosts에 나열된 호스트 키는 해당 프로필의 클라이언트 사용)
+CLIENT_PROFILES: Dict[str, dict] = {
+    # 뉴스 피드 / 기사 페이지 (여러 발행처에 걸쳐 요청)
+    "default": {
+        "hosts": [],
+        "headers": DEFAULT_HEADERS,
+        "timeout": httpx.Timeout(10.0, connect=5.0),
+        "limits": httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    },
+    # SEC EDGAR (초당 10건 정책 - 연결도 적게 유지, 연락처가 들어간 User-Agent 필수)
+    "sec": {
+        "hosts": ["sec.gov"],
+        "headers": {"User-Agent": settings.sec_edgar_user_agent},
+        "timeout": httpx.Timeout(20.0, connect=5.0),
+        "limits": httpx.Limits(max_connections=10, max_keepalive_connections=10),
+    },
+    # 알림 전송 API
+    "notifications": {
+        "hosts": ["telegram.org", "sendgrid.com"],
+        "headers": {},
+        "timeout": httpx.Timeout(10.0, connect=5.0),
+        "limits": httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    },
+}
+
+HOST_PROFILES = {host: name for name, profile in CLIENT_PROFILES.items() for host in profile["hosts"]}
+
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def _create_client(profile: dict) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        headers=profile["headers"],
+        timeout=profile["timeout"],
+        limits=profile["limits"],
+        follow_redirects=True,
+        http2=HTTP2_AVAILABLE,
+    )
+
+
+def get_http_client(url: Optional[str] = None) -> httpx.AsyncClient:
+    """
+    요청 대상에 맞는 공유 AsyncClient 반환 (최초 호출 시 생성)
+
+    Args:
+        url: 요청할 URL 또는 호스트 (없으면 기본 클라이언트)
+    """
+    name = HOST_PROFILES.get(host_key(url), "default") if url else "default"
+    client = _clients.get(name)
+    if client is None or client.is_closed:
+        client = _clients[name] = _create_client(CLIENT_PROFILES[name])
+    return client
+
+
+def open_http_clients():
+    """앱 시작 시 모든 프로필의 클라이언트 생성"""
+    for name, profile in CLIENT_PROFILES.items():
+        if name not in _clients or _clients[name].is_closed:
+            _clients[name] = _create_client(profile)
+    logger.info(f"🌐 HTTP clients ready: {', '.join(_clients)} (HTTP/2 {'on' if HTTP2_AVAILABLE else 'off'})")
+
+
+async def close_http_clients():
+    """앱 종료 시 연결 정리"""
+    for client in _clients.values():
+        await client.aclose()
+    _clients.clear()
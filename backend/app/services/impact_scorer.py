@@ -0,0 +1,100 @@
+"""
+키워드 기반 뉴스 영향도 점수 계산
+모든 키워드를 단어 경계를 인식하는 하나의 정규식으로 컴파일해 제목 / 본문 앞부분을 각각 한 번만 스캔
+"""
+from typing import Dict, List, Optional, Tuple
+import re
+
+# 기본 키워드 단계
+# fields: "title_lead" = 제목 + 본문 앞 500자, "title" = 제목만
+DEFAULT_KEYWORD_TIERS = [
+    {
+        # 높은 영향도 키워드 (점수 5)
+        "score": 5,
+        "fields": "title_lead",
+        "keywords": [
+            'federal reserve', 'fed', 'interest rate', 'inflation', 'recession',
+            'sec', 'regulation', 'policy', 'earnings report', 'market crash',
+            'economic', 'gdp', 'unemployment', 'forex', 'exchange rate',
+            'trade war', 'tariff', 'geopolitical', 'bank crisis'
+        ],
+    },
+    {
+        # 중간 영향도 키워드 (점수 4)
+        "score": 4,
+        "fields": "title",
+        "keywords": [
+            'analyst', 'upgrade', 'downgrade', 'price target', 'market outlook',
+            'sector', 'industry', 'merger', 'acquisition', 'ipo'
+        ],
+    },
+]
+
+# 본문에서 검사할 앞부분 길이
+LEAD_LENGTH = 500
+
+
+class ImpactScorer:
+    """키워드 단계 → 컴파일된 단일 정규식 (단어 경계 인식, 대소문자 무시)"""
+
+    def __init__(self, tiers: Optional[List[dict]] = None, default_score: int = 3):
+        self.tiers = tiers or DEFAULT_KEYWORD_TIERS
+        self.default_score = default_score
+        self.max_score = max(tier["score"] for tier in self.tiers)
+
+        # 키워드 → (점수, 검사 범위), 같은 키워드가 여러 단계에 있으면 높은 점수 우선
+        self.keywords: Dict[str, Tuple[int, str]] = {}
+        for tier in sorted(self.tiers, key=lambda t: t["score"]):
+            for keyword in tier["keywords"]:
+                self.keywords[self._normalize(keyword)] = (tier["score"], tier.get("fields", "title"))
+
+        # 긴 키워드를 먼저 두어 "federal reserve"가 "fed"보다 우선 매칭되도록 함
+        alternatives = sorted(self.keywords, key=len, reverse=True)
+        # 여러 단어 키워드는 같은 줄 안의 공백/탭으로만 연결 (줄바꿈을 넘어 다른 문단과 이어 매칭하지 않음)
+        pattern = "|".join(r"[ \t]+".join(re.escape(word) for word in keyword.split()) for keyword in alternatives)
+        # 복수형(-s, -es)도 같은 키워드로 인정 (예: tariffs, upgrades)
+        self.pattern = re.compile(rf"(?<![a-z0-9])(?P<keyword>{pattern})(?:e?s)?(?![a-z0-9])", re.IGNORECASE)
+
+    @staticmethod
+    def _normalize(keyword: str) -> str:
+        return " ".join(keyword.lower().split())
+
+    def _best_score(self, text: str, in_title: bool) -> Optional[int]:
+        """text에서 매칭된 키워드 중 가장 높은 점수 (본문이면 제목 전용 키워드는 제외)"""
+        best = None
+        for match in self.pattern.finditer(text):
+            score, fields = self.keywords[self._normalize(match.group("keyword"))]
+            if fields == "title" and not in_title:
+                continue
+            if best is None or score > best:
+                best = score
+                if best == self.max_score:
+                    break
+        return best
+
+    def score(self, title: str, content: str) -> int:
+        """
+        뉴스의 영향도 점수 계산 (제목과 본문 앞부분을 따로 스캔 - 제목 끝과 본문 시작이 이어져 매칭되지 않도록)
+
+        Returns:
+            int: 매칭된 키워드 단계 중 가장 높은 점수 (없으면 기본 점수)
+        """
+        best = self._best_score(title or "", in_title=True)
+        if best != self.max_score:
+            lead_best = self._best_score((content or "")[:LEAD_LENGTH], in_title=False)
+            if lead_best is not None and (best is None or lead_best > best):
+                best = lead_best
+
+        return best if best is not None else self.default_score
+
+    def score_many(self, articles: List[Tuple[str, str]]) -> List[int]:
+        """
+        여러 뉴스의 영향도 점수를 한 번에 계산
+
+        Args:
+            articles: (제목, 본문) 목록
+
+        Returns:
+            list: 입력 순서대로 점수 목록
+        """
+        return [self.score(title, content) for title, content in articles]
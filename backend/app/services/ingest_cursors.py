@@ -0,0 +1,214 @@
+"""
+소스별 수집 커서와 실행 체크포인트 (Supabase에 영구 저장)
+- 커서: (소스, 종목)별로 마지막으로 처리한 기사의 published_at / 항목 ID
+  → 다음 실행에서는 커서보다 새로운 항목만 처리
+- 체크포인트: 전체 수집 실행에서 완료된 종목 목록
+  → 실행 중 프로세스가 재시작되면 남은 종목부터 이어서 처리
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Set, Tuple
+from app.database import db
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 이보다 오래된 미완료 실행은 이어서 하지 않고 새로 시작
+RESUME_MAX_AGE_HOURS = 6
+
+# 완료된 종목을 모아서 체크포인트에 기록하는 간격 (초)
+CHECKPOINT_SAVE_SECONDS = 5.0
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """ISO 시각 문자열 → UTC datetime (시간대가 없으면 UTC로 간주)"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class IngestCursors:
+    """(소스, 종목) → {"last_published_at", "last_item_id"}"""
+
+    def __init__(self):
+        self.cursors: Dict[Tuple[str, str], dict] = {}
+        self.loaded = False
+
+    async def load(self):
+        """저장된 커서 전체를 메모리로 불러오기"""
+        try:
+            result = await asyncio.to_thread(
+                lambda: db.client.table("ingest_cursors").select("*").execute()
+            )
+            self.cursors = {
+                (row["source"], row["ticker"]): row for row in result.data or []
+            }
+            self.loaded = True
+            logger.info(f"📍 Loaded {len(self.cursors)} ingest cursors")
+        except Exception as e:
+            logger.error(f"Error loading ingest cursors: {e}")
+
+    def is_new(self, source: str, ticker: str, published_at: str, item_id: str,
+               lookback: timedelta = timedelta(0)) -> bool:
+        """
+        커서 이후에 나온 항목인지 확인 (커서가 없거나 날짜를 알 수 없으면 True)
+
+        Args:
+            lookback: 커서보다 이만큼 이전에 게시된 항목까지 새 항목으로 취급
+                (게시 후 늦게 피드에 올라오는 기사용, 이미 저장된 기사는 URL 중복 확인으로 걸러짐)
+        """
+        cursor = self.cursors.get((source, ticker))
+        if not cursor:
+            return True
+
+        cursor_time = parse_timestamp(cursor.get("last_published_at"))
+        item_time = parse_timestamp(published_at)
+        if cursor_time is None or item_time is None:
+            return True
+        cursor_time -= lookback
+        if item_time != cursor_time:
+            return item_time > cursor_time
+        return item_id != cursor.get("last_item_id")
+
+    async def advance(self, updates: Dict[Tuple[str, str], Tuple[str, str]]):
+        """
+        커서 전진 (한 번의 upsert)
+
+        Args:
+            updates: (소스, 종목) → (가장 최근 published_at, 항목 ID)
+        """
+        rows = []
+        for (source, ticker), (published_at, item_id) in updates.items():
+            if not self.is_new(source, ticker, published_at, item_id):
+                continue
+            rows.append({
+                "source": source,
+                "ticker": ticker,
+                "last_published_at": published_at,
+                "last_item_id": item_id,
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            })
+
+        if not rows:
+            return
+
+        try:
+            await asyncio.to_thread(
+                lambda: db.client.table("ingest_cursors")
+                .upsert(rows, on_conflict="source,ticker")
+                .execute()
+            )
+            for row in rows:
+                self.cursors[(row["source"], row["ticker"])] = row
+        except Exception as e:
+            logger.error(f"Error saving ingest cursors: {e}")
+
+
+def newest_item(candidates: list) -> Optional[Tuple[str, str]]:
+    """후보 목록에서 가장 최근 항목의 (published_at, URL)"""
+    dated = [(parse_timestamp(c["published_at"]), c) for c in candidates]
+    dated = [(t, c) for t, c in dated if t is not None]
+    if not dated:
+        return None
+    _, newest = max(dated, key=lambda pair: pair[0])
+    return newest["published_at"], newest["url"]
+
+
+class RunCheckpoint:
+    """
+    전체 수집 실행의 진행 상황 (완료된 종목 목록)
+
+    종목이 끝날 때마다 쓰지 않고 CHECKPOINT_SAVE_SECONDS 동안 모아서 기록
+    (재시작 시 마지막 기록 이후 완료된 종목은 다시 수집되지만, 커서 덕분에 새 기사만 처리됨)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.run_id: Optional[str] = None
+        self.completed: Set[str] = set()
+        self.dirty = False
+        self.save_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> Set[str]:
+        """
+        중단된 실행이 있으면 이어서, 없으면 새 실행 시작
+
+        Returns:
+            set: 이미 완료된 종목 티커
+        """
+        self.run_id, self.completed, self.dirty = None, set(), False
+        try:
+            result = await asyncio.to_thread(
+                lambda: db.client.table("ingest_runs")
+                .select("*")
+                .eq("name", self.name)
+                .eq("status", "running")
+                .order("started_at", desc=True)
+                .limit(1)
+                .execute()
+            )
+            previous = result.data[0] if result.data else None
+            started_at = parse_timestamp(previous.get("started_at")) if previous else None
+
+            if previous and started_at and datetime.now(timezone.utc) - started_at < timedelta(hours=RESUME_MAX_AGE_HOURS):
+                self.run_id = previous["id"]
+                self.completed = set(previous.get("completed_tickers") or [])
+                logger.info(f"⏯️ Resuming {self.name} run {self.run_id} ({len(self.completed)} tickers already done)")
+                return set(self.completed)
+
+            if previous:
+                await self._update({"status": "abandoned"}, previous["id"])
+
+            inserted = await asyncio.to_thread(
+                lambda: db.client.table("ingest_runs")
+                .insert({"name": self.name, "status": "running", "completed_tickers": []})
+                .execute()
+            )
+            self.run_id = inserted.data[0]["id"] if inserted.data else None
+        except Exception as e:
+            # 체크포인트 없이도 수집은 계속 (재시작 시 처음부터)
+            logger.error(f"Error starting {self.name} run checkpoint: {e}")
+
+        return set()
+
+    def complete_ticker(self, ticker: str):
+        """종목 하나 완료 기록 (잠시 후 다른 완료 종목과 함께 저장)"""
+        self.completed.add(ticker)
+        self.dirty = True
+        if self.save_task is None and self.run_id:
+            self.save_task = asyncio.create_task(self._save_later())
+
+    async def _save_later(self):
+        await asyncio.sleep(CHECKPOINT_SAVE_SECONDS)
+        while self.dirty:
+            self.dirty = False
+            await self._update({"completed_tickers": sorted(self.completed)})
+        self.save_task = None
+
+    async def finish(self):
+        if self.save_task is not None:
+            self.save_task.cancel()
+            self.save_task = None
+        await self._update({
+            "status": "completed",
+            "completed_tickers": sorted(self.completed),
+            "finished_at": datetime.now(timezone.utc).isoformat(),
+        })
+
+    async def _update(self, data: dict, run_id: Optional[str] = None):
+        run_id = run_id or self.run_id
+        if not run_id:
+            return
+        try:
+            await asyncio.to_thread(
+                lambda: db.client.table("ingest_runs").update(data).eq("id", run_id).execute()
+            )
+        except Exception as e:
+            logger.error(f"Error updating {self.name} run checkpoint: {e}")
+
+
+ingest_cursors = IngestCursors()
@@ -2,6 +2,7 @@ import yfinance as yf
 from typing import Dict, List, Optional
 from datetime import datetime
 import math
+from app.services.rate_limiter import call_yfinance
 
 
 def clean_float(value):
@@ -36,9 +37,8 @@ async def get_market_overview() -> List[Dict]:
 
         for ticker, label in indices.items():
             try:
-                # 실시간 데이터 조회
-                stock = yf.Ticker(ticker)
-                info = stock.info
+                # 실시간 데이터 조회 (Yahoo rate limit 적용)
+                info = await call_yfinance(lambda: yf.Ticker(ticker).info)
 
                 # 현재가 및 전일 종가 (NaN 처리)
                 current_price = clean_float(info.get('currentPrice') or info.get('regularMarketPrice'))
@@ -110,9 +110,8 @@ async def get_trending_stocks(tickers: Optional[List[str]] = None) -> List[Dict]
 
         for ticker in tickers:
             try:
-                # 실시간 데이터 조회
-                stock = yf.Ticker(ticker)
-                info = stock.info
+                # 실시간 데이터 조회 (Yahoo rate limit 적용)
+                info = await call_yfinance(lambda: yf.Ticker(ticker).info)
 
                 # 필요한 데이터 추출 (NaN 처리)
                 current_price = clean_float(info.get('currentPrice') or info.get('regularMarketPrice'))
@@ -181,8 +180,7 @@ async def get_stock_quote(ticker: str) -> Optional[Dict]:
         dict: 종목 데이터 또는 None
     """
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = await call_yfinance(lambda: yf.Ticker(ticker).info)
 
         current_price = clean_float(info.get('currentPrice') or info.get('regularMarketPrice'))
         previous_close = clean_float(info.get('previousClose') or info.get('regularMarketPreviousClose'))
@@ -0,0 +1,252 @@
+"""
+소스 간 유사 기사(near-duplicate) 탐지
+같은 통신사 기사가 Yahoo, Google News, 지수 피드에서 서로 다른 URL로 들어오는 경우를
+MinHash(제목/본문 shingle) + LSH 밴드 인덱스로 찾아 한 번만 수집
+
+- 게시 시각이 window_hours 이내인 기사끼리만 비교 (같은 제목 형식의 다른 날 기사는 별개)
+- 제목은 짧아 단어 하나만 달라도 유사도가 높게 나오므로, 단어 2개 shingle + 더 높은 기준을 사용
+  (예: "Nvidia earnings: what to expect" / "... what to know"는 서로 다른 기사)
+- MinHash 계산은 순수 Python CPU 작업이므로 compute()로 이벤트 루프 밖(프로세스 풀 등)에서 실행하고,
+  기사마다 한 번 계산한 서명을 비교(match)와 등록(add)에 함께 사용
+"""
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+from app.config import settings
+from app.database import db
+from app.services.ingest_cursors import parse_timestamp
+import asyncio
+import hashlib
+import logging
+import random
+import re
+import time
+
+logger = logging.getLogger(__name__)
+
+# MinHash 서명 길이와 LSH 밴드 구성 (16밴드 × 4행 → 자카드 유사도 약 0.5 이상이면 후보가 됨)
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+# 해시 순열 계수 (프로세스 간에 서명이 같도록 고정 시드)
+_rng = random.Random(1206)
+PERMUTATIONS = [
+    (_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+# 제목 비교 시 무시할 흔한 단어
+STOPWORDS = {"a", "an", "the", "of", "to", "in", "on", "for", "and", "or", "is", "are", "as", "at", "by", "with", "from"}
+
+# Google News 제목 끝의 " - 발행처" 제거
+PUBLISHER_SUFFIX_RE = re.compile(r"\s+[-|–]\s+[^-|–]{1,60}$")
+
+# compute()에서 작업자 하나에 넘길 기사 수
+SIGNATURE_CHUNK_SIZE = 50
+
+
+def normalize_title(title: str) -> str:
+    return PUBLISHER_SUFFIX_RE.sub("", title or "").strip()
+
+
+def shingles(text: str, size: int) -> Set[str]:
+    """단어 단위 shingle 집합 (단어 수가 size보다 적으면 단어 자체를 사용)"""
+    words = WORD_RE.findall((text or "").lower())
+    if size == 1:
+        return {w for w in words if w not in STOPWORDS}
+    if len(words) < size:
+        return set(words)
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash(features: Set[str]) -> Optional[Tuple[int, ...]]:
+    """shingle 집합의 MinHash 서명 (비어 있으면 None)"""
+    if not features:
+        return None
+
+    hashes = [
+        int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+        for feature in features
+    ]
+    return tuple(
+        min(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for h in hashes)
+        for a, b in PERMUTATIONS
+    )
+
+
+def title_signature(title: Optional[str]) -> Optional[Tuple[int, ...]]:
+    return minhash(shingles(normalize_title(title), 2))
+
+
+def content_signature(content: Optional[str]) -> Optional[Tuple[int, ...]]:
+    return minhash(shingles(content, 3))
+
+
+def signatures_many(articles: List[tuple]) -> List[tuple]:
+    """(제목, 본문) 목록 → (제목 서명, 본문 서명) 목록 (프로세스 풀에서 실행 가능)"""
+    return [(title_signature(title), content_signature(content)) for title, content in articles]
+
+
+def estimated_similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    """두 서명의 일치 비율 = 자카드 유사도 추정치"""
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_PERM
+
+
+class MinHashIndex:
+    """
+    MinHash 서명 인덱스 (LSH 밴드 버킷으로 후보만 비교 - 전체 스캔 없음)
+
+    크기 제한을 넘거나 window보다 오래되면 먼저 들어온 항목부터 제거
+    게시 시각이 window_seconds 이상 차이 나는 항목은 비교하지 않음
+    """
+
+    def __init__(self, max_size: int, threshold: float, window_seconds: float):
+        self.max_size = max_size
+        self.threshold = threshold
+        self.window_seconds = window_seconds
+        self.signatures: OrderedDict = OrderedDict()  # key → signature
+        self.timestamps: Dict[str, float] = {}  # key → 게시 시각 (epoch 초)
+        self.buckets: List[Dict[Tuple[int, ...], set]] = [{} for _ in range(BANDS)]
+
+    @staticmethod
+    def _bands(signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        return [signature[i * ROWS_PER_BAND:(i + 1) * ROWS_PER_BAND] for i in range(BANDS)]
+
+    def add(self, key: str, signature: Optional[Tuple[int, ...]], timestamp: float):
+        if signature is None:
+            return
+        self.discard(key)
+        self.signatures[key] = signature
+        self.timestamps[key] = timestamp
+        for i, band in enumerate(self._bands(signature)):
+            self.buckets[i].setdefault(band, set()).add(key)
+
+        # 크기 제한을 넘었거나 window보다 오래된 항목은 먼저 들어온 순서대로 제거
+        expired_before = time.time() - self.window_seconds
+        while self.signatures:
+            oldest = next(iter(self.signatures))
+            if len(self.signatures) <= self.max_size and self.timestamps[oldest] >= expired_before:
+                break
+            self.discard(oldest)
+
+    def discard(self, key: str):
+        signature = self.signatures.pop(key, None)
+        if signature is None:
+            return
+        self.timestamps.pop(key, None)
+        for i, band in enumerate(self._bands(signature)):
+            bucket = self.buckets[i].get(band)
+            if bucket:
+                bucket.discard(key)
+                if not bucket:
+                    del self.buckets[i][band]
+
+    def find(self, signature: Optional[Tuple[int, ...]], timestamp: float) -> Optional[str]:
+        """게시 시각 window 안에서 유사도가 threshold 이상인 가장 비슷한 항목의 key (없으면 None)"""
+        if signature is None:
+            return None
+
+        candidates = set()
+        for i, band in enumerate(self._bands(signature)):
+            candidates.update(self.buckets[i].get(band, ()))
+
+        best_key, best_similarity = None, self.threshold
+        for key in candidates:
+            if abs(self.timestamps[key] - timestamp) > self.window_seconds:
+                continue
+            similarity = estimated_similarity(signature, self.signatures[key])
+            if similarity >= best_similarity:
+                best_key, best_similarity = key, similarity
+        return best_key
+
+
+def published_timestamp(published_at: Optional[str]) -> float:
+    """게시 시각 → epoch 초 (알 수 없으면 현재 시각)"""
+    parsed = parse_timestamp(published_at)
+    return parsed.timestamp() if parsed else time.time()
+
+
+class NearDuplicateDetector:
+    """
+    제목/본문 MinHash로 게시 시각이 가까운 유사 기사를 찾음
+
+    서명은 (제목 서명, 본문 서명) 튜플이며 compute()로 계산 (본문이 없으면 본문 서명은 None)
+    """
+
+    def __init__(self, max_size: int = 20000, threshold: float = 0.6, title_threshold: float = 0.8,
+                 window_hours: float = 48):
+        window_seconds = window_hours * 3600
+        self.title_index = MinHashIndex(max_size, title_threshold, window_seconds)
+        self.content_index = MinHashIndex(max_size, threshold, window_seconds)
+        self.warmed = False
+
+    @staticmethod
+    async def compute(articles: List[tuple], executor=None) -> List[tuple]:
+        """
+        (제목, 본문) 목록의 서명을 이벤트 루프 밖에서 계산 (SIGNATURE_CHUNK_SIZE개씩 나눠 동시에 실행)
+
+        Args:
+            articles: (제목, 본문) 목록 (본문 서명이 필요 없으면 본문은 None, 제목 서명이 필요 없으면 제목은 None)
+            executor: 실행할 풀 (None이면 기본 스레드 풀)
+        """
+        loop = asyncio.get_running_loop()
+        chunks = [articles[i:i + SIGNATURE_CHUNK_SIZE] for i in range(0, len(articles), SIGNATURE_CHUNK_SIZE)]
+        results = await asyncio.gather(*[
+            loop.run_in_executor(executor, signatures_many, chunk) for chunk in chunks
+        ])
+        return [signature for chunk in results for signature in chunk]
+
+    def match(self, signatures: tuple, published_at: Optional[str] = None) -> Optional[str]:
+        """
+        유사한 기존 기사의 URL
+
+        본문 서명이 있으면 본문으로 (전문 추출 후), 없으면 제목으로 (기사 다운로드 전) 비교
+        """
+        title_sig, content_sig = signatures
+        timestamp = published_timestamp(published_at)
+        if content_sig is not None:
+            return self.content_index.find(content_sig, timestamp)
+        return self.title_index.find(title_sig, timestamp)
+
+    def add(self, url: str, signatures: tuple, published_at: Optional[str] = None):
+        title_sig, content_sig = signatures
+        timestamp = published_timestamp(published_at)
+        self.title_index.add(url, title_sig, timestamp)
+        self.content_index.add(url, content_sig, timestamp)
+
+    def discard(self, url: str):
+        """저장에 실패한 기사를 인덱스에서 제거"""
+        self.title_index.discard(url)
+        self.content_index.discard(url)
+
+    async def warm(self, limit: int = 1000, executor=None):
+        """최근 저장된 뉴스로 인덱스 채우기 (서명은 executor에서 나눠 계산)"""
+        try:
+            result = await asyncio.to_thread(
+                lambda: db.client.table("news")
+                .select("url, title, content, published_at")
+                .order("created_at", desc=True)
+                .limit(limit)
+                .execute()
+            )
+            rows = [row for row in reversed(result.data or []) if row.get("url") and row.get("title")]
+            signatures = await self.compute([(row["title"], row.get("content")) for row in rows], executor)
+            for row, row_signatures in zip(rows, signatures):
+                self.add(row["url"], row_signatures, row.get("published_at"))
+            self.warmed = True
+            logger.info(f"🧬 Loaded {len(rows)} recent stories into near-duplicate index")
+        except Exception as e:
+            logger.error(f"Error warming near-duplicate index: {e}")
+
+
+near_duplicates = NearDuplicateDetector(
+    settings.near_duplicate_index_size,
+    settings.near_duplicate_threshold,
+    settings.near_duplicate_title_threshold,
+    settings.near_duplicate_window_hours,
+)
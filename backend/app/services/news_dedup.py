@@ -0,0 +1,107 @@
+"""
+뉴스 URL 중복 제거
+최근 URL을 메모리에 캐싱하고, 캐시에 없는 URL만 한 번의 IN 쿼리로 DB에서 확인
+"""
+from collections import OrderedDict
+from typing import Iterable, List
+from app.config import settings
+from app.database import db
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# IN 쿼리 한 번에 보낼 URL 개수 (PostgREST 요청 URL 길이 제한)
+IN_QUERY_CHUNK_SIZE = 50
+
+# 워밍 시 한 번에 가져올 row 수 (Supabase 기본 최대 응답 크기)
+WARM_PAGE_SIZE = 1000
+
+
+class SeenUrlFilter:
+    """이미 저장된 뉴스 URL 필터 (크기 제한 FIFO 캐시)"""
+
+    def __init__(self, max_size: int = 50000):
+        self.max_size = max_size
+        self.urls: OrderedDict = OrderedDict()
+        # 처리 중인 URL (동시에 도는 다른 종목 작업이 같은 기사를 중복 처리하지 않도록)
+        self.pending = set()
+        self.warmed = False
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.urls
+
+    def mark_seen(self, urls: Iterable[str]):
+        for url in urls:
+            self.pending.discard(url)
+            self.urls[url] = None
+            self.urls.move_to_end(url)
+        while len(self.urls) > self.max_size:
+            self.urls.popitem(last=False)
+
+    def release(self, url: str):
+        """처리가 끝난 URL의 처리 중 표시 해제 (저장 실패 시 다음 실행에서 재시도)"""
+        self.pending.discard(url)
+
+    async def warm(self):
+        """최근 저장된 뉴스 URL을 DB에서 불러와 캐시 채우기"""
+        loaded = 0
+        try:
+            while loaded < self.max_size:
+                result = await asyncio.to_thread(
+                    lambda offset=loaded: db.client.table("news")
+                    .select("url")
+                    .order("created_at", desc=True)
+                    .range(offset, offset + WARM_PAGE_SIZE - 1)
+                    .execute()
+                )
+                rows = result.data or []
+                # 오래된 URL이 먼저 들어가도록 역순으로 추가
+                self.mark_seen(row["url"] for row in reversed(rows) if row.get("url"))
+                loaded += len(rows)
+                if len(rows) < WARM_PAGE_SIZE:
+                    break
+            self.warmed = True
+            logger.info(f"🧠 Loaded {len(self.urls)} recent news URLs into dedup cache")
+        except Exception as e:
+            logger.error(f"Error warming seen-URL cache: {e}")
+
+    async def filter_new(self, urls: List[str]) -> List[str]:
+        """
+        아직 저장되지 않은 URL만 반환
+
+        반환된 URL은 처리 중으로 표시되므로, 처리 후 mark_seen() 또는 release()를 호출해야 함
+        DB 확인에 실패하면 예외를 그대로 올림 (호출자가 커서를 전진시키지 않도록)
+
+        Args:
+            urls: 피드에서 가져온 후보 URL 목록
+
+        Returns:
+            list: 새 URL 목록 (입력 순서 유지)
+        """
+        candidates = [
+            url for url in dict.fromkeys(urls)
+            if url and url not in self.urls and url not in self.pending
+        ]
+        if not candidates:
+            return []
+
+        existing = set()
+        try:
+            for i in range(0, len(candidates), IN_QUERY_CHUNK_SIZE):
+                chunk = candidates[i:i + IN_QUERY_CHUNK_SIZE]
+                result = await asyncio.to_thread(
+                    lambda chunk=chunk: db.client.table("news").select("url").in_("url", chunk).execute()
+                )
+                existing.update(row["url"] for row in result.data or [])
+        except Exception as e:
+            logger.error(f"Error checking existing news URLs: {e}")
+            raise
+
+        self.mark_seen(existing)
+        new_urls = [url for url in candidates if url not in existing]
+        self.pending.update(new_urls)
+        return new_urls
+
+
+seen_urls = SeenUrlFilter(settings.seen_url_cache_size)
@@ -0,0 +1,153 @@
+"""
+뉴스 이벤트 스트림
+스크래퍼가 뉴스를 저장할 때마다 이벤트를 발행하고, 구독자(WebSocket 등)에게 전달
+
+스크래퍼가 별도 워커 프로세스에서 돌 때는 API 프로세스의 NewsRelay가
+news 테이블의 새 row를 주기적으로 읽어 같은 이벤트로 발행
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Set
+from app.database import db
+from app.services.ingest_cursors import parse_timestamp
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 릴레이가 마지막으로 본 created_at보다 이만큼 이전부터 다시 조회 (늦게 커밋된 row 대비, 발행 여부는 id로 확인)
+RELAY_OVERLAP_SECONDS = 60
+
+
+class NewsEventBus:
+    """프로세스 내부 pub/sub (구독자별 bounded queue)"""
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self.subscribers: Set[asyncio.Queue] = set()
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.discard(queue)
+
+    def publish(self, event: dict):
+        """
+        모든 구독자에게 이벤트 전달 (블로킹 없음)
+
+        느린 구독자의 큐가 가득 차면 가장 오래된 이벤트를 버림
+        """
+        for queue in self.subscribers:
+            if queue.full():
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(event)
+
+
+news_events = NewsEventBus()
+
+
+def publish_news(news_row: dict, ticker: Optional[str] = None):
+    """
+    저장된 뉴스 row를 이벤트로 발행
+
+    Args:
+        news_row: news 테이블에 insert된 row (id, stock_id, impact_score 포함)
+        ticker: 종목 티커 (시장 전체 뉴스는 None)
+    """
+    try:
+        news_events.publish({
+            "type": "news",
+            "ticker": ticker,
+            "stock_id": news_row.get("stock_id"),
+            "impact_score": news_row.get("impact_score"),
+            "data": news_row
+        })
+    except Exception as e:
+        logger.error(f"Error publishing news event: {e}")
+
+
+def matches_subscription(event: dict, tickers: Set[str], min_score: Optional[int]) -> bool:
+    """
+    이벤트가 구독 조건에 맞는지 확인
+
+    구독한 티커의 뉴스이거나 영향도가 임계값 이상이면 전달.
+    조건이 하나도 없으면 모든 뉴스를 전달.
+    """
+    if not tickers and min_score is None:
+        return True
+    if event.get("ticker") and event["ticker"] in tickers:
+        return True
+    if min_score is not None and (event.get("impact_score") or 0) >= min_score:
+        return True
+    return False
+
+
+class NewsRelay:
+    """
+    news 테이블에 새로 추가된 row를 읽어 프로세스 내부 이벤트로 발행 (워커 분리 모드)
+
+    created_at은 DB가 insert 시점에 채우지만 트랜잭션이 커밋되는 순서와는 다를 수 있으므로,
+    마지막으로 본 시각보다 RELAY_OVERLAP_SECONDS 이전부터 다시 읽고 이미 발행한 row는 id로 건너뜀
+    """
+
+    def __init__(self, interval: float = 5.0, batch_size: int = 100):
+        self.interval = interval
+        self.batch_size = batch_size
+        self.overlap = timedelta(seconds=RELAY_OVERLAP_SECONDS)
+        self.reset()
+
+    def reset(self):
+        self.last_created_at = datetime.now(timezone.utc)
+        self.published: Dict[str, datetime] = {}  # 겹치는 구간에서 이미 발행한 row id → created_at
+
+    async def poll(self) -> int:
+        """겹치는 구간부터 새 row를 페이지 단위로 모두 읽어 발행"""
+        since = (self.last_created_at - self.overlap).isoformat()
+        published = 0
+        offset = 0
+        while True:
+            result = await asyncio.to_thread(
+                lambda offset=offset: db.client.table("news")
+                .select("*, stocks(ticker)")
+                .gte("created_at", since)
+                .order("created_at")
+                .order("id")
+                .range(offset, offset + self.batch_size - 1)
+                .execute()
+            )
+            rows = result.data or []
+            for row in rows:
+                created_at = parse_timestamp(row.get("created_at"))
+                if row["id"] in self.published or created_at is None:
+                    continue
+                stock = row.pop("stocks", None) or {}
+                publish_news(row, stock.get("ticker"))
+                published += 1
+                self.published[row["id"]] = created_at
+                self.last_created_at = max(self.last_created_at, created_at)
+
+            if len(rows) < self.batch_size:
+                break
+            offset += self.batch_size
+
+        cutoff = self.last_created_at - self.overlap
+        self.published = {news_id: at for news_id, at in self.published.items() if at >= cutoff}
+        return published
+
+    async def run(self):
+        """메인 루프 (구독자가 없으면 조회하지 않음)"""
+        logger.info("📡 News relay started")
+        while True:
+            try:
+                if news_events.subscribers:
+                    await self.poll()
+                else:
+                    self.reset()
+            except Exception as e:
+                logger.error(f"Error relaying news events: {e}")
+            await asyncio.sleep(self.interval)
@@ -1,19 +1,46 @@
 """
 실시간 뉴스 스크래핑 서비스
 매 시간마다 자동으로 Yahoo Finance, Google News, SEC 공시에서 뉴스를 가져옴
+
+수집은 단계별 스트리밍 파이프라인으로 처리:
+discover(피드 조회) → dedup(중복 확인) → fetch(HTML 다운로드) → extract(본문 추출)
+→ score(영향도 점수) → persist(bulk upsert) → notify(실시간 전송)
 """
 import yfinance as yf
-import feedparser
-from datetime import datetime, timezone
-from app.database import db
+from datetime import datetime, timedelta, timezone
+from app.config import settings
+from app.database import db, upsert_news_batch
+from app.services.article_cache import article_cache
+from app.services.feed_cache import feed_cache, fetch_feed
+from app.services.http_client import get_http_client
+from app.services.impact_scorer import ImpactScorer
+from app.services.ingest_cursors import RunCheckpoint, ingest_cursors, newest_item
+from app.services.news_dedup import seen_urls
+from app.services.near_duplicates import near_duplicates
+from app.services.analysis_precompute import analysis_precomputer
+from app.services.news_events import publish_news
+from app.services.pipeline import Pipeline, PipelineJob, Stage
+from app.services.rate_limiter import rate_limiter, call_yfinance
 import logging
+import os
 import time
 from newspaper import Article
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
 
+# 피드별로 한 번에 처리할 최대 새 항목 수
+FEED_ITEM_LIMITS = {"yahoo": 5, "google": 5, "market": 3}
+
+# 커서보다 이만큼 이전에 게시된 항목도 다시 확인 (Google News는 관련도순이고 기사를 몇 시간 늦게 올리기도 함)
+CURSOR_LOOKBACK = timedelta(hours=settings.ingest_cursor_lookback_hours)
+
+# 전체 수집 실행 체크포인트에서 시장 뉴스 완료를 나타내는 키
+MARKET_CHECKPOINT_KEY = "__market__"
+
 
 def parse_rss_date(date_str):
     """RSS 날짜 형식을 파싱"""
@@ -30,14 +57,14 @@ def parse_rss_date(date_str):
             return datetime.now(timezone.utc).isoformat()
 
 
-def extract_full_article(url: str) -> dict:
+def parse_article_html(url: str, html: str) -> dict:
     """
-    URL에서 전문(full article)을 추출
+    HTML에서 기사 본문 추출 (CPU 작업 - 프로세스 풀에서 실행)
     Returns: {"content": str, "summary": str, "success": bool}
     """
     try:
         article = Article(url)
-        article.download()
+        article.download(input_html=html)
         article.parse()
 
         # 전문 추출
@@ -60,172 +87,282 @@ def extract_full_article(url: str) -> dict:
                 "summary": "",
                 "success": False
             }
+    except Exception as e:
+        logger.error(f"❌ Failed to parse article from {url}: {e}")
+        return {
+            "content": "",
+            "summary": "",
+            "success": False
+        }
+
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """기사 파싱용 프로세스 풀 (최초 호출 시 생성)"""
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=settings.article_parse_workers)
+    return _parse_pool
+
+
+def shutdown_parse_pool():
+    """앱 종료 시 프로세스 풀 정리"""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
+
+async def fetch_article_html(url: str) -> Optional[dict]:
+    """
+    기사 원본 HTML 가져오기 (디스크 캐시 우선, 없으면 공유 async HTTP 클라이언트로 다운로드)
+
+    Returns:
+        {"content_hash": str | None, "html": str, "extracted": dict | None} 또는 실패 시 None
+        (extracted는 현재 추출기 버전으로 캐시된 추출 결과)
+    """
+    cached = None
+    try:
+        cached = await asyncio.to_thread(article_cache.get_html, url)
+    except Exception as e:
+        logger.error(f"Error reading article cache for {url}: {e}")
+
+    if cached:
+        content_hash, html = cached
+        extracted = await asyncio.to_thread(article_cache.get_extracted, content_hash)
+        if extracted is not None:
+            logger.info(f"📦 Using cached article for {url[:80]}")
+        return {"content_hash": content_hash, "html": html, "extracted": extracted}
+
+    try:
+        await rate_limiter.acquire(url)
+        response = await get_http_client(url).get(url)
+        rate_limiter.record_response(url, response)
+        response.raise_for_status()
+        html = response.text
     except Exception as e:
         logger.error(f"❌ Failed to extract article from {url}: {e}")
+        return None
+
+    content_hash = None
+    try:
+        content_hash = await asyncio.to_thread(article_cache.put_html, url, html)
+    except Exception as e:
+        logger.error(f"Error writing article cache for {url}: {e}")
+
+    return {"content_hash": content_hash, "html": html, "extracted": None}
+
+
+async def parse_article(url: str, html: str, content_hash: Optional[str] = None) -> dict:
+    """
+    프로세스 풀에서 HTML 파싱 후 추출 결과를 캐시에 저장
+    (추출에 실패하면 캐시된 HTML을 지워 다음 시도에 다시 다운로드)
+    Returns: {"content": str, "summary": str, "success": bool}
+    """
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(get_parse_pool(), parse_article_html, url, html)
+
+    if content_hash:
+        try:
+            if result["success"]:
+                await asyncio.to_thread(article_cache.put_extracted, content_hash, result)
+            else:
+                await asyncio.to_thread(article_cache.forget, url)
+        except Exception as e:
+            logger.error(f"Error writing article cache for {url}: {e}")
+
+    return result
+
+
+async def extract_full_article(url: str) -> dict:
+    """
+    URL에서 전문(full article)을 추출
+
+    다운로드는 공유 async HTTP 클라이언트로, HTML 파싱은 프로세스 풀에서 수행하여
+    이벤트 루프를 막지 않음. 원본 HTML과 추출 결과는 디스크 캐시에 저장되어
+    같은 기사를 다시 처리할 때(재시도, 추출기 변경 등) 네트워크 요청 없이 재사용
+    Returns: {"content": str, "summary": str, "success": bool}
+    """
+    fetched = await fetch_article_html(url)
+    if fetched is None:
         return {
             "content": "",
             "summary": "",
             "success": False
         }
+    if fetched["extracted"] is not None:
+        return fetched["extracted"]
+    return await parse_article(url, fetched["html"], fetched["content_hash"])
+
+
+def fetch_yahoo_news_items(symbol: str) -> list:
+    """yfinance 뉴스 목록 조회 (블로킹 호출 - 스레드에서 실행)"""
+    stock = yf.Ticker(symbol)
+    return stock.news if hasattr(stock, 'news') else []
 
 
-async def scrape_yahoo_finance_news(ticker: str, stock_id: str):
-    """Yahoo Finance에서 뉴스 가져오기 (전문 추출)"""
-    news_added = 0
+def parse_yahoo_news_item(item: dict) -> tuple:
+    """
+    yfinance 뉴스 항목에서 (content 객체, 제목, URL) 추출
+    새로운 Yahoo Finance API 구조 (content 객체 안에 데이터가 있음)
+    """
+    content_obj = item.get('content', item)  # 호환성을 위해 fallback
+
+    title = content_obj.get('title', '')
+    url_obj = content_obj.get('clickThroughUrl') or content_obj.get('canonicalUrl')
+    url = url_obj.get('url', '') if url_obj else content_obj.get('link', '')
+
+    return content_obj, title, url
 
+
+def yahoo_candidate(item: dict, stock_id: str, ticker: Optional[str], feed: tuple, default_publisher: str) -> Optional[dict]:
+    """yfinance 뉴스 항목 → 파이프라인 후보 (제목이 없으면 None)"""
+    content_obj, title, url = parse_yahoo_news_item(item)
+    if not title or not url:
+        return None
+
+    # 날짜 파싱 (새로운 형식: pubDate 또는 displayTime)
+    pub_date = content_obj.get('pubDate') or content_obj.get('displayTime')
     try:
-        stock = yf.Ticker(ticker)
-        news_items = stock.news if hasattr(stock, 'news') else []
-
-        for item in news_items[:5]:  # 최근 5개만
-            try:
-                # 새로운 Yahoo Finance API 구조 (content 객체 안에 데이터가 있음)
-                content_obj = item.get('content', item)  # 호환성을 위해 fallback
-
-                title = content_obj.get('title', '')
-                url_obj = content_obj.get('clickThroughUrl') or content_obj.get('canonicalUrl')
-                url = url_obj.get('url', '') if url_obj else content_obj.get('link', '')
-
-                if not title or not url:
-                    continue
-
-                # 이미 존재하는지 확인
-                existing = db.client.table("news").select("id").eq("url", url).execute()
-                if existing.data:
-                    continue
-
-                # 날짜 파싱 (새로운 형식: pubDate 또는 displayTime)
-                pub_date = content_obj.get('pubDate') or content_obj.get('displayTime')
-                if pub_date:
-                    published_at = datetime.fromisoformat(pub_date.replace('Z', '+00:00')).isoformat()
-                else:
-                    published_at = datetime.now(timezone.utc).isoformat()
-
-                # Publisher 정보 추출
-                provider = content_obj.get('provider', {})
-                publisher = provider.get('displayName', 'Yahoo Finance') if isinstance(provider, dict) else 'Yahoo Finance'
-
-                # 전문 추출
-                logger.info(f"📰 Extracting full article from {url[:80]}...")
-                article_data = extract_full_article(url)
-
-                # 전문 추출에 실패하면 요약본 사용
-                if article_data["success"]:
-                    content = article_data["content"]
-                    summary = article_data["summary"]
-                else:
-                    # Fallback: Yahoo Finance API의 summary 사용 (새로운 구조)
-                    fallback_summary = content_obj.get('summary', content_obj.get('description', title))
-                    content = fallback_summary
-                    summary = fallback_summary[:500] if len(fallback_summary) > 500 else fallback_summary
-                    logger.warning(f"⚠️ Using fallback summary for {url[:80]}")
-
-                # 영향도 점수 계산
-                impact_score = calculate_impact_score(title, content)
-
-                # 데이터베이스에 저장
-                news_data = {
-                    "stock_id": stock_id,
-                    "title": title,
-                    "content": content,
-                    "summary": summary,
-                    "url": url,
-                    "source": publisher,
-                    "published_at": published_at,
-                    "impact_score": impact_score,
-                    "created_at": datetime.now(timezone.utc).isoformat()
-                }
-
-                result = db.client.table("news").insert(news_data).execute()
-                if result.data:
-                    logger.info(f"✅ Added Yahoo Finance news for {ticker}: {title[:50]}")
-                    news_added += 1
-
-            except Exception as e:
-                logger.error(f"Error processing Yahoo Finance news item for {ticker}: {e}")
-                continue
+        published_at = datetime.fromisoformat(pub_date.replace('Z', '+00:00')).isoformat()
+    except (AttributeError, ValueError):
+        published_at = datetime.now(timezone.utc).isoformat()
+
+    # Publisher 정보 추출
+    provider = content_obj.get('provider', {})
+    publisher = provider.get('displayName', default_publisher) if isinstance(provider, dict) else default_publisher
+
+    return {
+        "url": url,
+        "title": title,
+        "stock_id": stock_id,
+        "ticker": ticker,
+        "feed": feed,
+        "source": publisher,
+        "published_at": published_at,
+        # 전문 추출에 실패하면 사용할 요약 (새로운 구조)
+        "fallback_summary": content_obj.get('summary') or content_obj.get('description') or title,
+    }
+
+
+def skip_near_duplicate(candidate: dict) -> bool:
+    """
+    게시 시각이 가까운 유사 기사가 이미 수집되었는지 확인 (candidate["signatures"]로 비교)
 
+    있으면 URL을 처리 완료로 표시 (전문 추출, 점수 계산, 저장, 요약을 모두 건너뜀)
+
+    Returns:
+        bool: 건너뛰어야 하면 True
+    """
+    url, title = candidate["url"], candidate["title"]
+    canonical_url = near_duplicates.match(candidate["signatures"], candidate["published_at"])
+    if not canonical_url or canonical_url == url:
+        return False
+
+    seen_urls.mark_seen([url])
+    logger.info(f"🧬 Skipping near-duplicate of {canonical_url[:60]}: {title[:50]}")
+    return True
+
+
+async def discover_yahoo_finance_news(ticker: str, stock_id: str) -> list:
+    """Yahoo Finance 뉴스 목록에서 후보 기사 찾기"""
+    try:
+        news_items = await call_yfinance(lambda: fetch_yahoo_news_items(ticker))
     except Exception as e:
         logger.error(f"Error fetching Yahoo Finance news for {ticker}: {e}")
+        return []
 
-    return news_added
+    candidates = []
+    for item in news_items:
+        try:
+            candidate = yahoo_candidate(item, stock_id, ticker, ("yahoo", ticker), 'Yahoo Finance')
+            if candidate:
+                candidates.append(candidate)
+        except Exception as e:
+            logger.error(f"Error processing Yahoo Finance news item for {ticker}: {e}")
+    return candidates
 
 
-async def scrape_google_news_rss(ticker: str, company_name: str, stock_id: str):
-    """Google News RSS에서 뉴스 가져오기 (전문 추출)"""
-    news_added = 0
+async def discover_google_news_rss(ticker: str, company_name: str, stock_id: str, feed_urls: Optional[list] = None) -> list:
+    """
+    Google News RSS에서 후보 기사 찾기
 
+    Args:
+        feed_urls: 새 내용을 가져온 피드 URL을 기록할 목록
+            (후보를 모두 저장한 뒤 feed_cache.commit()해야 다음 실행에서 같은 피드를 건너뜀)
+    """
     try:
         # Google News RSS URL
         search_query = f"{ticker} OR {company_name} stock"
         encoded_query = quote(search_query)
         rss_url = f"https://news.google.com/rss/search?q={encoded_query}&hl=en-US&gl=US&ceid=US:en"
 
-        feed = feedparser.parse(rss_url)
-
-        for entry in feed.entries[:5]:  # 최근 5개만
-            try:
-                title = entry.get('title', '')
-                link = entry.get('link', '')
-
-                if not title or not link:
-                    continue
-
-                # 이미 존재하는지 확인
-                existing = db.client.table("news").select("id").eq("url", link).execute()
-                if existing.data:
-                    continue
-
-                # 날짜 파싱
-                published = entry.get('published', '')
-                published_at = parse_rss_date(published) if published else datetime.now(timezone.utc).isoformat()
-
-                source = entry.source.title if hasattr(entry, 'source') and hasattr(entry.source, 'title') else 'Google News'
-
-                # 전문 추출
-                logger.info(f"📰 Extracting full article from {link[:80]}...")
-                article_data = extract_full_article(link)
-
-                # 전문 추출에 실패하면 요약본 사용
-                if article_data["success"]:
-                    content = article_data["content"]
-                    summary = article_data["summary"]
-                else:
-                    # Fallback: RSS의 summary 사용
-                    fallback_summary = entry.get('summary', title)
-                    content = fallback_summary
-                    summary = fallback_summary[:500] if len(fallback_summary) > 500 else fallback_summary
-                    logger.warning(f"⚠️ Using fallback summary for {link[:80]}")
-
-                # 영향도 점수 계산
-                impact_score = calculate_impact_score(title, content)
-
-                # 데이터베이스에 저장
-                news_data = {
-                    "stock_id": stock_id,
-                    "title": title,
-                    "content": content,
-                    "summary": summary,
-                    "url": link,
-                    "source": source,
-                    "published_at": published_at,
-                    "impact_score": impact_score,
-                    "created_at": datetime.now(timezone.utc).isoformat()
-                }
-
-                result = db.client.table("news").insert(news_data).execute()
-                if result.data:
-                    logger.info(f"✅ Added Google News for {ticker}: {title[:50]}")
-                    news_added += 1
-
-            except Exception as e:
-                logger.error(f"Error processing Google News item for {ticker}: {e}")
-                continue
-
+        # 조건부 요청 - 피드가 바뀌지 않았으면 건너뜀
+        feed = await fetch_feed(rss_url)
+        if feed is None:
+            return []
+        if feed_urls is not None:
+            feed_urls.append(rss_url)
     except Exception as e:
         logger.error(f"Error fetching Google News for {ticker}: {e}")
+        return []
+
+    candidates = []
+    for entry in feed.entries:
+        title = entry.get('title', '')
+        link = entry.get('link', '')
+        if not title or not link:
+            continue
+
+        # 날짜 파싱
+        published = entry.get('published', '')
+        published_at = parse_rss_date(published) if published else datetime.now(timezone.utc).isoformat()
+
+        source = entry.source.title if hasattr(entry, 'source') and hasattr(entry.source, 'title') else 'Google News'
+
+        candidates.append({
+            "url": link,
+            "title": title,
+            "stock_id": stock_id,
+            "ticker": ticker,
+            "feed": ("google", ticker),
+            "source": source,
+            "published_at": published_at,
+            # 전문 추출에 실패하면 RSS의 summary 사용
+            "fallback_summary": entry.get('summary') or title,
+        })
+    return candidates
+
+
+async def discover_market_news(stock_id: str) -> list:
+    """
+    주요 지수(S&P 500, Nasdaq, Dow Jones) 관련 뉴스에서 후보 기사 찾기
+    시장 전체 뉴스는 첫 번째 종목의 stock_id로 저장
+    """
+    candidates = []
 
-    return news_added
+    # 주요 시장 지수 심볼
+    market_indices = ['^GSPC', '^IXIC', '^DJI']  # S&P 500, Nasdaq, Dow Jones
+
+    for index_symbol in market_indices:
+        try:
+            logger.info(f"📰 Fetching market news from {index_symbol}...")
+            news_items = await call_yfinance(lambda: fetch_yahoo_news_items(index_symbol))
+
+            for item in news_items:
+                candidate = yahoo_candidate(item, stock_id, None, ("market", index_symbol), 'Market News')
+                if candidate:
+                    candidates.append(candidate)
+
+        except Exception as e:
+            logger.error(f"Error fetching news from {index_symbol}: {e}")
+
+    return candidates
+
+
+impact_scorer = ImpactScorer(settings.impact_keyword_tiers)
 
 
 def calculate_impact_score(title: str, content: str) -> int:
@@ -233,35 +370,264 @@ def calculate_impact_score(title: str, content: str) -> int:
     뉴스의 영향도 점수 계산 (1-5)
     높은 점수 = 시장 전체에 영향을 주는 중요 뉴스
     """
-    title_lower = title.lower()
-    content_lower = content.lower()
+    return impact_scorer.score(title, content)
+
+
+def calculate_impact_scores(articles: list) -> list:
+    """
+    여러 뉴스의 영향도 점수를 한 번에 계산
+
+    Args:
+        articles: (제목, 본문) 목록
+
+    Returns:
+        list: 점수 목록 (입력 순서 유지)
+    """
+    return impact_scorer.score_many(articles)
+
+
+def select_new_candidates(candidates: list, task: dict) -> list:
+    """
+    피드별로 커서 이후의 새 항목만 최대 개수까지 선택
+
+    선택된 항목 중 가장 최근 것을 작업의 커서 갱신 목록에 기록
+    (작업의 모든 항목이 처리된 뒤에 저장되므로, 중간에 재시작되면 같은 항목부터 다시 처리)
+
+    커서 기준은 CURSOR_LOOKBACK만큼 여유를 두므로 늦게 올라온 기사도 선택되고,
+    이미 저장된 URL은 개수 제한을 차지하지 않도록 여기서 먼저 제외 (DB 확인은 dedup 단계)
+    """
+    feeds = {}
+    for candidate in candidates:
+        feeds.setdefault(candidate["feed"], []).append(candidate)
+
+    selected = []
+    for (source, key), items in feeds.items():
+        fresh = [
+            c for c in items
+            if c["url"] not in seen_urls
+            and ingest_cursors.is_new(source, key, c["published_at"], c["url"], CURSOR_LOOKBACK)
+        ][:FEED_ITEM_LIMITS[source]]
+
+        newest = newest_item(fresh)
+        if newest:
+            task["cursors"][(source, key)] = newest
+        for candidate in fresh:
+            candidate["task"] = task
+        selected.extend(fresh)
+
+    return selected
+
+
+def release_candidate(candidate: dict):
+    """
+    처리 중 오류로 버려진 후보의 URL을 다음 실행에서 다시 시도할 수 있게 해제
+    (커서도 전진하지 않도록 작업을 실패로 표시)
+    """
+    seen_urls.release(candidate["url"])
+    candidate["task"]["failed"] = True
+
+
+def build_ingest_pipeline() -> Pipeline:
+    """
+    뉴스 수집 파이프라인 구성
 
-    # 높은 영향도 키워드 (점수 5)
-    high_impact_keywords = [
-        'federal reserve', 'fed', 'interest rate', 'inflation', 'recession',
-        'sec', 'regulation', 'policy', 'earnings report', 'market crash',
-        'economic', 'gdp', 'unemployment', 'forex', 'exchange rate',
-        'trade war', 'tariff', 'geopolitical', 'bank crisis'
-    ]
+    각 단계는 자기 큐와 동시 실행 수를 가지므로 다운로드가 느려도 중복 확인/점수 계산이
+    멈추지 않고, 저장 단계가 밀리면 앞 단계가 큐 크기만큼만 쌓인 뒤 대기함
+    """
+    yahoo_limit = asyncio.Semaphore(settings.scrape_yahoo_concurrency)
+    google_limit = asyncio.Semaphore(settings.scrape_google_concurrency)
+
+    async def discover(task: dict) -> list:
+        """종목/시장 작업 → 커서 이후의 후보 기사 목록 (소스별 동시 요청 수 제한)"""
+        if task["kind"] == "market":
+            return select_new_candidates(await discover_market_news(task["stock_id"]), task)
+
+        stock = task["stock"]
+        ticker = stock['ticker']
+        company_name = stock.get('company_name', ticker)
+        logger.info(f"📰 Fetching news for {ticker} ({company_name})...")
+
+        async def run_yahoo():
+            async with yahoo_limit:
+                return await discover_yahoo_finance_news(ticker, stock['id'])
+
+        async def run_google():
+            async with google_limit:
+                return await discover_google_news_rss(ticker, company_name, stock['id'], task["feeds"])
+
+        yahoo_candidates, google_candidates = await asyncio.gather(run_yahoo(), run_google())
+        return select_new_candidates(yahoo_candidates + google_candidates, task)
+
+    async def dedup(candidates: list) -> list:
+        """이미 수집한 URL(한 번의 IN 쿼리)과 제목이 유사한 기사 제외 (다운로드 전)"""
+        new_urls = set(await seen_urls.filter_new([c["url"] for c in candidates]))
+
+        # 제목 서명은 새 URL만 한 번 계산 (본문 서명은 전문 추출 후)
+        fresh = [c for c in candidates if c["url"] in new_urls]
+        for candidate, signatures in zip(fresh, await near_duplicates.compute([(c["title"], None) for c in fresh])):
+            candidate["signatures"] = signatures
+
+        results = []
+        for candidate in candidates:
+            url = candidate["url"]
+            if url not in new_urls or skip_near_duplicate(candidate):
+                results.append(None)
+                continue
+            new_urls.discard(url)  # 같은 배치에 같은 URL이 또 있으면 한 번만 처리
+            results.append(candidate)
+        return results
+
+    async def fetch(candidate: dict) -> list:
+        logger.info(f"📰 Extracting full article from {candidate['url'][:80]}...")
+        candidate["fetched"] = await fetch_article_html(candidate["url"])
+        return [candidate]
+
+    async def extract(candidate: dict) -> list:
+        """본문 추출 (실패하면 피드 요약 사용) 후 본문 기준 유사 기사 확인"""
+        url = candidate["url"]
+        fetched = candidate.pop("fetched")
+        if fetched is None:
+            article_data = {"success": False}
+        elif fetched["extracted"] is not None:
+            article_data = fetched["extracted"]
+        else:
+            article_data = await parse_article(url, fetched["html"], fetched["content_hash"])
 
-    # 중간 영향도 키워드 (점수 4)
-    medium_impact_keywords = [
-        'analyst', 'upgrade', 'downgrade', 'price target', 'market outlook',
-        'sector', 'industry', 'merger', 'acquisition', 'ipo'
-    ]
+        if article_data["success"]:
+            candidate["content"] = article_data["content"]
+            candidate["summary"] = article_data["summary"]
+        else:
+            fallback_summary = candidate["fallback_summary"]
+            candidate["content"] = fallback_summary
+            candidate["summary"] = fallback_summary[:500]
+            logger.warning(f"⚠️ Using fallback summary for {url[:80]}")
+
+        # 본문 서명은 프로세스 풀에서 계산해 점수 단계의 인덱스 등록에도 그대로 사용
+        if candidate["content"]:
+            computed = await near_duplicates.compute([(None, candidate["content"])], get_parse_pool())
+            candidate["signatures"] = (candidate["signatures"][0], computed[0][1])
+        if skip_near_duplicate(candidate):
+            return []
+        return [candidate]
+
+    async def score(candidates: list) -> list:
+        scores = calculate_impact_scores([(c["title"], c["content"]) for c in candidates])
+        for candidate, impact_score in zip(candidates, scores):
+            candidate["row"] = {
+                "stock_id": candidate["stock_id"],
+                "title": candidate["title"],
+                "content": candidate["content"],
+                "summary": candidate["summary"],
+                "url": candidate["url"],
+                "source": candidate["source"],
+                "published_at": candidate["published_at"],
+                "impact_score": impact_score,
+                # created_at은 DB가 insert 시점에 채움 (NewsRelay가 이 값으로 새 row를 읽음)
+            }
+            near_duplicates.add(candidate["url"], candidate["signatures"], candidate["published_at"])
+        return candidates
 
-    # 제목에 높은 영향도 키워드 포함
-    for keyword in high_impact_keywords:
-        if keyword in title_lower or keyword in content_lower[:500]:
-            return 5
+    async def persist(candidates: list) -> list:
+        """
+        한 번의 bulk upsert로 저장
 
-    # 제목에 중간 영향도 키워드 포함
-    for keyword in medium_impact_keywords:
-        if keyword in title_lower:
-            return 4
+        URL 기준으로 충돌 시 무시하므로 동시에 도는 실행이 있어도 중복 row가 생기지 않음
+        실제로 추가된 뉴스만 다음 단계로 전달
+        """
+        rows = [c["row"] for c in candidates]
+        try:
+            inserted = {row["url"]: row for row in await upsert_news_batch(rows)}
+            seen_urls.mark_seen(row["url"] for row in rows)
+        except Exception as e:
+            logger.error(f"Error saving {len(rows)} news rows: {e}")
+            for candidate in candidates:
+                near_duplicates.discard(candidate["url"])
+                candidate["task"]["failed"] = True
+            inserted = {}
+        finally:
+            for row in rows:
+                seen_urls.release(row["url"])
+
+        results = []
+        for candidate in candidates:
+            row = inserted.get(candidate["url"])
+            if row:
+                candidate["row"] = row
+            results.append(candidate if row else None)
+        return results
+
+    async def notify(candidate: dict) -> list:
+        row, ticker = candidate["row"], candidate["ticker"]
+        logger.info(f"✅ Added {row.get('source')} news for {ticker or 'market'}: {row.get('title', '')[:50]}")
+        publish_news(row, ticker)
+        analysis_precomputer.enqueue(row, ticker)
+        return [row]
+
+    queue_size = settings.pipeline_queue_size
+    return Pipeline("news-ingest", [
+        Stage("discover", discover, concurrency=settings.scrape_max_concurrency, queue_size=queue_size,
+              on_error=lambda task: task.update(failed=True)),
+        Stage("dedup", dedup, queue_size=queue_size, batch_size=50, on_error=release_candidate),
+        Stage("fetch", fetch, concurrency=settings.pipeline_fetch_concurrency, queue_size=queue_size,
+              on_error=release_candidate),
+        Stage("extract", extract, concurrency=settings.article_parse_workers or os.cpu_count() or 1,
+              queue_size=queue_size, on_error=release_candidate),
+        Stage("score", score, queue_size=queue_size, batch_size=50, on_error=release_candidate),
+        Stage("persist", persist, queue_size=queue_size, batch_size=settings.pipeline_persist_batch_size,
+              batch_timeout=0.5, on_error=release_candidate),
+        Stage("notify", notify, queue_size=queue_size),
+    ])
+
+
+_ingest_pipeline: Optional[Pipeline] = None
+
+
+def get_ingest_pipeline() -> Pipeline:
+    """뉴스 수집 파이프라인 (최초 호출 시 생성 및 시작)"""
+    global _ingest_pipeline
+    if _ingest_pipeline is None:
+        _ingest_pipeline = build_ingest_pipeline()
+        _ingest_pipeline.start()
+    return _ingest_pipeline
+
+
+async def stop_ingest_pipeline():
+    """앱 종료 시 파이프라인 작업자 정리"""
+    global _ingest_pipeline
+    if _ingest_pipeline is not None:
+        await _ingest_pipeline.stop()
+        _ingest_pipeline = None
+
+
+def log_pipeline_metrics():
+    if _ingest_pipeline is None:
+        return
+    for name, m in _ingest_pipeline.metrics().items():
+        logger.info(
+            f"🚰 {name}: {m['processed']} in / {m['emitted']} out, {m['dropped']} dropped, "
+            f"{m['errors']} errors, {m['queued']} queued, avg {m['avg_ms']}ms (x{m['concurrency']})"
+        )
+
+
+def new_ingest_task(kind: str, **fields) -> dict:
+    """파이프라인 작업 (커서 갱신 목록, 새로 가져온 피드, 실패 여부를 함께 추적)"""
+    return {"kind": kind, "cursors": {}, "feeds": [], "failed": False, **fields}
+
+
+async def run_ingest_task(task: dict, job: PipelineJob) -> list:
+    """
+    작업을 파이프라인에 넣고 모든 항목이 처리될 때까지 대기
 
-    # 기본 점수
-    return 3
+    실패한 항목이 없을 때만 커서와 피드 검증값을 반영 (실패하면 다음 실행에서 같은 항목부터 재시도)
+    """
+    await get_ingest_pipeline().submit(task, job)
+    news_rows = await job.wait()
+    if not task["failed"]:
+        await ingest_cursors.advance(task["cursors"])
+        feed_cache.commit(task["feeds"])
+    else:
+        feed_cache.discard(task["feeds"])
+    return news_rows
 
 
 async def scrape_hot_market_news():
@@ -270,8 +636,6 @@ async def scrape_hot_market_news():
     주요 지수(S&P 500, Nasdaq, Dow Jones) 관련 뉴스를 수집하여
     시장 전체에 영향을 주는 중요 뉴스를 제공
     """
-    news_added = 0
-
     try:
         # 첫 번째 종목을 기본 stock_id로 사용
         stocks_result = db.client.table("stocks").select("id").limit(1).execute()
@@ -279,96 +643,60 @@ async def scrape_hot_market_news():
             logger.warning("No stocks in database for hot news")
             return 0
 
-        default_stock_id = stocks_result.data[0]['id']
-
-        # 주요 시장 지수 심볼
-        market_indices = ['^GSPC', '^IXIC', '^DJI']  # S&P 500, Nasdaq, Dow Jones
-
-        for index_symbol in market_indices:
-            try:
-                logger.info(f"📰 Fetching market news from {index_symbol}...")
-                stock = yf.Ticker(index_symbol)
-                news_items = stock.news if hasattr(stock, 'news') else []
-
-                for item in news_items[:3]:  # 각 지수당 3개
-                    try:
-                        # Yahoo Finance API 구조
-                        content_obj = item.get('content', item)
-
-                        title = content_obj.get('title', '')
-                        url_obj = content_obj.get('clickThroughUrl') or content_obj.get('canonicalUrl')
-                        url = url_obj.get('url', '') if url_obj else content_obj.get('link', '')
-
-                        if not title or not url:
-                            continue
-
-                        # 중복 확인
-                        existing = db.client.table("news").select("id").eq("url", url).execute()
-                        if existing.data:
-                            continue
-
-                        # 날짜 파싱
-                        pub_date = content_obj.get('pubDate') or content_obj.get('displayTime')
-                        if pub_date:
-                            published_at = datetime.fromisoformat(pub_date.replace('Z', '+00:00')).isoformat()
-                        else:
-                            published_at = datetime.now(timezone.utc).isoformat()
-
-                        # Publisher 정보
-                        provider = content_obj.get('provider', {})
-                        publisher = provider.get('displayName', 'Market News') if isinstance(provider, dict) else 'Market News'
-
-                        # 전문 추출
-                        logger.info(f"📰 Extracting market news from {url[:80]}...")
-                        article_data = extract_full_article(url)
-
-                        if article_data["success"]:
-                            content = article_data["content"]
-                            summary = article_data["summary"]
-                        else:
-                            fallback_summary = content_obj.get('summary', content_obj.get('description', title))
-                            content = fallback_summary
-                            summary = fallback_summary[:500] if len(fallback_summary) > 500 else fallback_summary
-
-                        # 영향도 점수 계산
-                        impact_score = calculate_impact_score(title, content)
-
-                        news_data = {
-                            "stock_id": default_stock_id,
-                            "title": title,
-                            "content": content,
-                            "summary": summary[:500],
-                            "url": url,
-                            "source": publisher,
-                            "published_at": published_at,
-                            "impact_score": impact_score,
-                            "created_at": datetime.now(timezone.utc).isoformat()
-                        }
-
-                        result = db.client.table("news").insert(news_data).execute()
-                        if result.data:
-                            logger.info(f"✅ Added market news (impact: {impact_score}): {title[:50]}")
-                            news_added += 1
-
-                    except Exception as e:
-                        logger.error(f"Error processing market news from {index_symbol}: {e}")
-                        continue
-
-                await asyncio.sleep(1)  # Rate limiting
-
-            except Exception as e:
-                logger.error(f"Error fetching news from {index_symbol}: {e}")
-
-        logger.info(f"🔥 Added {news_added} market news articles")
+        task = new_ingest_task("market", stock_id=stocks_result.data[0]['id'])
+        news_added = len(await run_ingest_task(task, PipelineJob("market")))
 
     except Exception as e:
         logger.error(f"Error in scrape_hot_market_news: {e}")
+        return 0
 
+    logger.info(f"🔥 Added {news_added} market news articles")
     return news_added
 
 
+async def warm_dedup_caches():
+    """최근 URL / 유사 기사 인덱스 워밍, 수집 커서 로드 (프로세스 시작 후 첫 실행 시)"""
+    if not ingest_cursors.loaded:
+        await ingest_cursors.load()
+    if not seen_urls.warmed:
+        await seen_urls.warm()
+    if not near_duplicates.warmed:
+        await near_duplicates.warm(executor=get_parse_pool())
+
+
+async def scrape_ticker_news(stock: dict) -> dict:
+    """
+    한 종목에 대한 스크래핑 작업 (파이프라인에 넣고 모든 기사가 처리될 때까지 대기)
+
+    Args:
+        stock: stocks 테이블 row
+
+    Returns:
+        dict: {"ticker": str, "news_added": int, "elapsed": float}
+    """
+    job = PipelineJob(stock['ticker'])
+    news_rows = await run_ingest_task(new_ingest_task("ticker", stock=stock), job)
+
+    return {
+        "ticker": stock['ticker'],
+        "news_added": len(news_rows),
+        "elapsed": job.elapsed
+    }
+
+
 async def fetch_all_news():
-    """모든 종목에 대해 뉴스를 가져오는 메인 함수"""
+    """
+    모든 종목에 대해 뉴스를 가져오는 메인 함수
+
+    모든 종목 작업을 파이프라인에 한꺼번에 넣고, 단계별 동시 실행 수와 큐 크기로 부하를 제한함
+    (전체 소요 시간 ≈ 가장 느린 단계의 처리량으로 결정)
+
+    완료된 종목은 실행 체크포인트에 기록되어, 도중에 프로세스가 재시작되면
+    남은 종목만 이어서 처리함
+
+    Returns:
+        dict: 실행 리포트 (추가된 뉴스 수, 전체 소요 시간, 가장 느린 종목 등)
+    """
     logger.info("🔄 Starting news scraping job...")
 
     try:
@@ -380,32 +708,56 @@ async def fetch_all_news():
             logger.warning("No stocks found in database")
             return
 
-        total_news_added = 0
-
-        # 핫한 시장 뉴스 먼저 수집
-        logger.info("🔥 Fetching hot market news...")
-        hot_news_count = await scrape_hot_market_news()
-        total_news_added += hot_news_count
+        run_started = time.perf_counter()
 
-        for stock in stocks:
-            ticker = stock['ticker']
-            stock_id = stock['id']
-            company_name = stock.get('company_name', ticker)
+        await warm_dedup_caches()
 
-            logger.info(f"📰 Fetching news for {ticker} ({company_name})...")
+        checkpoint = RunCheckpoint("fetch_all_news")
+        completed = await checkpoint.start()
+        remaining = [stock for stock in stocks if stock['ticker'] not in completed]
 
-            # Yahoo Finance에서 뉴스 가져오기
-            yahoo_count = await scrape_yahoo_finance_news(ticker, stock_id)
-            total_news_added += yahoo_count
+        async def run_market():
+            if MARKET_CHECKPOINT_KEY in completed:
+                return 0
+            news_added = await scrape_hot_market_news()
+            checkpoint.complete_ticker(MARKET_CHECKPOINT_KEY)
+            return news_added
 
-            # Google News에서 뉴스 가져오기
-            google_count = await scrape_google_news_rss(ticker, company_name, stock_id)
-            total_news_added += google_count
+        async def run_ticker(stock):
+            report = await scrape_ticker_news(stock)
+            checkpoint.complete_ticker(stock['ticker'])
+            return report
 
-            # Rate limiting 방지를 위한 딜레이
-            await asyncio.sleep(2)
+        # 핫한 시장 뉴스와 종목별 뉴스를 동시에 수집
+        logger.info("🔥 Fetching hot market news...")
+        hot_news_task = asyncio.create_task(run_market())
+        ticker_reports = await asyncio.gather(*[run_ticker(stock) for stock in remaining])
+        hot_news_count = await hot_news_task
+        await checkpoint.finish()
+
+        total_news_added = hot_news_count + sum(r["news_added"] for r in ticker_reports)
+        wall_time = time.perf_counter() - run_started
+        slowest = max(ticker_reports, key=lambda r: r["elapsed"], default={"ticker": None, "elapsed": 0.0})
+        sequential_time = sum(r["elapsed"] for r in ticker_reports)
+
+        logger.info(
+            f"✨ News scraping completed! Added {total_news_added} new articles "
+            f"({len(remaining)} tickers in {wall_time:.1f}s, {len(stocks) - len(remaining)} resumed as done, "
+            f"slowest {slowest['ticker']} {slowest['elapsed']:.1f}s, "
+            f"sum of tickers {sequential_time:.1f}s)"
+        )
+        log_pipeline_metrics()
 
-        logger.info(f"✨ News scraping completed! Added {total_news_added} new articles")
+        return {
+            "news_added": total_news_added,
+            "tickers": len(remaining),
+            "resumed_tickers": len(stocks) - len(remaining),
+            "wall_time": wall_time,
+            "slowest_ticker": slowest["ticker"],
+            "slowest_time": slowest["elapsed"],
+            "sequential_time": sequential_time,
+            "stages": get_ingest_pipeline().metrics(),
+        }
 
     except Exception as e:
         logger.error(f"Error in fetch_all_news: {e}")
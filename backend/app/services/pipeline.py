@@ -0,0 +1,188 @@
+"""
+스트리밍 처리 파이프라인
+단계(Stage)들을 크기 제한이 있는 async 큐로 연결하고, 단계별로 동시 실행 수와 처리 지표를 따로 관리
+
+다음 단계의 큐가 가득 차면 현재 단계의 작업자가 대기하므로(backpressure),
+느린 단계가 있어도 앞 단계가 무한정 쌓이지 않음
+"""
+from typing import Any, Awaitable, Callable, List, Optional
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineJob:
+    """
+    파이프라인에 넣은 작업 하나 (예: 종목 하나)
+
+    작업에서 파생된 모든 항목이 마지막 단계를 통과하거나 중간에 버려지면 완료됨
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.outstanding = 0
+        self.results: List[Any] = []
+        self.started = time.perf_counter()
+        self.elapsed: Optional[float] = None
+        self.done = asyncio.Event()
+
+    def add(self, count: int = 1):
+        self.outstanding += count
+
+    def finish(self, count: int = 1):
+        self.outstanding -= count
+        if self.outstanding <= 0 and not self.done.is_set():
+            self.elapsed = time.perf_counter() - self.started
+            self.done.set()
+
+    async def wait(self) -> List[Any]:
+        await self.done.wait()
+        return self.results
+
+
+class Stage:
+    """
+    파이프라인 단계
+
+    Args:
+        name: 단계 이름 (지표 표시용)
+        handler: 항목 하나를 받아 다음 단계로 보낼 항목 목록을 반환 (빈 목록 = 버림, 여러 개 = 분기).
+            batch_size > 1이면 항목 목록을 받아 입력 순서대로 결과(없으면 None)를 반환
+        concurrency: 동시에 실행할 작업자 수
+        queue_size: 입력 큐 크기 (가득 차면 앞 단계가 대기)
+        batch_size: 한 번에 처리할 최대 항목 수
+        batch_timeout: 배치를 채우기 위해 기다리는 최대 시간 (초)
+        on_error: 처리 중 예외가 나서 버려지는 항목의 정리 함수
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], Awaitable[Any]],
+        concurrency: int = 1,
+        queue_size: int = 100,
+        batch_size: int = 1,
+        batch_timeout: float = 0.2,
+        on_error: Optional[Callable[[Any], None]] = None,
+    ):
+        self.name = name
+        self.handler = handler
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.on_error = on_error
+        self.queue: Optional[asyncio.Queue] = None
+
+        # 지표
+        self.processed = 0
+        self.emitted = 0
+        self.dropped = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+
+    def metrics(self) -> dict:
+        return {
+            "concurrency": self.concurrency,
+            "queued": self.queue.qsize() if self.queue else 0,
+            "processed": self.processed,
+            "emitted": self.emitted,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "avg_ms": round(self.busy_seconds / self.processed * 1000, 1) if self.processed else 0.0,
+        }
+
+
+class Pipeline:
+    """단계들을 순서대로 연결한 파이프라인"""
+
+    def __init__(self, name: str, stages: List[Stage]):
+        self.name = name
+        self.stages = stages
+        self.workers: List[asyncio.Task] = []
+
+    def start(self):
+        """단계별 작업자 시작 (실행 중인 이벤트 루프 안에서 호출)"""
+        for stage in self.stages:
+            stage.queue = asyncio.Queue(maxsize=stage.queue_size)
+        for index, stage in enumerate(self.stages):
+            for _ in range(stage.concurrency):
+                self.workers.append(asyncio.create_task(self._worker(index)))
+        logger.info(f"🚰 Pipeline '{self.name}' started: " + " → ".join(
+            f"{s.name}(x{s.concurrency})" for s in self.stages
+        ))
+
+    async def stop(self):
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    async def submit(self, payload: Any, job: PipelineJob):
+        """첫 단계에 항목 추가 (큐가 가득 차면 대기)"""
+        job.add(1)
+        await self.stages[0].queue.put((job, payload))
+
+    def metrics(self) -> dict:
+        return {stage.name: stage.metrics() for stage in self.stages}
+
+    async def _next_batch(self, stage: Stage) -> list:
+        batch = [await stage.queue.get()]
+        if stage.batch_size > 1:
+            deadline = time.monotonic() + stage.batch_timeout
+            while len(batch) < stage.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(stage.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+        return batch
+
+    async def _emit(self, index: int, job: PipelineJob, outputs: list):
+        """처리 결과를 다음 단계로 전달 (마지막 단계면 작업 결과에 추가)"""
+        stage = self.stages[index]
+        stage.emitted += len(outputs)
+        if not outputs:
+            stage.dropped += 1
+        if index + 1 < len(self.stages):
+            job.add(len(outputs))
+            for output in outputs:
+                await self.stages[index + 1].queue.put((job, output))
+        else:
+            job.results.extend(outputs)
+        job.finish(1)
+
+    async def _worker(self, index: int):
+        stage = self.stages[index]
+        while True:
+            batch = await self._next_batch(stage)
+            started = time.perf_counter()
+            try:
+                if stage.batch_size > 1:
+                    results = await stage.handler([payload for _, payload in batch])
+                    outputs = [[result] if result is not None else [] for result in results]
+                else:
+                    job, payload = batch[0]
+                    outputs = [list(await stage.handler(payload) or [])]
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in pipeline stage '{stage.name}': {e}")
+                stage.errors += len(batch)
+                outputs = [[] for _ in batch]
+                if stage.on_error:
+                    for _, payload in batch:
+                        try:
+                            stage.on_error(payload)
+                        except Exception:
+                            pass
+            finally:
+                stage.busy_seconds += time.perf_counter() - started
+                stage.processed += len(batch)
+
+            for (job, _), job_outputs in zip(batch, outputs):
+                await self._emit(index, job, job_outputs)
@@ -0,0 +1,144 @@
+"""
+호스트별 토큰 버킷 Rate Limiter
+고정 sleep 대신 업스트림 호스트(Yahoo, Google News, SEC, 기사 발행처)별로 요청 속도를 제한하고,
+429 응답을 받으면 해당 호스트의 속도를 자동으로 낮춤
+"""
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+from app.config import settings
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# yfinance가 내부적으로 호출하는 호스트
+YFINANCE_HOST = "query2.finance.yahoo.com"
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷 (429 시 속도 감소 후 서서히 회복)"""
+
+    def __init__(self, rate: float, burst: int):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def penalize(self, retry_after: Optional[float] = None):
+        """429 응답 시: 속도를 절반으로 줄이고 Retry-After 동안 요청 중단"""
+        now = time.monotonic()
+        self.rate = max(self.base_rate * 0.1, self.rate * 0.5)
+        self.tokens = 0.0
+        self.updated_at = now
+        self.blocked_until = max(self.blocked_until, now + (retry_after or 1.0 / self.rate))
+
+    def reward(self):
+        """정상 응답 시: 원래 속도까지 조금씩 회복"""
+        if self.rate < self.base_rate:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * 0.05)
+
+
+def host_key(url_or_host: str) -> str:
+    """
+    URL 또는 호스트명을 rate limit 키로 변환 (도메인 마지막 두 부분)
+
+    예: https://query2.finance.yahoo.com/... → yahoo.com, www.sec.gov → sec.gov
+    """
+    host = urlparse(url_or_host).hostname if "://" in url_or_host else url_or_host
+    host = (host or url_or_host).lower()
+    parts = host.split(".")
+    return ".".join(parts[-2:]) if len(parts) > 2 else host
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """호스트별 토큰 버킷 레지스트리"""
+
+    def __init__(self, limits: Dict[str, Dict[str, float]], default_rate: float, default_burst: int):
+        self.limits = limits
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, url_or_host: str) -> TokenBucket:
+        key = host_key(url_or_host)
+        if key not in self.buckets:
+            limit = self.limits.get(key, {})
+            self.buckets[key] = TokenBucket(
+                rate=limit.get("rate", self.default_rate),
+                burst=int(limit.get("burst", self.default_burst)),
+            )
+        return self.buckets[key]
+
+    async def acquire(self, url_or_host: str):
+        """요청 전에 호출 - 해당 호스트의 토큰이 생길 때까지 대기"""
+        await self.bucket(url_or_host).acquire()
+
+    def penalize(self, url_or_host: str, retry_after: Optional[float] = None):
+        bucket = self.bucket(url_or_host)
+        bucket.penalize(retry_after)
+        logger.warning(f"🐢 Rate limited by {host_key(url_or_host)}, slowing down to {bucket.rate:.2f} req/s")
+
+    def record_response(self, url: str, response):
+        """HTTP 응답 결과 반영 (429면 속도 감소, 아니면 회복)"""
+        if response.status_code == 429:
+            self.penalize(url, parse_retry_after(response.headers.get("Retry-After")))
+        else:
+            self.bucket(url).reward()
+
+
+rate_limiter = RateLimiter(
+    settings.rate_limits,
+    settings.rate_limit_default_rate,
+    settings.rate_limit_default_burst,
+)
+
+
+async def call_yfinance(func: Callable[[], Any]) -> Any:
+    """
+    yfinance 호출을 Yahoo rate limit을 거쳐 스레드에서 실행
+
+    Args:
+        func: yfinance를 호출하는 블로킹 함수 (예: lambda: yf.Ticker("AAPL").info)
+
+    Returns:
+        func의 반환값
+    """
+    await rate_limiter.acquire(YFINANCE_HOST)
+    try:
+        result = await asyncio.to_thread(func)
+    except Exception as e:
+        if type(e).__name__ == "YFRateLimitError":
+            rate_limiter.penalize(YFINANCE_HOST)
+        raise
+    rate_limiter.bucket(YFINANCE_HOST).reward()
+    return result
@@ -0,0 +1,250 @@
+"""
+종목별 뉴스 스크래핑 스케줄러
+모든 종목을 매 시간 한꺼번에 가져오는 대신, 종목마다 다음 수집 시각을 따로 계산해
+우선순위 큐(다음 수집 시각 순)로 실행
+
+수집 주기는 최근 기사 유입 속도, 관심종목 등록 수, 장 운영 시간에 따라 달라지며
+전체 요청 수는 구간별 예산으로 제한됨
+
+종목별 유입 속도 / 마지막 수집 시각 / 다음 수집 시각은 ticker_schedule 테이블에 저장되어
+프로세스가 재시작되어도 모든 종목을 한꺼번에 다시 수집하지 않고 이전 스케줄을 이어감
+"""
+from collections import Counter, deque
+from datetime import datetime, timezone, time as dt_time
+from typing import Dict, Optional, Set
+from zoneinfo import ZoneInfo
+from app.config import settings
+from app.database import db
+from app.services.ingest_cursors import parse_timestamp
+from app.services.news_scraper import scrape_ticker_news, warm_dedup_caches
+import asyncio
+import heapq
+import logging
+import math
+import time
+
+logger = logging.getLogger(__name__)
+
+MARKET_TZ = ZoneInfo("America/New_York")
+MARKET_OPEN = dt_time(9, 30)
+MARKET_CLOSE = dt_time(16, 0)
+
+# 기사 유입 속도(시간당 기사 수) EWMA 가중치
+VELOCITY_ALPHA = 0.3
+
+# 종목 목록 / 관심종목 수 갱신 주기 (초)
+STOCKS_REFRESH_SECONDS = 600
+
+# 변경된 스케줄 상태를 모아서 저장하는 주기 (초)
+STATE_SAVE_SECONDS = 30
+
+
+def is_market_hours(now: Optional[datetime] = None) -> bool:
+    """미국 정규장 시간 여부 (월-금 09:30-16:00 ET)"""
+    now = (now or datetime.now(MARKET_TZ)).astimezone(MARKET_TZ)
+    return now.weekday() < 5 and MARKET_OPEN <= now.time() < MARKET_CLOSE
+
+
+def to_iso(timestamp: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat() if timestamp else None
+
+
+def to_epoch(value: Optional[str]) -> Optional[float]:
+    parsed = parse_timestamp(value)
+    return parsed.timestamp() if parsed else None
+
+
+class TickerScheduler:
+    """종목별 다음 수집 시각 기반 우선순위 큐 스케줄러"""
+
+    def __init__(self):
+        self.queue = []  # (다음 수집 시각, ticker) heap
+        self.tickers: Dict[str, dict] = {}  # ticker → {"stock", "velocity", "watchers", "last_polled_at", "next_poll_at"}
+        self.running = set()
+        self.poll_tasks: Set[asyncio.Task] = set()  # 실행 중인 poll 태스크 (GC 방지 + 종료 시 취소)
+        self.poll_times = deque()  # 예산 구간 내 수집 시각
+        self.stocks_refreshed_at = 0.0
+        self.saved: Dict[str, dict] = {}  # ticker → 저장된 스케줄 상태 (아직 종목 목록에 반영 전)
+        self.dirty: Set[str] = set()  # 저장할 스케줄 상태가 바뀐 종목
+        self.state_saved_at = 0.0
+
+    def next_interval(self, state: dict) -> float:
+        """
+        다음 수집까지의 간격 (초)
+
+        기본 간격을 기사 유입 속도와 관심종목 수로 나누고, 장외 시간에는 늘림
+        """
+        interval = settings.scrape_base_interval_minutes * 60
+        interval /= 1 + state["velocity"]
+        interval /= 1 + math.log2(1 + state["watchers"])
+        if not is_market_hours():
+            interval *= settings.scrape_off_hours_multiplier
+
+        return min(max(interval, settings.scrape_min_interval_minutes * 60), settings.scrape_max_interval_minutes * 60)
+
+    def schedule(self, ticker: str, at: float):
+        self.tickers[ticker]["next_poll_at"] = at
+        heapq.heappush(self.queue, (at, ticker))
+
+    async def load_state(self):
+        """이전 프로세스가 저장한 종목별 스케줄 상태 불러오기"""
+        try:
+            result = await asyncio.to_thread(lambda: db.client.table("ticker_schedule").select("*").execute())
+            self.saved = {row["ticker"]: row for row in result.data or []}
+            logger.info(f"🗓️ Loaded saved schedule for {len(self.saved)} tickers")
+        except Exception as e:
+            logger.error(f"Error loading ticker schedule: {e}")
+
+    async def save_state(self):
+        """바뀐 종목별 스케줄 상태를 한 번의 upsert로 저장 (실패하면 다음 주기에 다시 시도)"""
+        self.state_saved_at = time.time()
+        rows = [
+            {
+                "ticker": ticker,
+                "velocity": self.tickers[ticker]["velocity"],
+                "last_polled_at": to_iso(self.tickers[ticker]["last_polled_at"]),
+                "next_poll_at": to_iso(self.tickers[ticker]["next_poll_at"]),
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            }
+            for ticker in self.dirty if ticker in self.tickers
+        ]
+        self.dirty = set()
+        if not rows:
+            return
+        try:
+            await asyncio.to_thread(
+                lambda: db.client.table("ticker_schedule").upsert(rows, on_conflict="ticker").execute()
+            )
+        except Exception as e:
+            logger.error(f"Error saving ticker schedule: {e}")
+            self.dirty.update(row["ticker"] for row in rows)
+
+    async def refresh_stocks(self):
+        """stocks / user_stocks 테이블에서 종목 목록과 관심종목 등록 수 갱신"""
+        try:
+            stocks_result = await asyncio.to_thread(lambda: db.client.table("stocks").select("*").execute())
+            watch_result = await asyncio.to_thread(lambda: db.client.table("user_stocks").select("stock_id").execute())
+        except Exception as e:
+            logger.error(f"Error refreshing scheduler stocks: {e}")
+            return
+
+        watchers = Counter(row["stock_id"] for row in watch_result.data or [])
+        stocks = {stock["ticker"]: stock for stock in stocks_result.data or []}
+        now = time.time()
+
+        for ticker, stock in stocks.items():
+            if ticker in self.tickers:
+                self.tickers[ticker]["stock"] = stock
+                self.tickers[ticker]["watchers"] = watchers.get(stock["id"], 0)
+            else:
+                # 저장된 스케줄이 있으면 이어서, 없으면 (새 종목) 바로 수집
+                saved = self.saved.pop(ticker, {})
+                self.tickers[ticker] = {
+                    "stock": stock,
+                    "velocity": saved.get("velocity") or 0.0,
+                    "watchers": watchers.get(stock["id"], 0),
+                    "last_polled_at": to_epoch(saved.get("last_polled_at")),
+                    "next_poll_at": None,
+                }
+                self.schedule(ticker, to_epoch(saved.get("next_poll_at")) or now)
+
+        for ticker in set(self.tickers) - set(stocks):
+            del self.tickers[ticker]
+
+        self.stocks_refreshed_at = now
+
+    async def wait_for_budget(self):
+        """구간별 전체 수집 예산을 넘지 않도록 대기"""
+        window = settings.scrape_budget_window_minutes * 60
+        while True:
+            now = time.time()
+            while self.poll_times and self.poll_times[0] <= now - window:
+                self.poll_times.popleft()
+            if len(self.poll_times) < settings.scrape_budget_per_window:
+                self.poll_times.append(now)
+                return
+            await asyncio.sleep(self.poll_times[0] + window - now)
+
+    async def poll(self, ticker: str):
+        """종목 하나 수집 후 유입 속도 갱신 및 재스케줄"""
+        state = self.tickers.get(ticker)
+        if not state:
+            return
+
+        try:
+            report = await scrape_ticker_news(state["stock"])
+            news_added = report["news_added"]
+        except Exception as e:
+            logger.error(f"Error polling {ticker}: {e}")
+            news_added = 0
+        finally:
+            self.running.discard(ticker)
+
+        if ticker not in self.tickers:
+            return
+
+        now = time.time()
+        if state["last_polled_at"]:
+            hours = max((now - state["last_polled_at"]) / 3600, 1 / 60)
+            state["velocity"] = VELOCITY_ALPHA * (news_added / hours) + (1 - VELOCITY_ALPHA) * state["velocity"]
+        state["last_polled_at"] = now
+
+        interval = self.next_interval(state)
+        self.schedule(ticker, now + interval)
+        self.dirty.add(ticker)
+        logger.info(
+            f"🗓️ {ticker}: +{news_added} articles, velocity {state['velocity']:.2f}/h, "
+            f"{state['watchers']} watchers → next poll in {interval / 60:.0f}m"
+        )
+
+    async def run(self):
+        """스케줄러 메인 루프"""
+        logger.info("🗓️ Ticker scrape scheduler started")
+        await warm_dedup_caches()
+        await self.load_state()
+
+        while True:
+            try:
+                if time.time() - self.stocks_refreshed_at > STOCKS_REFRESH_SECONDS:
+                    await self.refresh_stocks()
+
+                if self.dirty and time.time() - self.state_saved_at > STATE_SAVE_SECONDS:
+                    await self.save_state()
+
+                if not self.queue:
+                    await asyncio.sleep(60)
+                    continue
+
+                next_at, ticker = self.queue[0]
+                delay = next_at - time.time()
+                if delay > 0:
+                    await asyncio.sleep(min(delay, 30))
+                    continue
+
+                heapq.heappop(self.queue)
+                state = self.tickers.get(ticker)
+                # 삭제된 종목이거나 다시 스케줄된 이전 항목이면 무시
+                if not state or state["next_poll_at"] != next_at or ticker in self.running:
+                    continue
+
+                await self.wait_for_budget()
+                self.running.add(ticker)
+                task = asyncio.create_task(self.poll(ticker))
+                self.poll_tasks.add(task)
+                task.add_done_callback(self.poll_tasks.discard)
+
+            except Exception as e:
+                logger.error(f"Error in scrape scheduler loop: {e}")
+                await asyncio.sleep(5)
+
+    async def stop(self):
+        """실행 중인 poll 태스크 취소 후 종료 대기, 바뀐 스케줄 상태 저장"""
+        tasks = list(self.poll_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.running.clear()
+        await self.save_state()
+
+
+ticker_scheduler = TickerScheduler()
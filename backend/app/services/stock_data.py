@@ -3,6 +3,7 @@ from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import asyncio
 import math
+from app.services.rate_limiter import call_yfinance
 
 
 def clean_float(value):
@@ -31,11 +32,9 @@ async def get_income_statement(ticker: str, period: str = "annual") -> Dict:
     """
     try:
         stock = yf.Ticker(ticker)
-
-        if period == "quarterly":
-            income_stmt = stock.quarterly_income_stmt
-        else:
-            income_stmt = stock.income_stmt
+        income_stmt = await call_yfinance(
+            lambda: stock.quarterly_income_stmt if period == "quarterly" else stock.income_stmt
+        )
 
         if income_stmt is None or income_stmt.empty:
             return {"error": "No income statement data available"}
@@ -73,11 +72,9 @@ async def get_balance_sheet(ticker: str, period: str = "annual") -> Dict:
     """
     try:
         stock = yf.Ticker(ticker)
-
-        if period == "quarterly":
-            balance_sheet = stock.quarterly_balance_sheet
-        else:
-            balance_sheet = stock.balance_sheet
+        balance_sheet = await call_yfinance(
+            lambda: stock.quarterly_balance_sheet if period == "quarterly" else stock.balance_sheet
+        )
 
         if balance_sheet is None or balance_sheet.empty:
             return {"error": "No balance sheet data available"}
@@ -115,11 +112,9 @@ async def get_cash_flow(ticker: str, period: str = "annual") -> Dict:
     """
     try:
         stock = yf.Ticker(ticker)
-
-        if period == "quarterly":
-            cash_flow = stock.quarterly_cashflow
-        else:
-            cash_flow = stock.cashflow
+        cash_flow = await call_yfinance(
+            lambda: stock.quarterly_cashflow if period == "quarterly" else stock.cashflow
+        )
 
         if cash_flow is None or cash_flow.empty:
             return {"error": "No cash flow data available"}
@@ -170,7 +165,7 @@ async def get_historical_prices(
             start_date = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
 
         stock = yf.Ticker(ticker)
-        history = stock.history(start=start_date, end=end_date, interval=interval)
+        history = await call_yfinance(lambda: stock.history(start=start_date, end=end_date, interval=interval))
 
         if history is None or history.empty:
             return {"error": "No historical price data available"}
@@ -212,7 +207,7 @@ async def get_key_metrics(ticker: str) -> Dict:
     """
     try:
         stock = yf.Ticker(ticker)
-        info = stock.info
+        info = await call_yfinance(lambda: stock.info)
 
         metrics = {
             "ticker": ticker,
@@ -258,10 +253,7 @@ async def get_realtime_price(ticker: str) -> Dict:
     """
     try:
         stock = yf.Ticker(ticker)
-        info = stock.info
-
-        # Get recent history for price change calculation
-        hist = stock.history(period="5d", interval="1d")
+        info = await call_yfinance(lambda: stock.info)
 
         current_price = info.get('currentPrice') or info.get('regularMarketPrice')
         previous_close = info.get('previousClose')
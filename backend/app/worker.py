@@ -0,0 +1,92 @@
+"""
+뉴스 수집 워커 (API 서버와 별도 프로세스)
+종목별 스크래핑 스케줄러, 시장 뉴스 정기 수집, SEC 최신 공시 감시, 고영향 뉴스 AI 분석 사전 생성을 실행
+
+실행: python -m app.worker
+"""
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from app.config import settings
+from app.services.analysis_precompute import analysis_precomputer
+from app.services.edgar_watcher import edgar_watcher
+from app.services.news_scraper import scrape_hot_market_news, shutdown_parse_pool, stop_ingest_pipeline, warm_dedup_caches
+from app.services.scrape_scheduler import ticker_scheduler
+from app.services.http_client import open_http_clients, close_http_clients
+import asyncio
+import logging
+import signal
+
+logger = logging.getLogger(__name__)
+
+scheduler = AsyncIOScheduler()
+_tasks = []
+
+
+async def start_worker():
+    """스크래핑 스케줄러 시작 (워커 프로세스 또는 API 프로세스 내장 모드에서 호출)"""
+    # 수집 작업을 시작하기 전에 최근 URL / 유사 기사 인덱스 / 수집 커서를 먼저 불러옴
+    # (로드 전에 수집하면 이미 저장된 기사를 다시 처리하거나, 전진한 커서를 로드가 덮어씀)
+    await warm_dedup_caches()
+
+    # 종목별 뉴스 스크래핑 스케줄러 (종목마다 기사 유입 속도에 따라 주기 조정)
+    _tasks.append(asyncio.create_task(ticker_scheduler.run()))
+
+    # SEC 공시: 전체 최신 공시 피드를 주기적으로 조회해 추적 종목의 공시만 저장
+    if settings.sec_watch_enabled:
+        _tasks.append(asyncio.create_task(edgar_watcher.run()))
+
+    # 영향도가 높은 새 뉴스의 AI 상세 분석을 미리 생성해 news 테이블에 저장
+    if settings.ai_precompute_enabled:
+        _tasks.append(asyncio.create_task(analysis_precomputer.run()))
+
+    # 시장 전체 뉴스는 매 시간 정각에 실행 (예: 1:00, 2:00, 3:00...)
+    scheduler.add_job(
+        scrape_hot_market_news,
+        'cron',
+        minute=0,  # 매 시간 0분에 실행
+        id='hot_news_scraper',
+        name='Hourly Market News Scraper',
+        replace_existing=True
+    )
+
+    # 시작 시 바로 한 번 실행
+    logger.info("🔄 Running initial market news fetch...")
+    _tasks.append(asyncio.create_task(scrape_hot_market_news()))
+
+    scheduler.start()
+    logger.info("⏰ News scraper scheduler started (tickers by news velocity, market news every hour at :00)")
+
+
+async def stop_worker():
+    if scheduler.running:
+        scheduler.shutdown()
+    for task in _tasks:
+        task.cancel()
+    await asyncio.gather(*_tasks, return_exceptions=True)
+    _tasks.clear()
+    await ticker_scheduler.stop()
+    await stop_ingest_pipeline()
+    shutdown_parse_pool()
+
+
+async def main():
+    logger.info("🛠️ News worker starting...")
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            pass  # Windows
+
+    open_http_clients()
+    await start_worker()
+    await stop_event.wait()
+
+    logger.info("👋 News worker shutting down...")
+    await stop_worker()
+    await close_http_clients()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
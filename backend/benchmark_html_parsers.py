@@ -0,0 +1,170 @@
+"""
+HTML 파서 백엔드 벤치마크 (selectolax / lxml / BeautifulSoup)
+저장해 둔 Yahoo 기사 페이지와 SEC 공시 문서로 추출 시간과 결과 일치 여부를 비교
+
+사용법:
+    python benchmark_html_parsers.py --fetch AAPL MSFT   # 코퍼스 저장 (Yahoo 기사 + SEC 8-K 문서)
+    python benchmark_html_parsers.py                     # 저장된 코퍼스로 비교
+    python benchmark_html_parsers.py --repeat 5
+
+코퍼스 위치: {cache_dir}/html_corpus/yahoo/*.html, {cache_dir}/html_corpus/sec/*.html
+결과 일치 여부는 BeautifulSoup(html.parser) 결과를 기준으로 비교
+"""
+import argparse
+import asyncio
+import glob
+import hashlib
+import os
+import time
+import feedparser
+from app.config import settings
+from app.scrapers.html_parser import available_backends, get_html_backend
+from app.scrapers.sec_edgar import edgar_client
+from app.services.http_client import get_http_client, close_http_clients
+from app.services.rate_limiter import rate_limiter
+
+CORPUS_DIR = os.path.join(settings.cache_dir, "html_corpus")
+REFERENCE_BACKEND = "bs4"
+
+# 코퍼스와 별도로 항상 확인하는 경계 사례 (이름, 추출 방식, HTML)
+EQUIVALENCE_CASES = [
+    ("comment in paragraph", "yahoo", '<div class="caas-body"><p>first para<!-- ad slot --> continues</p></div>'),
+    ("comment between blocks", "sec", "<body><p>visible</p><!-- tracking -->after comment</body>"),
+    ("template in body", "yahoo", '<div class="caas-body"><p>shown</p><template><p>hidden</p></template>tail</div>'),
+    ("template in document", "sec", "<body><template><p>hidden</p></template><p>visible</p></body>"),
+    ("script and style", "sec", "<head><style>p{}</style></head><body><p>a<script>x=1</script>b</p></body>"),
+    ("nested inline tags", "yahoo", '<div class="caas-body"><p>a <b>b<i>i</i></b> tail</p></div>'),
+]
+
+# 코퍼스 종류 → 비교할 추출 방식
+EXTRACTORS = {
+    "yahoo": lambda backend, html: backend.article_text(html),
+    "sec": lambda backend, html: backend.document_text(html),
+}
+
+
+async def save_page(url: str, kind: str):
+    await rate_limiter.acquire(url)
+    response = await get_http_client(url).get(url)
+    rate_limiter.record_response(url, response)
+    response.raise_for_status()
+
+    name = hashlib.sha1(url.encode()).hexdigest()[:16]
+    path = os.path.join(CORPUS_DIR, kind, f"{name}.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(response.text)
+    print(f"  💾 {kind}: {url} ({len(response.text) / 1024:.0f} KB)")
+
+
+async def fetch_corpus(tickers):
+    """종목별 Yahoo RSS 기사 페이지와 최근 8-K 문서를 코퍼스로 저장"""
+    for kind in EXTRACTORS:
+        os.makedirs(os.path.join(CORPUS_DIR, kind), exist_ok=True)
+
+    for ticker in tickers:
+        print(f"\n📥 Fetching corpus for {ticker}...")
+        rss_url = f"https://finance.yahoo.com/rss/headline?s={ticker}"
+        try:
+            response = await get_http_client(rss_url).get(rss_url)
+            feed = feedparser.parse(response.content)
+            for entry in feed.entries[:10]:
+                try:
+                    await save_page(entry.get('link', ''), "yahoo")
+                except Exception as e:
+                    print(f"  ❌ {entry.get('link', '')}: {e}")
+        except Exception as e:
+            print(f"  ❌ Yahoo RSS: {e}")
+
+        try:
+            for filing in await edgar_client.get_filings(ticker, ["8-K", "10-Q"], 2):
+                try:
+                    await save_page(filing["url"], "sec")
+                except Exception as e:
+                    print(f"  ❌ {filing['url']}: {e}")
+        except Exception as e:
+            print(f"  ❌ SEC filings: {e}")
+
+    await close_http_clients()
+
+
+def load_corpus(kind: str):
+    pages = []
+    for path in sorted(glob.glob(os.path.join(CORPUS_DIR, kind, "*.htm*"))):
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            pages.append((os.path.basename(path), f.read()))
+    return pages
+
+
+def check_equivalence(backends):
+    """경계 사례에서 백엔드별 결과를 기준 백엔드와 비교"""
+    if REFERENCE_BACKEND not in backends:
+        return
+    print("\n=== edge cases ===")
+    for name, kind, html in EQUIVALENCE_CASES:
+        expected = EXTRACTORS[kind](get_html_backend(REFERENCE_BACKEND), html)
+        different = [
+            backend for backend in backends
+            if EXTRACTORS[kind](get_html_backend(backend), html) != expected
+        ]
+        status = "✅" if not different else f"❌ differs: {', '.join(different)}"
+        print(f"  {name:<24} {status}")
+
+
+def run_benchmark(repeat: int):
+    backends = available_backends()
+    print(f"🔧 Backends: {', '.join(backends)}")
+    check_equivalence(backends)
+
+    for kind, extract in EXTRACTORS.items():
+        pages = load_corpus(kind)
+        if not pages:
+            print(f"\n⚠️  No {kind} pages in {os.path.join(CORPUS_DIR, kind)} (run with --fetch first)")
+            continue
+
+        total_kb = sum(len(html) for _, html in pages) / 1024
+        print(f"\n=== {kind}: {len(pages)} pages, {total_kb:.0f} KB ===")
+
+        outputs = {}
+        timings = {}
+        for name in backends:
+            backend = get_html_backend(name)
+            started = time.perf_counter()
+            for _ in range(repeat):
+                outputs[name] = [extract(backend, html) for _, html in pages]
+            timings[name] = (time.perf_counter() - started) / repeat
+
+        reference = outputs.get(REFERENCE_BACKEND)
+        baseline = timings.get(REFERENCE_BACKEND)
+        for name in backends:
+            line = f"  {name:<11} {timings[name] * 1000:9.1f} ms"
+            if baseline:
+                line += f"  ({baseline / timings[name]:5.1f}x vs {REFERENCE_BACKEND})"
+            if reference is not None and name != REFERENCE_BACKEND:
+                same = sum(1 for a, b in zip(outputs[name], reference) if a == b)
+                line += f"  identical {same}/{len(pages)}"
+            print(line)
+
+        # 결과가 다른 페이지 (파서마다 잘못된 HTML을 복구하는 방식이 달라 생길 수 있음)
+        if reference is not None:
+            for name in backends:
+                if name == REFERENCE_BACKEND:
+                    continue
+                for (filename, _), output, expected in zip(pages, outputs[name], reference):
+                    if output != expected:
+                        print(f"    ≠ {name} {filename}: {len(output)} chars vs {len(expected)} chars")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare HTML parser backends")
+    parser.add_argument("--fetch", nargs="*", metavar="TICKER", help="save Yahoo/SEC pages for these tickers first")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per backend (average reported)")
+    args = parser.parse_args()
+
+    if args.fetch is not None:
+        asyncio.run(fetch_corpus(args.fetch or ["AAPL", "MSFT", "NVDA"]))
+
+    run_benchmark(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+테스트 공통 설정
+- Supabase / 캐시 디렉터리는 테스트용 값으로 설정 (실제 DB, 네트워크에 접속하지 않음)
+- fake_db: db.client를 호출 기록용 가짜 클라이언트로 교체
+"""
+import os
+import tempfile
+
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+os.environ.setdefault("CACHE_DIR", tempfile.mkdtemp(prefix="news-cache-"))
+
+from types import SimpleNamespace
+import pytest
+from app.database import db
+
+
+class FakeQuery:
+    """Supabase 쿼리 빌더 흉내 (메서드 호출을 기록하고 execute()에서 응답 함수 호출)"""
+
+    def __init__(self, client, table: str):
+        self.client = client
+        self.table = table
+        self.calls = []
+
+    def __getattr__(self, method):
+        def call(*args, **kwargs):
+            self.calls.append((method, args, kwargs))
+            return self
+        return call
+
+    def execute(self):
+        self.client.queries.append(self)
+        if self.client.error:
+            raise self.client.error
+        return SimpleNamespace(data=self.client.respond(self))
+
+    def arg(self, method: str):
+        """method로 마지막에 넘긴 인자 (없으면 None)"""
+        for name, args, _ in reversed(self.calls):
+            if name == method:
+                return args
+        return None
+
+
+class FakeClient:
+    def __init__(self):
+        self.queries = []
+        self.error = None
+        self.respond = lambda query: []
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(db, "client", client)
+    return client
@@ -0,0 +1,87 @@
+"""기사 HTML / 추출 결과 디스크 캐시"""
+import os
+import random
+from app.services import article_cache as article_cache_module
+from app.services.article_cache import ArticleCache
+
+OK = {"content": "x" * 200, "summary": "x", "success": True}
+
+
+def disk_bytes(directory: str) -> int:
+    return sum(
+        entry.stat().st_size
+        for kind in ("html", "text")
+        for entry in os.scandir(os.path.join(directory, kind))
+    )
+
+
+def random_html(rng: random.Random) -> str:
+    return "".join(rng.choice("abcdefghij") for _ in range(8000))
+
+
+def test_size_limit_counts_compressed_files(tmp_path):
+    rng = random.Random(1)
+    cache = ArticleCache(str(tmp_path), 60_000)
+    for i in range(30):
+        cache.put_extracted(cache.put_html(f"https://a/{i}", random_html(rng)), OK)
+
+    assert cache.total_bytes == disk_bytes(str(tmp_path))
+    assert cache.total_bytes <= 60_000
+    assert cache.get_html("https://a/0") is None
+    assert cache.get_html("https://a/29") is not None
+
+    # 재시작 후에도 같은 크기
+    reopened = ArticleCache(str(tmp_path), 60_000)
+    assert reopened.get_html("https://a/29") is not None
+    assert reopened.total_bytes == cache.total_bytes
+
+
+def test_same_html_stored_once(tmp_path):
+    cache = ArticleCache(str(tmp_path), 10_000_000)
+    first = cache.put_html("https://a/1", "<p>same</p>")
+    assert cache.put_html("https://b/1", "<p>same</p>") == first
+    assert len(os.listdir(tmp_path / "html")) == 1
+
+    cache.forget("https://a/1")
+    assert cache.get_html("https://b/1") == (first, "<p>same</p>")
+
+
+def test_failed_extractions_not_cached(tmp_path):
+    cache = ArticleCache(str(tmp_path), 10_000_000)
+    content_hash = cache.put_html("https://a/1", "<p>consent page</p>")
+    cache.put_extracted(content_hash, {"content": "", "summary": "", "success": False})
+    assert cache.get_extracted(content_hash) is None
+
+    cache.put_extracted(content_hash, OK)
+    assert cache.get_extracted(content_hash) == OK
+
+    cache.forget("https://a/1")
+    assert cache.get_html("https://a/1") is None
+    assert cache.total_bytes == disk_bytes(str(tmp_path)) == 0
+
+
+def test_eviction_does_not_scan_text_directory(tmp_path, monkeypatch):
+    rng = random.Random(2)
+    cache = ArticleCache(str(tmp_path), 40_000)
+    cache.put_html("https://a/start", "<p>start</p>")
+
+    def no_scan(path):
+        raise AssertionError(f"scanned {path}")
+
+    monkeypatch.setattr(article_cache_module.os, "scandir", no_scan)
+    for i in range(20):
+        cache.put_extracted(cache.put_html(f"https://a/{i}", random_html(rng)), OK)
+    assert cache.total_bytes <= 40_000
+
+
+def test_old_extractor_versions_removed_on_start(tmp_path, monkeypatch):
+    cache = ArticleCache(str(tmp_path), 10_000_000)
+    content_hash = cache.put_html("https://a/1", "<p>article</p>")
+    cache.put_extracted(content_hash, OK)
+
+    monkeypatch.setattr(article_cache_module, "EXTRACTOR_VERSION", 2)
+    reopened = ArticleCache(str(tmp_path), 10_000_000)
+    assert reopened.get_html("https://a/1") == (content_hash, "<p>article</p>")
+    assert reopened.get_extracted(content_hash) is None
+    assert os.listdir(tmp_path / "text") == []
+    assert reopened.total_bytes == disk_bytes(str(tmp_path))
@@ -0,0 +1,81 @@
+"""EDGAR 최신 공시 감시"""
+import asyncio
+from app.services import edgar_watcher as watcher_module
+from app.services.edgar_watcher import EdgarWatcher
+
+FILINGS = {
+    "8-K": [
+        {"cik": 320193, "form": "8-K/A", "accession_number": "0000320193-26-000002",
+         "url": "https://sec/a2", "summary": "", "published_at": "2026-10-19T12:00:00Z"},
+        {"cik": 320193, "form": "8-K", "accession_number": "0000320193-26-000001",
+         "url": "https://sec/a1", "summary": "", "published_at": "2026-10-19T11:00:00Z"},
+    ],
+}
+
+
+def make_watcher(monkeypatch, tracked_error=None):
+    advanced, saved = [], []
+
+    async def fetch_latest_filings(form, start=0):
+        return FILINGS.get(form) if start == 0 else []
+
+    async def advance(updates):
+        advanced.append(updates)
+
+    async def filter_new(urls):
+        return urls
+
+    async def upsert_news_batch(rows):
+        saved.extend(rows)
+        return rows
+
+    async def get_cik(ticker):
+        if tracked_error:
+            raise tracked_error
+        return 320193
+
+    async def filing_details(filing):
+        return {"title": f"AAPL files {filing['form']}", "content": "x", "url": filing["url"]}
+
+    monkeypatch.setattr(watcher_module, "fetch_latest_filings", fetch_latest_filings)
+    monkeypatch.setattr(watcher_module.ingest_cursors, "is_new", lambda *args: True)
+    monkeypatch.setattr(watcher_module.ingest_cursors, "advance", advance)
+    monkeypatch.setattr(watcher_module.seen_urls, "filter_new", filter_new)
+    monkeypatch.setattr(watcher_module, "upsert_news_batch", upsert_news_batch)
+    monkeypatch.setattr(watcher_module, "publish_news", lambda row, ticker: None)
+    monkeypatch.setattr(watcher_module.analysis_precomputer, "enqueue", lambda row, ticker: None)
+    monkeypatch.setattr(watcher_module.edgar_client, "get_cik", get_cik)
+
+    watcher = EdgarWatcher()
+    monkeypatch.setattr(watcher, "filing_details", filing_details)
+    return watcher, advanced, saved
+
+
+def test_amendments_saved_and_cursor_advanced(monkeypatch, fake_db):
+    fake_db.respond = lambda q: [{"id": 1, "ticker": "AAPL"}]
+    watcher, advanced, saved = make_watcher(monkeypatch)
+
+    assert asyncio.run(watcher.poll()) == 2
+    assert [row["title"] for row in saved] == ["AAPL files 8-K/A", "AAPL files 8-K"]
+    assert all(row["impact_score"] >= 4 for row in saved)
+    assert advanced == [{("sec", "8-K"): ("2026-10-19T12:00:00Z", "0000320193-26-000002")}]
+
+
+def test_cursor_kept_when_watch_list_unavailable(monkeypatch, fake_db):
+    fake_db.error = RuntimeError("db down")
+    watcher, advanced, saved = make_watcher(monkeypatch)
+
+    assert asyncio.run(watcher.poll()) == 0
+    assert advanced == [] and saved == []
+
+
+def test_cursor_kept_when_watch_list_refresh_fails(monkeypatch, fake_db):
+    fake_db.respond = lambda q: [{"id": 1, "ticker": "AAPL"}]
+    watcher, advanced, saved = make_watcher(monkeypatch)
+    asyncio.run(watcher.refresh_tracked())
+
+    # 이전 목록으로 대조는 계속하지만 커서는 그대로
+    fake_db.error = RuntimeError("db down")
+    watcher.tracked_refreshed_at = 0.0
+    assert asyncio.run(watcher.poll()) == 2
+    assert advanced == []
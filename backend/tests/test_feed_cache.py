@@ -0,0 +1,69 @@
+"""RSS 피드 조건부 요청 캐시"""
+import asyncio
+import json
+import pytest
+from app.services import feed_cache as feed_cache_module
+from app.services.feed_cache import FeedCache
+
+ENTRY = {"etag": "v2", "last_modified": None, "content_hash": "h2"}
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(feed_cache_module, "SAVE_DELAY_SECONDS", 0)
+    cache = FeedCache(str(tmp_path / "feeds.json"))
+    cache.loaded = True
+    cache.entries = {"https://feed": {"etag": "v1", "last_modified": None, "content_hash": "h1"}}
+    return cache
+
+
+async def flush(cache: FeedCache):
+    if cache.save_task:
+        await cache.save_task
+
+
+def test_staged_validators_not_visible_until_commit(cache):
+    async def run():
+        cache.stage("https://feed", ENTRY)
+        assert (await cache.get("https://feed"))["etag"] == "v1"
+
+        cache.commit(["https://feed"])
+        assert (await cache.get("https://feed"))["etag"] == "v2"
+        await flush(cache)
+
+    asyncio.run(run())
+    with open(cache.path) as f:
+        assert json.load(f)["https://feed"] == ENTRY
+
+
+def test_discard_keeps_previous_validators(cache, tmp_path):
+    async def run():
+        cache.stage("https://feed", ENTRY)
+        cache.discard(["https://feed"])
+        cache.commit(["https://feed"])
+        assert (await cache.get("https://feed"))["etag"] == "v1"
+
+    asyncio.run(run())
+    assert not cache.pending
+    assert cache.save_task is None
+    assert not (tmp_path / "feeds.json").exists()
+
+
+def test_set_applies_immediately(cache):
+    async def run():
+        cache.stage("https://feed", ENTRY)
+        cache.set("https://feed", {**ENTRY, "etag": "v3"})
+        assert (await cache.get("https://feed"))["etag"] == "v3"
+        await flush(cache)
+
+    asyncio.run(run())
+    assert not cache.pending
+
+
+def test_load_missing_or_corrupt_file(tmp_path):
+    cache = FeedCache(str(tmp_path / "feeds.json"))
+    assert asyncio.run(cache.get("https://feed")) == {}
+
+    (tmp_path / "broken.json").write_text("{not json")
+    cache = FeedCache(str(tmp_path / "broken.json"))
+    assert asyncio.run(cache.get("https://feed")) == {}
@@ -0,0 +1,45 @@
+"""키워드 기반 영향도 점수"""
+from app.services.impact_scorer import ImpactScorer
+
+
+def test_default_score_without_keywords():
+    assert ImpactScorer().score("Company opens new office", "Nothing to see here") == 3
+
+
+def test_title_lead_keyword_matches_in_content():
+    assert ImpactScorer().score("Stocks move", "The Fed held rates steady.") == 5
+
+
+def test_title_only_keyword_ignored_in_content():
+    scorer = ImpactScorer()
+    assert scorer.score("Analyst raises price target", "") == 4
+    assert scorer.score("Stocks move", "An analyst raised the price target") == 3
+
+
+def test_word_boundaries():
+    scorer = ImpactScorer()
+    # "fed"가 "fedex" / "confederation" 안에서 매칭되지 않음
+    assert scorer.score("FedEx ships more parcels", "Confederation cup results") == 3
+    # 복수형은 같은 키워드
+    assert scorer.score("New tariffs announced", "") == 5
+
+
+def test_content_beyond_lead_ignored():
+    assert ImpactScorer().score("Stocks move", "x" * 600 + " inflation") == 3
+
+
+def test_phrase_does_not_span_title_and_content():
+    scorer = ImpactScorer()
+    assert scorer.score("market", "outlook") == 3
+    assert scorer.score("Market outlook for 2026", "") == 4
+
+
+def test_phrase_does_not_span_line_breaks():
+    scorer = ImpactScorer()
+    assert scorer.score("Stocks move", "interest\n\nrate") == 3
+    assert scorer.score("Interest  rates rise", "") == 5
+
+
+def test_custom_tiers_and_score_many():
+    scorer = ImpactScorer([{"score": 2, "fields": "title", "keywords": ["buyback"]}], default_score=1)
+    assert scorer.score_many([("Buyback announced", ""), ("Nothing", "")]) == [2, 1]
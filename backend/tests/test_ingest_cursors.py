@@ -0,0 +1,89 @@
+"""소스별 수집 커서"""
+import asyncio
+from datetime import timedelta
+from app.services.ingest_cursors import IngestCursors, newest_item, parse_timestamp
+
+CURSOR_AT = "2026-10-19T12:00:00+00:00"
+
+
+def make_cursors() -> IngestCursors:
+    cursors = IngestCursors()
+    cursors.cursors[("google", "AAPL")] = {"last_published_at": CURSOR_AT, "last_item_id": "https://a/1"}
+    return cursors
+
+
+def test_parse_timestamp():
+    assert parse_timestamp("2026-10-19T12:00:00Z").isoformat() == CURSOR_AT
+    assert parse_timestamp("2026-10-19T12:00:00").isoformat() == CURSOR_AT
+    assert parse_timestamp("not a date") is None
+    assert parse_timestamp(None) is None
+
+
+def test_is_new_without_cursor_or_date():
+    cursors = make_cursors()
+    assert cursors.is_new("google", "MSFT", "2020-01-01T00:00:00Z", "x")
+    assert cursors.is_new("google", "AAPL", None, "x")
+
+
+def test_is_new_compares_with_cursor():
+    cursors = make_cursors()
+    assert cursors.is_new("google", "AAPL", "2026-10-19T12:30:00Z", "https://a/2")
+    assert not cursors.is_new("google", "AAPL", "2026-10-19T11:00:00Z", "https://a/0")
+    # 같은 시각이면 항목 ID로 구분
+    assert not cursors.is_new("google", "AAPL", CURSOR_AT, "https://a/1")
+    assert cursors.is_new("google", "AAPL", CURSOR_AT, "https://a/3")
+
+
+def test_is_new_with_lookback():
+    cursors = make_cursors()
+    lookback = timedelta(hours=6)
+    assert cursors.is_new("google", "AAPL", "2026-10-19T08:00:00Z", "late", lookback)
+    assert not cursors.is_new("google", "AAPL", "2026-10-19T05:00:00Z", "old", lookback)
+
+
+def test_advance_never_moves_backwards(fake_db):
+    cursors = make_cursors()
+    asyncio.run(cursors.advance({
+        ("google", "AAPL"): ("2026-10-19T08:00:00Z", "late"),
+        ("google", "MSFT"): ("2026-10-19T09:00:00Z", "https://m/1"),
+    }))
+
+    (query,) = fake_db.queries
+    rows = query.arg("upsert")[0]
+    assert [(row["source"], row["ticker"]) for row in rows] == [("google", "MSFT")]
+    assert cursors.cursors[("google", "AAPL")]["last_published_at"] == CURSOR_AT
+
+
+def test_newest_item():
+    candidates = [
+        {"published_at": "2026-10-19T10:00:00Z", "url": "a"},
+        {"published_at": None, "url": "b"},
+        {"published_at": "2026-10-19T11:00:00Z", "url": "c"},
+    ]
+    assert newest_item(candidates) == ("2026-10-19T11:00:00Z", "c")
+    assert newest_item([{"published_at": None, "url": "b"}]) is None
+
+
+def test_run_checkpoint_batches_completed_tickers(fake_db, monkeypatch):
+    from app.services import ingest_cursors as ingest_cursors_module
+    from app.services.ingest_cursors import RunCheckpoint
+
+    monkeypatch.setattr(ingest_cursors_module, "CHECKPOINT_SAVE_SECONDS", 0.01)
+    fake_db.respond = lambda query: [{"id": "run-1"}] if query.arg("insert") else []
+    checkpoint = RunCheckpoint("fetch_all_news")
+
+    async def run():
+        assert await checkpoint.start() == set()
+        for ticker in ["MSFT", "AAPL", "NVDA"]:
+            checkpoint.complete_ticker(ticker)
+        await asyncio.sleep(0.05)
+        checkpoint.complete_ticker("TSLA")
+        await checkpoint.finish()
+
+    asyncio.run(run())
+
+    updates = [query.arg("update")[0] for query in fake_db.queries if query.arg("update")]
+    assert updates[0] == {"completed_tickers": ["AAPL", "MSFT", "NVDA"]}
+    assert updates[-1]["status"] == "completed"
+    assert updates[-1]["completed_tickers"] == ["AAPL", "MSFT", "NVDA", "TSLA"]
+    assert len(updates) == 2
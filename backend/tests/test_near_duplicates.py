@@ -0,0 +1,93 @@
+"""소스 간 유사 기사 탐지"""
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from app.services.near_duplicates import NearDuplicateDetector, minhash, shingles, signatures_many
+
+NOW = datetime.now(timezone.utc)
+
+ARTICLE = (
+    "Nvidia reported record quarterly revenue on Wednesday as demand for its data center chips "
+    "continued to outpace supply, and the company guided above analyst expectations for the next quarter. "
+    "Shares rose in extended trading after the results were published."
+)
+
+
+def at(hours: float = 0) -> str:
+    return (NOW + timedelta(hours=hours)).isoformat()
+
+
+def sig(title=None, content=None) -> tuple:
+    return signatures_many([(title, content)])[0]
+
+
+def test_shingles():
+    assert shingles("The quick brown fox", 2) == {"the quick", "quick brown", "brown fox"}
+    assert shingles("Fed", 3) == {"fed"}
+    assert minhash(set()) is None
+
+
+def test_signatures_without_title_or_content():
+    title_sig, content_sig = sig("Fed holds rates")
+    assert title_sig is not None and content_sig is None
+    assert sig(None, ARTICLE)[0] is None
+
+
+def test_same_headline_from_other_publisher_matches():
+    detector = NearDuplicateDetector()
+    detector.add("u1", sig("Nvidia earnings beat estimates as data center sales soar - Reuters"), at())
+    assert detector.match(sig("Nvidia earnings beat estimates as data center sales soar - Yahoo"), at(1)) == "u1"
+
+
+def test_headlines_differing_by_one_word_are_distinct():
+    detector = NearDuplicateDetector()
+    detector.add("u1", sig("Nvidia earnings: what to expect"), at())
+    assert detector.match(sig("Nvidia earnings: what to know"), at()) is None
+
+
+def test_matches_limited_to_publish_window():
+    detector = NearDuplicateDetector(window_hours=48)
+    detector.add("u1", sig("Nvidia earnings: what to expect", ARTICLE), at())
+    assert detector.match(sig("Nvidia earnings: what to expect"), at(72)) is None
+    assert detector.match(sig("Other title", ARTICLE), at(72)) is None
+    assert detector.match(sig("Other title", ARTICLE), at(24)) == "u1"
+
+
+def test_content_match_and_discard():
+    detector = NearDuplicateDetector()
+    detector.add("u1", sig("Title one", ARTICLE), at())
+    edited = sig("Different title", ARTICLE.replace("Wednesday", "Wednesday evening"))
+    assert detector.match(edited, at()) == "u1"
+
+    detector.discard("u1")
+    assert detector.match(edited, at()) is None
+    assert detector.match(sig("Title one"), at()) is None
+
+
+def test_index_size_limit_evicts_oldest():
+    detector = NearDuplicateDetector(max_size=2)
+    for i, title in enumerate(["Apple unveils new iPhone lineup", "Tesla recalls Model Y vehicles", "Amazon expands drone delivery"]):
+        detector.add(f"u{i}", sig(title), at())
+    assert detector.match(sig("Apple unveils new iPhone lineup"), at()) is None
+    assert detector.match(sig("Amazon expands drone delivery"), at()) == "u2"
+
+
+def test_compute_off_loop_matches_inline_signatures():
+    articles = [(f"Headline number {i} about markets", ARTICLE if i % 2 else None) for i in range(120)]
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        computed = asyncio.run(NearDuplicateDetector.compute(articles, pool))
+    assert computed == signatures_many(articles)
+
+
+def test_warm_loads_recent_rows(fake_db):
+    fake_db.respond = lambda query: [
+        {"url": "u2", "title": "Tesla recalls Model Y vehicles", "content": None, "published_at": at()},
+        {"url": "u1", "title": "Nvidia earnings", "content": ARTICLE, "published_at": at()},
+        {"url": None, "title": "missing url", "content": None, "published_at": at()},
+    ]
+    detector = NearDuplicateDetector()
+    asyncio.run(detector.warm())
+
+    assert detector.warmed
+    assert detector.match(sig("Tesla recalls Model Y vehicles"), at()) == "u2"
+    assert detector.match(sig("Other", ARTICLE), at()) == "u1"
@@ -0,0 +1,30 @@
+"""뉴스 후보 생성 (Yahoo Finance / Google News RSS)"""
+import asyncio
+from types import SimpleNamespace
+from app.services import news_scraper
+from app.services.news_scraper import discover_google_news_rss, yahoo_candidate
+
+
+def test_yahoo_candidate_falls_back_to_title_when_summary_missing():
+    item = {"content": {
+        "title": "Apple beats estimates",
+        "canonicalUrl": {"url": "https://finance.yahoo.com/a"},
+        "summary": None,
+        "description": "",
+    }}
+    candidate = yahoo_candidate(item, "stock-1", "AAPL", ("yahoo", "AAPL"), "Yahoo Finance")
+    assert candidate["fallback_summary"] == "Apple beats estimates"
+
+
+def test_google_candidate_falls_back_to_title_when_summary_missing(monkeypatch):
+    entries = [
+        {"title": "Apple beats estimates", "link": "https://news.google.com/a", "summary": None},
+        {"title": "Apple guides lower", "link": "https://news.google.com/b"},
+    ]
+
+    async def fetch_feed(url):
+        return SimpleNamespace(entries=entries)
+
+    monkeypatch.setattr(news_scraper, "fetch_feed", fetch_feed)
+    candidates = asyncio.run(discover_google_news_rss("AAPL", "Apple", "stock-1"))
+    assert [c["fallback_summary"] for c in candidates] == ["Apple beats estimates", "Apple guides lower"]
@@ -0,0 +1,47 @@
+"""뉴스 URL 중복 제거"""
+import asyncio
+import pytest
+from app.services.news_dedup import SeenUrlFilter
+
+
+def existing_urls(*urls):
+    return lambda query: [{"url": url} for url in query.arg("in_")[1] if url in urls]
+
+
+def test_filter_new_skips_seen_and_existing(fake_db):
+    seen = SeenUrlFilter()
+    seen.mark_seen(["a"])
+    fake_db.respond = existing_urls("b")
+
+    assert asyncio.run(seen.filter_new(["a", "b", "c", "c", ""])) == ["c"]
+    assert "b" in seen
+    assert seen.pending == {"c"}
+
+
+def test_pending_urls_not_returned_twice(fake_db):
+    seen = SeenUrlFilter()
+    assert asyncio.run(seen.filter_new(["a"])) == ["a"]
+    # 다른 작업이 처리 중인 URL
+    assert asyncio.run(seen.filter_new(["a"])) == []
+
+    seen.release("a")
+    assert asyncio.run(seen.filter_new(["a"])) == ["a"]
+
+    seen.mark_seen(["a"])
+    assert not seen.pending
+    assert asyncio.run(seen.filter_new(["a"])) == []
+
+
+def test_filter_new_raises_on_db_error(fake_db):
+    seen = SeenUrlFilter()
+    fake_db.error = RuntimeError("db down")
+    with pytest.raises(RuntimeError):
+        asyncio.run(seen.filter_new(["a"]))
+    assert not seen.pending
+
+
+def test_cache_size_limit():
+    seen = SeenUrlFilter(max_size=2)
+    seen.mark_seen(["a", "b", "c"])
+    assert "a" not in seen
+    assert "b" in seen and "c" in seen
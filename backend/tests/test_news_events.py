@@ -0,0 +1,80 @@
+"""뉴스 이벤트 스트림 / 워커 분리 모드 릴레이"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from app.services.news_events import NewsRelay, matches_subscription, news_events
+
+
+class NewsTable:
+    """created_at 순으로 정렬해 gte / range를 흉내내는 news 테이블"""
+
+    def __init__(self):
+        self.rows = []
+
+    def insert(self, news_id: str, created_at: datetime):
+        self.rows.append({"id": news_id, "created_at": created_at.isoformat(), "stocks": {"ticker": "AAPL"}})
+
+    def __call__(self, query):
+        since = datetime.fromisoformat(query.arg("gte")[1])
+        start, end = query.arg("range")
+        rows = sorted(
+            (row for row in self.rows if datetime.fromisoformat(row["created_at"]) >= since),
+            key=lambda row: (row["created_at"], row["id"]),
+        )
+        return [dict(row, stocks=dict(row["stocks"])) for row in rows[start:end + 1]]
+
+
+def relay_ids(relay: NewsRelay) -> list:
+    queue = news_events.subscribe()
+    try:
+        asyncio.run(relay.poll())
+        ids = []
+        while not queue.empty():
+            ids.append(queue.get_nowait()["data"]["id"])
+        return ids
+    finally:
+        news_events.unsubscribe(queue)
+
+
+def test_relay_publishes_late_committed_rows_once(fake_db):
+    table = NewsTable()
+    fake_db.respond = table
+    relay = NewsRelay(batch_size=2)
+    start = relay.last_created_at
+
+    table.insert("b", start + timedelta(seconds=10))
+    assert relay_ids(relay) == ["b"]
+
+    # b보다 먼저 시작했지만 나중에 커밋된 row
+    table.insert("a", start + timedelta(seconds=5))
+    table.insert("c", start + timedelta(seconds=11))
+    assert relay_ids(relay) == ["a", "c"]
+    assert relay_ids(relay) == []
+
+
+def test_relay_pages_through_large_batches(fake_db):
+    table = NewsTable()
+    fake_db.respond = table
+    relay = NewsRelay(batch_size=2)
+    for i in range(5):
+        table.insert(f"n{i}", relay.last_created_at + timedelta(seconds=i + 1))
+
+    assert relay_ids(relay) == [f"n{i}" for i in range(5)]
+
+
+def test_relay_forgets_ids_outside_overlap(fake_db):
+    table = NewsTable()
+    fake_db.respond = table
+    relay = NewsRelay()
+    table.insert("old", relay.last_created_at + timedelta(seconds=1))
+    table.insert("new", relay.last_created_at + timedelta(minutes=5))
+
+    assert relay_ids(relay) == ["old", "new"]
+    assert set(relay.published) == {"new"}
+
+
+def test_matches_subscription():
+    event = {"ticker": "AAPL", "impact_score": 3}
+    assert matches_subscription(event, set(), None)
+    assert matches_subscription(event, {"AAPL"}, 5)
+    assert matches_subscription(event, {"MSFT"}, 3)
+    assert not matches_subscription(event, {"MSFT"}, 4)
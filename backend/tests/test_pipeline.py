@@ -0,0 +1,68 @@
+"""스트리밍 처리 파이프라인"""
+import asyncio
+from app.services.pipeline import Pipeline, PipelineJob, Stage
+
+
+def run_pipeline(stages, payloads):
+    async def run():
+        pipeline = Pipeline("test", stages)
+        pipeline.start()
+        job = PipelineJob("job")
+        try:
+            for payload in payloads:
+                await pipeline.submit(payload, job)
+            return sorted(await asyncio.wait_for(job.wait(), 5))
+        finally:
+            await pipeline.stop()
+
+    return asyncio.run(run())
+
+
+def test_stages_fan_out_and_drop():
+    async def split(n):
+        return [n, n + 100]
+
+    async def drop_odd(n):
+        return [] if n % 2 else [n * 10]
+
+    stages = [Stage("split", split), Stage("drop", drop_odd, concurrency=2)]
+    assert run_pipeline(stages, [1, 2]) == [20, 1020]
+    assert stages[1].metrics()["dropped"] == 2
+
+
+def test_batch_stage_receives_batches():
+    batches = []
+
+    async def double(items):
+        batches.append(list(items))
+        return [None if n == 3 else n * 2 for n in items]
+
+    stage = Stage("batch", double, batch_size=3, batch_timeout=0.5)
+    assert run_pipeline([stage], [1, 2, 3, 4]) == [2, 4, 8]
+    assert max(len(batch) for batch in batches) == 3
+    assert sum(len(batch) for batch in batches) == 4
+
+
+def test_on_error_called_for_each_payload_in_failed_batch():
+    failed = []
+
+    async def explode(items):
+        raise ValueError("boom")
+
+    stage = Stage("explode", explode, batch_size=2, batch_timeout=0.5, on_error=failed.append)
+    assert run_pipeline([stage], [1, 2]) == []
+    assert sorted(failed) == [1, 2]
+    assert stage.errors == 2
+
+
+def test_error_in_one_item_does_not_stop_others():
+    failed = []
+
+    async def handler(n):
+        if n == 2:
+            raise ValueError("boom")
+        return [n]
+
+    stage = Stage("single", handler, on_error=failed.append)
+    assert run_pipeline([stage], [1, 2, 3]) == [1, 3]
+    assert failed == [2]
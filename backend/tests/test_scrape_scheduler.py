@@ -0,0 +1,79 @@
+"""종목별 스크래핑 스케줄러"""
+import asyncio
+import time
+from app.services import scrape_scheduler as scheduler_module
+from app.services.scrape_scheduler import TickerScheduler, to_epoch, to_iso
+
+STOCKS = [{"id": "s1", "ticker": "AAPL"}, {"id": "s2", "ticker": "MSFT"}]
+
+
+def respond(saved_rows):
+    def handler(query):
+        if query.table == "stocks":
+            return STOCKS
+        if query.table == "user_stocks":
+            return [{"stock_id": "s1"}]
+        if query.table == "ticker_schedule" and query.arg("select"):
+            return saved_rows
+        return []
+    return handler
+
+
+def test_restart_resumes_saved_schedule(fake_db):
+    next_poll = time.time() + 1800
+    fake_db.respond = respond([{
+        "ticker": "AAPL",
+        "velocity": 2.5,
+        "last_polled_at": to_iso(time.time() - 600),
+        "next_poll_at": to_iso(next_poll),
+    }])
+    scheduler = TickerScheduler()
+
+    async def run():
+        await scheduler.load_state()
+        await scheduler.refresh_stocks()
+
+    asyncio.run(run())
+
+    aapl = scheduler.tickers["AAPL"]
+    assert aapl["velocity"] == 2.5
+    assert abs(aapl["next_poll_at"] - next_poll) < 0.01
+    assert aapl["watchers"] == 1
+    # 저장된 상태가 없는 종목은 바로 수집
+    assert scheduler.tickers["MSFT"]["next_poll_at"] <= time.time()
+    assert scheduler.queue[0][1] == "MSFT"
+
+
+def test_poll_state_saved_in_one_upsert(fake_db, monkeypatch):
+    async def fake_scrape(stock):
+        return {"ticker": stock["ticker"], "news_added": 3, "elapsed": 0.1}
+
+    monkeypatch.setattr(scheduler_module, "scrape_ticker_news", fake_scrape)
+    fake_db.respond = respond([])
+    scheduler = TickerScheduler()
+
+    async def run():
+        await scheduler.refresh_stocks()
+        await scheduler.poll("AAPL")
+        await scheduler.poll("MSFT")
+        await scheduler.stop()
+
+    asyncio.run(run())
+
+    upserts = [query for query in fake_db.queries if query.table == "ticker_schedule" and query.arg("upsert")]
+    assert len(upserts) == 1
+    rows = {row["ticker"]: row for row in upserts[0].arg("upsert")[0]}
+    assert set(rows) == {"AAPL", "MSFT"}
+    assert to_epoch(rows["AAPL"]["next_poll_at"]) > time.time()
+    assert not scheduler.dirty
+
+
+def test_failed_save_is_retried(fake_db):
+    fake_db.respond = respond([])
+    scheduler = TickerScheduler()
+    asyncio.run(scheduler.refresh_stocks())
+    scheduler.dirty = {"AAPL"}
+
+    fake_db.error = RuntimeError("db down")
+    asyncio.run(scheduler.save_state())
+    assert scheduler.dirty == {"AAPL"}
@@ -0,0 +1,63 @@
+"""SEC 공시 문서 스트리밍 파서"""
+from app.scrapers.sec_filing_parser import FilingStreamParser, parse_filing_file
+
+FILING = """
+<html><body>
+<ix:header><ix:hidden>Item 1A. Risk Factors hidden metadata</ix:hidden></ix:header>
+<p>Table of Contents</p>
+<p>Item 1A. Risk Factors</p>
+<p>Item 7. Management's Discussion and Analysis</p>
+<p>Item 1. Business</p>
+<p>We make widgets.</p>
+<p>Item 1A. Risk Factors</p>
+<p>Our supply chain depends on a single vendor.</p>
+<p>Demand may fall.<script>var x = 1;</script></p>
+<p>Item 1B. Unresolved Staff Comments</p>
+<p>None.</p>
+<p>Item 7. Management&#8217;s Discussion and Analysis of Financial Condition</p>
+<p>Revenue grew <ix:nonFraction name="us-gaap:Revenues" contextRef="FY26" unitRef="usd" scale="6" decimals="-6">1,234</ix:nonFraction> million.</p>
+<p>Net loss was <ix:nonFraction name="us-gaap:NetIncomeLoss" contextRef="FY26" unitRef="usd" sign="-">56</ix:nonFraction>.</p>
+<p>Item 8. Financial Statements</p>
+</body></html>
+"""
+
+
+def parse(html: str, chunk: int = 37, **kwargs) -> FilingStreamParser:
+    parser = FilingStreamParser(**kwargs)
+    for i in range(0, len(html), chunk):
+        parser.feed(html[i:i + chunk])
+    parser.close()
+    return parser
+
+
+def test_sections_use_body_not_table_of_contents():
+    sections = parse(FILING).sections
+    assert sections["risk_factors"].splitlines() == [
+        "Item 1A. Risk Factors",
+        "Our supply chain depends on a single vendor.",
+        "Demand may fall.",
+    ]
+    assert "Revenue grew 1,234 million." in sections["mda"]
+    assert "Financial Statements" not in sections["mda"]
+    assert "widgets" not in "".join(sections.values())
+
+
+def test_xbrl_facts():
+    facts = {fact["name"]: fact for fact in parse(FILING).facts}
+    assert facts["us-gaap:Revenues"]["value"] == 1234 * 10 ** 6
+    assert facts["us-gaap:Revenues"]["context"] == "FY26"
+    assert facts["us-gaap:NetIncomeLoss"]["value"] == -56
+
+
+def test_limits():
+    parser = parse(FILING, max_section_chars=30, max_facts=1)
+    assert len(parser.sections["risk_factors"]) <= 30
+    assert len(parser.facts) == 1
+
+
+def test_parse_filing_file(tmp_path):
+    path = tmp_path / "filing.htm"
+    path.write_text(FILING)
+    result = parse_filing_file(str(path))
+    assert set(result["sections"]) == {"risk_factors", "mda"}
+    assert len(result["facts"]) == 2
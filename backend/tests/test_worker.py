@@ -0,0 +1,30 @@
+"""워커 시작 순서"""
+import asyncio
+from app import worker
+
+
+def test_caches_loaded_before_scrape_tasks_start(monkeypatch):
+    events = []
+
+    async def warm():
+        await asyncio.sleep(0.01)
+        events.append("warm")
+
+    async def job():
+        events.append("scrape")
+
+    monkeypatch.setattr(worker, "warm_dedup_caches", warm)
+    monkeypatch.setattr(worker, "scrape_hot_market_news", job)
+    monkeypatch.setattr(worker.ticker_scheduler, "run", job)
+    monkeypatch.setattr(worker.edgar_watcher, "run", job)
+    monkeypatch.setattr(worker.analysis_precomputer, "run", job)
+    monkeypatch.setattr(worker.scheduler, "start", lambda: None)
+
+    async def run():
+        await worker.start_worker()
+        await asyncio.gather(*worker._tasks)
+        worker._tasks.clear()
+
+    asyncio.run(run())
+    assert events[0] == "warm"
+    assert events.count("scrape") >= 2
@@ -19,19 +19,56 @@ export default function Dashboard() {
   useEffect(() => {
     loadNews()
 
-    // Auto-refresh news every 30 seconds (silently in background)
-    const newsInterval = setInterval(() => {
-      loadNews(true) // silent refresh
-    }, 30000)
+    // 새 뉴스는 WebSocket으로 실시간 수신 (폴링 대신)
+    let newsWs: WebSocket | null = null
+    let newsReconnectTimeout: NodeJS.Timeout | null = null
+
+    const connectNewsWebSocket = () => {
+      try {
+        const wsUrl = process.env.NEXT_PUBLIC_WS_URL || 'ws://localhost:8000'
+        newsWs = new WebSocket(`${wsUrl}/ws/news`)
+
+        newsWs.onmessage = (event) => {
+          try {
+            const message = JSON.parse(event.data)
+
+            if (message.type === 'news' && message.data) {
+              const item = message.ticker
+                ? { ...message.data, stocks: { ticker: message.ticker } }
+                : message.data
+              setNews((prev) => [item, ...prev.filter((n) => n.id !== item.id)].slice(0, 20))
+              console.log('📰 Breaking news received via WebSocket')
+            }
+          } catch (error) {
+            console.error('Error parsing news WebSocket message:', error)
+          }
+        }
+
+        newsWs.onclose = () => {
+          // 5초 후 재연결 시도 (끊겨 있던 동안의 뉴스는 목록을 다시 불러와 보충)
+          newsReconnectTimeout = setTimeout(() => {
+            loadNews(true)
+            connectNewsWebSocket()
+          }, 5000)
+        }
+      } catch (error) {
+        console.error('Failed to create news WebSocket:', error)
+      }
+    }
+
+    connectNewsWebSocket()
 
     // WebSocket 연결 설정 (실시간 시장 데이터)
     let ws: WebSocket | null = null
     let reconnectTimeout: NodeJS.Timeout | null = null
+    // 마지막으로 받은 메시지 시퀀스 번호 (재연결 시 놓친 메시지만 받기 위함)
+    let lastSeq: number | null = null
 
     const connectWebSocket = () => {
       try {
         const wsUrl = process.env.NEXT_PUBLIC_WS_URL || 'ws://localhost:8000'
-        ws = new WebSocket(`${wsUrl}/ws/market`)
+        const resumeQuery = lastSeq !== null ? `?last_seq=${lastSeq}` : ''
+        ws = new WebSocket(`${wsUrl}/ws/market${resumeQuery}`)
 
         ws.onopen = () => {
           console.log('✅ WebSocket connected - Real-time market data active')
@@ -42,6 +79,10 @@ export default function Dashboard() {
           try {
             const message = JSON.parse(event.data)
 
+            if (typeof message.seq === 'number') {
+              lastSeq = message.seq
+            }
+
             if (message.type === 'initial' || message.type === 'update') {
               setMarketStats(message.data.overview || [])
               setTrendingStocks(message.data.trending || [])
@@ -77,7 +118,14 @@ export default function Dashboard() {
     connectWebSocket()
 
     return () => {
-      clearInterval(newsInterval)
+      // 뉴스 WebSocket 정리
+      if (newsWs) {
+        newsWs.onclose = null
+        newsWs.close()
+      }
+      if (newsReconnectTimeout) {
+        clearTimeout(newsReconnectTimeout)
+      }
 
       // WebSocket 정리
       if (ws) {